@@ -2,7 +2,7 @@
 import sys
 import utility
 utility.fix_paths()
-from pokeher.wiring import IOPokerBot
+from pokeher.wiring import IOPokerBot, GameEvents
 from pokeher.theaigame import TheAiGameParserDelegate, TheAiGameActionDelegate
 
 
@@ -10,7 +10,7 @@ class CheckBrain(object):
     def __init__(self, bot):
         self.bot = bot
         self.bot.no_logging = True
-        self.parser = self.bot.set_up_parser({}, self.do_turn)
+        self.parser = self.bot.set_up_parser(GameEvents(), self.do_turn)
 
     def parse_line(self, line):
         self.parser.handle_line(line)
@@ -1,4 +1,5 @@
 import sys
+import time
 import types
 import subprocess as sp
 from threading  import Thread
@@ -8,6 +9,7 @@ try:
 except ImportError:
     from queue import Queue, Empty  # python 3.x
 
+from pokeher.clock import monotonic
 from pokeher.timer import Timer
 
 ON_POSIX = 'posix' in sys.builtin_module_names
@@ -19,6 +21,9 @@ def enqueue_output(out, queue):
 
 
 class BotProcess(object):
+    # how long a bot gets to clean up after its input closes
+    SHUTDOWN_SECS = 2
+
     def __init__(self, source_file, print_bot_output=True):
         self.exploded = False
         self.process = self.process_out = None
@@ -56,7 +61,18 @@ class BotProcess(object):
         return t.secs, line
 
     def shutdown(self):
-        if self.process:
+        """Closes the bot's input so it can shut down its workers & exit,
+        kills it if it's still going after SHUTDOWN_SECS"""
+        if not self.process:
+            return
+        try:
+            self.process.stdin.close()
+        except IOError:
+            pass
+        end = monotonic() + self.SHUTDOWN_SECS
+        while self.process.poll() is None and monotonic() < end:
+            time.sleep(0.01)
+        if self.process.poll() is None:
             self.process.kill()
 
 
@@ -1,4 +1,3 @@
-import time
 from twisted.python import log as twisted_log
 from twisted.internet import defer, reactor
 from twisted.internet.error import AlreadyCalled
@@ -11,6 +10,7 @@ from arena import PyArena
 from betting import NoBetLimit
 from bots import NetLoadedBot
 from timing import FiveSecondTurns
+from pokeher.clock import monotonic
 
 
 class NetworkArena(PyArena):
@@ -60,7 +60,7 @@ class NetworkArena(PyArena):
         self.notify_bots_turn(bot_name)
         self.waiting_on = bot_name
         self.action_deferred = deferred
-        self.started_waiting = time.clock()
+        self.started_waiting = monotonic()
         self.on_bot_timeout = reactor.callLater(
             self.get_time_for_move(bot_name), self.bot_timed_out, bot_name)
 
@@ -106,7 +106,7 @@ class NetworkArena(PyArena):
             pass
         self.waiting_on = None
         if self.action_deferred:
-            #  delay = time.clock() - self.started_waiting
+            #  delay = monotonic() - self.started_waiting
             #  TODO: hook time taken back in to bot state
             self.action_deferred.callback(self.get_parsed_action(line))
 
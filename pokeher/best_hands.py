@@ -0,0 +1,73 @@
+from __future__ import print_function
+
+import numpy as np
+
+import cards
+import handscore
+from data_table import DataTable, StreamedSection
+
+
+def distinct_strengths():
+    """Every strength a 5-card hand can have (all 7462), weakest first"""
+    strengths = np.empty(cards.deck_combinations(5), dtype=np.int32)
+    handscore.combo_strengths(0, 5, strengths)
+    return np.unique(strengths)
+
+
+def rank_chunk(start, count, num_cards, strengths):
+    """Ranks of count num_cards card combinations from colex number start, as
+    indexes into distinct_strengths()"""
+    chunk = np.empty(count, dtype=np.int32)
+    handscore.combo_strengths(start, num_cards, chunk)
+    return np.searchsorted(strengths, chunk).astype('<u2')
+
+
+class BestHandTable(object):
+    """Strength of the best hand in every 5, 6 or 7 card combination, looked
+    up by the combination's colex number (see cards.colex_index). Built by
+    standalone/calculate_best_hands.py, mapped on first use
+
+    Table sections:
+      strengths: int32 distinct hand strengths, weakest first
+      ranks: uint16 [colex number], indexes into strengths
+    """
+    KIND = b'besthand'
+    VERSION = 1
+
+    def __init__(self, num_cards=7, data_file=None, log_func=None):
+        self.num_cards = num_cards
+        self.table = DataTable(data_file or self.data_file(num_cards),
+                               self.KIND, self.VERSION, log_func)
+
+    @staticmethod
+    def data_file(num_cards):
+        return 'best_hands_{n}.table'.format(n=num_cards)
+
+    def loaded(self):
+        if not self.table.load():
+            return False
+        ranks = self.table.get('ranks')
+        return ranks is not None \
+            and len(ranks) == cards.deck_combinations(self.num_cards)
+
+    def rank(self, number):
+        """Rank of the combination with a colex number, bigger is better"""
+        return int(self.table.get('ranks')[number])
+
+    def strength(self, number):
+        """Strength of the combination with a colex number, the same as
+        handscore.hand_strength gives for its cards"""
+        return int(self.table.get('strengths')[self.rank(number)])
+
+    def hand_strength(self, card_list):
+        return self.strength(cards.colex_index(cards.to_indexes(card_list)))
+
+    @classmethod
+    def write(cls, out_stream, num_cards, strengths, rank_chunks):
+        """Writes a table file. rank_chunks are arrays of ranks that add up
+        to every combination, in colex order"""
+        total = cards.deck_combinations(num_cards)
+        DataTable.write(out_stream, cls.KIND, cls.VERSION, [
+            ('strengths', np.asarray(strengths, dtype='<i4')),
+            ('ranks', StreamedSection('<u2', (total,), rank_chunks)),
+        ])
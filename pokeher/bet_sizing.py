@@ -66,8 +66,8 @@ class BetSizeCalculator(object):
     def to_call(self, silent=True):
         to_call = self.data.to_call
         if not silent:
-            self.bot.log("bot={}, pot={}, to call={}" \
-                         .format(self.data.me, self.data.pot, to_call))
+            self.bot.debug("bot={}, pot={}, to call={}", self.data.me,
+                           self.data.pot, to_call)
         return to_call
 
     def pot_odds(self):
@@ -90,8 +90,8 @@ class BetSizeCalculator(object):
             bet_raise = random.uniform(3, 5) * bb
         else:
             bet_raise = random.uniform(0.8, 1.5) * pot
-        self.bot.log(" big raise of {r} (pot={p}) from {s}"
-                     .format(r=bet_raise, p=pot, s=source))
+        self.bot.debug(" big raise of {r} (pot={p}) from {s}", r=bet_raise,
+                       p=pot, s=source)
         return self.finalize_bet(bet_raise)
 
     def minimum_bet(self, source=None):
@@ -105,14 +105,13 @@ class BetSizeCalculator(object):
         else:
             pot = self.data.pot
             bet = random.uniform(0.16, 0.4) * pot
-        self.bot.log(" small raise of {b} from {s}"
-                     .format(b=bet, s=source))
+        self.bot.debug(" small raise of {b} from {s}", b=bet, s=source)
         return self.finalize_bet(bet)
 
     def finalize_bet(self, val):
         stack = self.our_stack()
         remaining = stack - val
         if remaining > 0 and mu.percentage(remaining, stack) < 25:
-            self.bot.log(" increased bet by {} to all-in".format(remaining))
+            self.bot.debug(" increased bet by {} to all-in", remaining)
             val = stack
         return int(round(val))
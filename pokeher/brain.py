@@ -1,68 +1,120 @@
 from __future__ import division
 
-import time
+import atexit
+import multiprocessing
+import weakref
 
+import cards
 import cython_random as random
 import preflop_equity
+import equity_cache
+import logger
 from utility import MathUtils
 from game import GameData
-from hand_simulator import HandSimulator
 from bet_sizing import BetSizeCalculator
-from fear import Fear
+from fear import Fear, OpponentHandRangeFear
+from equity_estimator import EquityEstimator
+from ponder import Ponderer, Situation
+from simulator_pool import SimulatorPool
+from time_bank import TimeBank
 from timer import Timer
 
+# so worker processes don't outlive us when a brain isn't closed
+_open_brains = weakref.WeakSet()
 
-class Brain(BetSizeCalculator, Fear):
+
+@atexit.register
+def _close_brains():
+    for brain in list(_open_brains):
+        brain.close()
+
+
+class Brain(BetSizeCalculator, Fear, TimeBank):
     """The brain: parses lines, combines data classes to make decisions"""
+    SIM_PROCESSES = multiprocessing.cpu_count()
+    # simulate likely situations in the background between decisions
+    PONDER = True
+    # pick_action's equity cutoffs, and its return ratio cutoffs vs pot odds
+    EQUITY_CUTOFFS = [40, 55, 65, 70, 90]
+    RETURN_RATIOS = [1, 1.25]
+    # simulated equity this close to a cutoff is a close call
+    CLOSE_CALL_EQUITY = 5
+    # simulation chunks start small so obvious spots stop early, then grow
+    FIRST_STEP = 250
+    MAX_STEP = 1000
+
     def __init__(self, bot):
         with Timer() as t:
             self.bot = bot
             self.load_realtime_data()
             self.load_precalc_data()
-            self.iterations = 2000
-        self.bot.log("Brain started up in {t} secs".format(t=t.secs))
+            self.start_simulator_pool()
+            self.ponderer = Ponderer(self.preflop_equity)
+            self.planned = []
+            # trials for a decision worth a whole move, see TimeBank
+            self.iterations = 20000
+        _open_brains.add(self)
+        self.bot.log("Brain started up in {t} secs", t=t.secs)
 
     def load_realtime_data(self):
-        sharedData = {}
-        self.parser = self.bot.set_up_parser(sharedData, self.do_turn)
-        self.data = GameData(sharedData)
-        self.data.reset()
+        self.data = GameData()
+        self.parser = self.bot.set_up_parser(self.data, self.do_turn)
 
     def load_precalc_data(self):
         """Loads pre-computed hand data"""
         preflop = preflop_equity.PreflopEquity(log_func=self.bot.log)
         self.preflop_equity = preflop.data
+        self.preflop_matchups = preflop_equity.PreflopMatchups(
+            log_func=self.bot.log)
+        self.flop_equity = equity_cache.FlopEquityCache(log_func=self.bot.log)
+
+    def start_simulator_pool(self):
+        """Starts the simulation worker processes when we have cores to spare"""
+        self.sim_pool = None
+        if self.SIM_PROCESSES <= 1:
+            return
+        try:
+            self.sim_pool = SimulatorPool(self.preflop_equity,
+                                          self.SIM_PROCESSES)
+        except OSError as e:
+            self.bot.warning("Couldn't start simulator pool (e={e})", e=e)
+
+    def close(self):
+        """Shuts down the simulator workers & the ponderer, once the match
+        is over"""
+        if self.sim_pool:
+            self.sim_pool.close()
+            self.sim_pool = None
+        self.ponderer.stop()
+        _open_brains.discard(self)
 
     def parse_line(self, line):
         """Feeds a line to the parsers"""
         success = self.parser.handle_line(line)
         if success:
-            self.data.update()
+            self.ponder()
         else:
-            self.bot.log("didn't handle line: '{}'".format(line))
+            self.bot.warning("didn't handle line: '{}'", line)
 
     def do_turn(self, bot, total_time_left_ms):
         """Wraps internal __do_turn so we can time how long each turn takes"""
-        time_left = min(total_time_left_ms, self.data.time_per_move)
         if not bot or bot != self.data.me:
             return
-        with Timer() as t:
-            self.__do_turn(time_left)
-        if not self.data.table_cards:
-            turn_type = "preflop"
-        else:
-            turn_type = "{} sims".format(self.iterations)
-        left = (time_left / 1000) - t.secs
-        self.bot.log("Finished turn in {t}s ({s}), had {l}s remaining"
-                     .format(t=t.secs, s=turn_type, l=left))
+        budget = self.allocate_time(total_time_left_ms)
+        with Timer() as t, self.ponderer.paused():
+            source = self.__do_turn(budget)
+        left = (total_time_left_ms / 1000) - t.secs
+        self.bot.log("Finished turn in {t}s ({s}), budget {b:.0f}ms (up to "
+                     "{c:.0f}ms), {l}s left in the bank", t=t.secs, s=source,
+                     b=budget.ms, c=budget.close_call_ms, l=left)
 
-    def __do_turn(self, time_left_ms):
+    def __do_turn(self, budget):
         """Callback for when the brain has to make a decision"""
         if not self.data.hand:
-            self.bot.log("No hand, killing ourselves. Data={d}"
-                         .format(d=self.data))
+            self.bot.warning("No hand, killing ourselves. Data={d}",
+                             d=self.data)
             self.bot.fold()
-            return
+            return "no hand"
 
         hand = self.data.hand
         stack = self.our_stack()
@@ -72,44 +124,176 @@ class Brain(BetSizeCalculator, Fear):
         self.update_fear(to_call)
         preflop_fear = self.data.preflop_fear
         hand_fear = self.data.hand_fear
+        num_opponents = max(len(self.data.live_opponents()), 1)
+        context = self.data.hand_context()
 
-        # preflop, no big raises. safe to use our precalculated win %
-        if not self.data.table_cards and preflop_fear == -1:
+        # heads up preflop, no big raises. safe to use our precalculated win %
+        if not self.data.table_cards and preflop_fear == -1 \
+          and num_opponents == 1:
             equity = self.preflop_equity[hand.simple()]
             source = "preflop"
+        # heads up preflop after a raise, play the range that's left
+        elif not self.data.table_cards and num_opponents == 1 \
+          and self.preflop_matchups.loaded():
+            weights = self.preflop_matchups.filter_weights(self.preflop_equity,
+                                                           preflop_fear)
+            equity = self.preflop_matchups.range_equity(hand, weights)
+            source = "matchups"
         else:
-            simulator = HandSimulator(hand, self.data.table_cards,
-                                      self.preflop_equity)
-            best_hand, score = simulator.best_hand()
-            equity = self.__run_simulator(simulator, time_left_ms,
-                                          preflop_fear, hand_fear)
-            source = "sim"
-
-        self.bot.log(" hand: {h}, table: {t}"
-                     .format(h=hand, t=[str(t) for t in self.data.table_cards]))
-        if self.data.table_cards:
-            self.bot.log(" best 5: {b} score: {s}"
-                         .format(b=[str(c) for c in best_hand], s=str(score)))
-        self.bot.log(" win: {e:.2f}% ({s}), pot odds: {p:.2f}%, stack={m}"
-                     .format(e=equity, s=source, p=pot_odds, m=stack))
-        self.bot.log(" pre-fear={pf}, hand-fear=({hf})"
-                     .format(pf=preflop_fear, hf=hand_fear))
+            simulator = context.simulator(self.preflop_equity)
+            best_hand, score = context.best_hand()
+            equity = None
+            # the exact counts & the flop cache are heads up only. few enough
+            # runouts left on the turn & river to count them all
+            if num_opponents == 1 and len(self.data.table_cards) >= 4:
+                equity = simulator.exact_equity(preflop_fear, hand_fear)
+                source = "exact"
+            elif num_opponents == 1:
+                equity = self.__cached_equity(context, preflop_fear,
+                                              hand_fear)
+                source = "cache"
+            if equity is None:
+                thresholds = self.equity_thresholds(to_call, pot_odds)
+                equity = self.__run_simulator(simulator, budget,
+                                              preflop_fear, hand_fear,
+                                              thresholds, num_opponents)
+                source = "sim"
+
+        if self.bot.logger.enabled(logger.DEBUG):
+            self.bot.debug(" hand: {h}, table: {t}", h=hand,
+                           t=[str(t) for t in self.data.table_cards])
+            if self.data.table_cards:
+                self.bot.debug(" best 5: {b} score: {s}",
+                               b=[str(c) for c in best_hand], s=score)
+        self.bot.log(" win: {e:.2f}% ({s}, {n} opponents), pot odds: {p:.2f}%,"
+                     " stack={m}", e=equity, s=source, n=num_opponents,
+                     p=pot_odds, m=stack)
+        self.bot.debug(" pre-fear={pf}, hand-fear=({hf})", pf=preflop_fear,
+                       hf=hand_fear)
 
         self.pick_action(equity, to_call, pot_odds)
+        return source
+
+    def ponder(self):
+        """Has the ponderer start on whatever the next decision will likely
+        need, whenever that changes"""
+        if not self.PONDER:
+            return
+        if not self.data.hand:
+            # between hands there's nothing worth simulating
+            self.ponderer.stop()
+            self.planned = []
+            return
+        situations = self.likely_situations()
+        keys = [situation.key for situation in situations]
+        if keys != self.planned:
+            self.planned = keys
+            self.ponderer.plan(situations)
 
-    def __run_simulator(self, simulator, time_left_ms, hand_filter, hand_fear):
-        results = []
-        step_size = 100
-        start_time = time.clock() * 1000
-        end_time = start_time + time_left_ms - 50
-        for i in range(0, self.iterations, step_size):
-            now = time.clock() * 1000
-            if now >= end_time:
-                self.bot.log(" stopping simulation after {} runs".format(i))
+    def likely_situations(self):
+        """What the next decision might simulate: this table under each fear
+        the opponent's bet could leave us with, then when there's more than
+        one opponent (so nothing's precomputed) every next card"""
+        data = self.data
+        num_opponents = max(len(data.live_opponents()), 1)
+        situations = [Situation(data.hand, data.table_cards, hand_filter,
+                                hand_fear, num_opponents, self.iterations)
+                      for hand_filter, hand_fear in self.likely_fears()
+                      if self.__needs_simulation(num_opponents, hand_filter,
+                                                 hand_fear)]
+        if num_opponents > 1 and 3 <= len(data.table_cards) < 5:
+            deck = cards.mask_to_cards(data.hand_context().deck_mask())
+            situations += [Situation(data.hand, data.table_cards + [card],
+                                     data.preflop_fear, data.hand_fear,
+                                     num_opponents, self.iterations // 10)
+                           for card in deck]
+        return situations
+
+    def __needs_simulation(self, num_opponents, hand_filter, hand_fear):
+        """Whether __do_turn would end up simulating"""
+        table_size = len(self.data.table_cards)
+        if num_opponents > 1:
+            return True
+        if not table_size:
+            return hand_filter != -1 and not self.preflop_matchups.loaded()
+        if table_size >= 4:
+            return False
+        return self.__cached_equity(self.data.hand_context(), hand_filter,
+                                    hand_fear) is None
+
+    def __cached_equity(self, context, hand_filter, hand_fear):
+        """Looks the flop up in the precomputed equity cache, None on a miss"""
+        table_cards = self.data.table_cards
+        tier = OpponentHandRangeFear.find_tier(table_cards, hand_fear,
+                                               context.table_score())
+        return self.flop_equity.lookup(self.data.hand, table_cards,
+                                       hand_filter, tier)
+
+    def equity_thresholds(self, to_call, pot_odds):
+        """The equities where pick_action changes its mind"""
+        thresholds = list(self.EQUITY_CUTOFFS)
+        if to_call:
+            thresholds += [pot_odds * ratio for ratio in self.RETURN_RATIOS]
+        return thresholds
+
+    def __run_simulator(self, simulator, budget, hand_filter, hand_fear,
+                        thresholds=(), num_opponents=1):
+        """Simulates in chunks until the answer is clear of every
+        threshold, or the decision has had its share of time & iterations.
+        Close calls get to keep going into the time bank"""
+        estimator = EquityEstimator(thresholds)
+        for equity, tries in self.ponderer.take(self.data.hand,
+                                                self.data.table_cards,
+                                                hand_filter, hand_fear,
+                                                num_opponents):
+            estimator.add(equity, tries)
+        if estimator.trials:
+            self.bot.debug(" pondered {} runs ahead of time",
+                           estimator.trials)
+        step_size = self.FIRST_STEP
+        deadline = budget.deadline
+        target = self.iterations * budget.weight
+        while True:
+            if estimator.trials >= target or deadline.passed():
+                if deadline is budget.close_call_deadline or \
+                  (estimator.trials and
+                   estimator.distance() > self.CLOSE_CALL_EQUITY):
+                    self.bot.debug(" stopping simulation after {} runs",
+                                   estimator.trials)
+                    break
+                self.bot.debug(" close call after {n} runs, going on for up "
+                               "to {ms:.0f}ms", n=estimator.trials,
+                               ms=budget.close_call_deadline.ms_left())
+                deadline = budget.close_call_deadline
+                target *= self.CLOSE_CALL_FACTOR
+                continue
+            chunks = self.__simulate_chunks(simulator, step_size, deadline,
+                                            hand_filter, hand_fear,
+                                            num_opponents)
+            for equity, tries in chunks:
+                estimator.add(equity, tries)
+            step_size = min(step_size * 2, self.MAX_STEP)
+            if estimator.is_decided():
+                low, high = estimator.interval()
+                self.bot.debug(" equity in [{l:.2f}, {h:.2f}] after {n} runs",
+                               l=low, h=high, n=estimator.trials)
                 break
-            equity = simulator.simulate(step_size, hand_filter, hand_fear)
-            results.append(equity)
-        return sum(results) / len(results)
+        return estimator.mean
+
+    def __simulate_chunks(self, simulator, step_size, deadline, hand_filter,
+                          hand_fear, num_opponents=1):
+        """Runs a chunk of simulations on each worker, or one chunk here"""
+        if self.sim_pool:
+            chunks = self.sim_pool.simulate_chunks(
+                self.data.hand, self.data.table_cards,
+                step_size * self.sim_pool.processes, hand_filter, hand_fear,
+                deadline, step_size, num_opponents)
+            if chunks:
+                return chunks
+            self.bot.warning(" simulator pool timed out, simulating here")
+        equity = simulator.simulate(step_size, hand_filter, hand_fear,
+                                    num_opponents, deadline=deadline)
+        return [(equity, simulator.last_tries)]
 
     def pick_action(self, equity, to_call, pot_odds):
         """Look at our expected return and do something.
@@ -129,7 +313,7 @@ class Brain(BetSizeCalculator, Fear):
         # use pot odds to call/bet/fold
         else:
             return_ratio = equity / pot_odds
-            self.bot.log(" return ratio={:.3f}".format(return_ratio))
+            self.bot.debug(" return ratio={:.3f}", return_ratio)
             if equity > 70 or (equity > 40 and self.r_test(0.03, 'po1')):
                 self.make_bet(self.big_raise("R3"))
             elif to_call < self.data.big_blind and \
@@ -137,12 +321,12 @@ class Brain(BetSizeCalculator, Fear):
                 # small preflop raise from SB, get more money into the pot
                 self.make_bet(self.minimum_bet("R4"))
             elif return_ratio > 1.25:
-                self.bot.log(" return ratio > 1.25, calling {}".format(to_call))
+                self.bot.debug(" return ratio > 1.25, calling {}", to_call)
                 self.bot.call(to_call)
             elif return_ratio > 1 \
               and MathUtils.percentage(to_call, self.our_stack()) < 10:
-                self.bot.log(" return ratio > 1 and bet is small, calling {}"
-                             .format(to_call))
+                self.bot.debug(" return ratio > 1 and bet is small, calling {}",
+                               to_call)
                 self.bot.call(to_call)
             else:
                 self.bot.fold()
@@ -157,6 +341,6 @@ class Brain(BetSizeCalculator, Fear):
         s.t. r_test(0.5) is true ~50% of the time"""
         passed = random.uniform(0, 1) < fraction
         if passed:
-            self.bot.log(" r_test({f}%) passed from {b}"
-                         .format(f=100*fraction, b=block))
+            self.bot.debug(" r_test({f}%) passed from {b}", f=100*fraction,
+                           b=block)
         return passed
@@ -1,5 +1,12 @@
+from libc.stdint cimport uint64_t
+
+cdef enum:
+    DECK_SIZE = 52
+    SUIT_SIZE = 13
+
 cdef class Card:
     cdef readonly int value, suit
+    cpdef int index(self)
 
 cdef class Hand:
     cdef readonly Card high, low
@@ -8,3 +15,18 @@ cdef class Hand:
     cpdef bint is_suited(self)
     cpdef int card_gap(self)
     cpdef bint is_connected(self)
+
+cdef inline int card_index(Card card):
+    """Cards as ints: 13 per suit, in full_deck order"""
+    return card.suit * SUIT_SIZE + card.value - 2
+
+cdef inline uint64_t index_mask(int index) nogil:
+    return (<uint64_t>1) << index
+
+cpdef Card from_index(int index)
+cpdef uint64_t cards_to_mask(card_list)
+cpdef long long binomial(int n, int k) except -1
+cpdef long long deck_combinations(int k) except -1
+cpdef long long colex_index(indexes) except -1
+cdef void colex_unrank(long long number, int k, int* combo) nogil
+cdef bint colex_next(int* combo, int k) nogil
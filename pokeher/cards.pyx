@@ -1,3 +1,6 @@
+from cpython cimport array as c_array
+from array import array
+import itertools
 cimport cython_util as util
 
 cdef class Card:
@@ -30,6 +33,10 @@ cdef class Card:
         return '{value}{suit}'.format(value=self.AIG_FACES[self.value],
                                        suit=self.AIG_SUITS[self.suit])
 
+    cpdef int index(self):
+        """Returns the card as an int in [0, 52), see card_index"""
+        return card_index(self)
+
     def __richcmp__(Card self, Card other not None, int op):
         """Cython equivalent of functools.totalordering
         Implements compare for Cards. Check value, then suit"""
@@ -71,6 +78,190 @@ def full_deck():
             deck.append(Card(c, suit))
     return deck
 
+"""Functions for the integer card encoding used in the simulation hot path.
+A card is suit * 13 + (value - 2), so full_deck()[i].index() == i and a set of
+cards fits in the low 52 bits of a 64-bit mask.
+"""
+
+FULL_DECK_MASK = index_mask(DECK_SIZE) - 1
+
+cpdef Card from_index(int index):
+    """Returns the Card for an int made by Card.index()"""
+    return Card(index % SUIT_SIZE + 2, index // SUIT_SIZE)
+
+cpdef uint64_t cards_to_mask(card_list):
+    """Packs a list of cards into a 52 bit mask"""
+    cdef Card card
+    cdef uint64_t mask = 0
+    for card in card_list:
+        mask |= index_mask(card_index(card))
+    return mask
+
+def mask_to_cards(uint64_t mask):
+    """Returns the cards in a mask, in full_deck order"""
+    cdef int i
+    return [from_index(i) for i in range(DECK_SIZE) if mask & index_mask(i)]
+
+def to_indexes(card_list):
+    """Converts a list of cards into an int array"""
+    cdef Card card
+    return array('i', [card_index(card) for card in card_list])
+
+def from_indexes(indexes):
+    """Converts a sequence of card ints back into Cards"""
+    cdef int i
+    return [from_index(i) for i in indexes]
+
+AIGAMES_INDEXES = dict((from_index(i).aigames_str(), i) for i in range(DECK_SIZE))
+
+def aigames_to_indexes(tokens):
+    """Converts 2-char theaigames cards like 'Ah' to card ints, None if any
+    token isn't a card"""
+    indexes = array('i')
+    for token in tokens:
+        index = AIGAMES_INDEXES.get(token)
+        if index is None:
+            return None
+        indexes.append(index)
+    return indexes
+
+def indexes_to_aigames(indexes):
+    """Converts card ints to a theaigames list like [Ah,9d]"""
+    return to_aigames_list(from_indexes(indexes))
+
+"""Suit isomorphism: (hand, table) situations that only differ by a relabeling
+of suits have the same equity, so they can share a canonical representative.
+hand_indexer.HandIndexer numbers the classes densely, for tables indexed by them.
+"""
+
+cdef enum:
+    NUM_SUITS = 4
+    SUIT_PERMUTATIONS = 24 # 4!
+    MAX_SITUATION = 7 # 2 hole cards and 5 table cards
+
+cdef int PERMUTATIONS[SUIT_PERMUTATIONS][NUM_SUITS]
+for p, perm in enumerate(itertools.permutations(range(NUM_SUITS))):
+    for s in range(NUM_SUITS):
+        PERMUTATIONS[p][s] = perm[s]
+
+cdef inline int __permute(int index, int* perm):
+    return perm[index // SUIT_SIZE] * SUIT_SIZE + index % SUIT_SIZE
+
+cdef void __sorted_insert(int* cards, int length, int card):
+    """Inserts card into the first length (sorted) slots of cards"""
+    cdef int i = length
+    while i > 0 and cards[i - 1] > card:
+        cards[i] = cards[i - 1]
+        i -= 1
+    cards[i] = card
+
+def canonical_indexes(hand, table_cards=()):
+    """Returns the suit-isomorphic canonical form of hand & table_cards as two
+    tuples of sorted card ints. Every suit relabeling of a situation maps to
+    the same answer, the smallest over all 24 suit permutations"""
+    cdef int p, i, num_hand, num_table
+    cdef int original[MAX_SITUATION]
+    cdef int candidate[MAX_SITUATION]
+    cdef int best[MAX_SITUATION]
+    cdef bint better
+    cdef Card card
+
+    num_hand = len(hand)
+    num_table = len(table_cards)
+    for i, card in enumerate(itertools.chain(hand, table_cards)):
+        original[i] = card_index(card)
+
+    for p in range(SUIT_PERMUTATIONS):
+        for i in range(num_hand):
+            __sorted_insert(candidate, i, __permute(original[i],
+                                                    PERMUTATIONS[p]))
+        for i in range(num_table):
+            __sorted_insert(candidate + num_hand, i,
+                            __permute(original[num_hand + i], PERMUTATIONS[p]))
+
+        better = p == 0
+        for i in range(num_hand + num_table):
+            if candidate[i] != best[i]:
+                better = better or candidate[i] < best[i]
+                break
+        if better:
+            for i in range(num_hand + num_table):
+                best[i] = candidate[i]
+
+    return (tuple(best[i] for i in range(num_hand)),
+            tuple(best[i] for i in range(num_hand, num_hand + num_table)))
+
+def canonical_key(hand, table_cards=()):
+    """Packs the canonical form of a situation into an int, 6 bits per card"""
+    canon_hand, canon_table = canonical_indexes(hand, table_cards)
+    key = 0
+    for index in canon_hand + canon_table:
+        key = (key << 6) | index
+    return key
+
+"""Colex numbering: the k-card combination c1 < c2 < ... < ck of card ints is
+number C(c1, 1) + C(c2, 2) + ... + C(ck, k), which packs all C(52, k) of them
+densely into 0 .. C(52, k) - 1. Counting up walks them in colex order.
+"""
+
+cdef long long BINOMIAL[DECK_SIZE + 1][MAX_SITUATION + 1]
+for n in range(DECK_SIZE + 1):
+    BINOMIAL[n][0] = 1
+    for k in range(1, MAX_SITUATION + 1):
+        BINOMIAL[n][k] = 0 if n == 0 else BINOMIAL[n - 1][k - 1] + BINOMIAL[n - 1][k]
+
+cpdef long long binomial(int n, int k) except -1:
+    """n choose k, for n up to 52 & k up to 7"""
+    if n < 0 or n > DECK_SIZE or k < 0 or k > MAX_SITUATION:
+        raise ValueError("binomial({n}, {k}) is out of range".format(n=n, k=k))
+    return BINOMIAL[n][k]
+
+cpdef long long deck_combinations(int k) except -1:
+    """How many k-card combinations a deck has, one past the last colex number"""
+    return binomial(DECK_SIZE, k)
+
+cpdef long long colex_index(indexes) except -1:
+    """Colex number of a set of distinct card ints, in any order"""
+    cdef int i, index, last = -1
+    cdef long long number = 0
+    if len(indexes) > MAX_SITUATION:
+        raise ValueError("can only number up to 7 cards")
+    for i, index in enumerate(sorted(indexes), 1):
+        if index <= last or index >= DECK_SIZE:
+            raise ValueError("{} aren't distinct card ints".format(indexes))
+        number += BINOMIAL[index][i]
+        last = index
+    return number
+
+def colex_indexes(long long number, int k):
+    """The sorted card ints of the k-card combination with a colex number"""
+    cdef int combo[MAX_SITUATION]
+    cdef int i
+    if number < 0 or number >= deck_combinations(k):
+        raise ValueError("no {k} card combination {n}".format(k=k, n=number))
+    colex_unrank(number, k, combo)
+    return tuple(combo[i] for i in range(k))
+
+cdef void colex_unrank(long long number, int k, int* combo) nogil:
+    """Fills combo with the k sorted card ints numbered number"""
+    cdef int i, card = DECK_SIZE - 1
+    for i in range(k, 0, -1):
+        while BINOMIAL[card][i] > number:
+            card -= 1
+        combo[i - 1] = card
+        number -= BINOMIAL[card][i]
+
+cdef bint colex_next(int* combo, int k) nogil:
+    """Steps a sorted combo to the next colex number, False after the last"""
+    cdef int i, j
+    for i in range(k):
+        if combo[i] + 1 < (combo[i + 1] if i + 1 < k else DECK_SIZE):
+            combo[i] += 1
+            for j in range(i):
+                combo[j] = j
+            return True
+    return False
+
 def one_suit(int suit):
     """Returns a single suit in a list"""
     cdef int c
@@ -0,0 +1,14 @@
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+
+cdef inline double monotonic_secs() nogil:
+    """Seconds on the system-wide monotonic clock: wall time that never
+    jumps, and the same in every process"""
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return ts.tv_sec + ts.tv_nsec * 1e-9
+
+cdef class Deadline:
+    cdef readonly double end
+    cpdef double secs_left(Deadline self)
+    cdef inline bint passed_c(Deadline self) nogil:
+        return monotonic_secs() >= self.end
@@ -0,0 +1,47 @@
+"""The clock for timing & deadlines. time.clock() is CPU time on Linux, which
+stops whenever we're descheduled or waiting, and time.time() can jump with
+the system clock. CLOCK_MONOTONIC does neither, and is one clock_gettime call
+"""
+
+def monotonic():
+    """Seconds on the monotonic clock, only differences mean anything"""
+    return monotonic_secs()
+
+
+cdef class Deadline:
+    """When some work has to be finished by. Cheap enough to check in a
+    simulation loop, and good across processes on the same machine"""
+    def __init__(Deadline self, double secs_left):
+        self.end = monotonic_secs() + secs_left
+
+    @classmethod
+    def at(cls, double end):
+        """A deadline at a monotonic() time"""
+        cdef Deadline deadline = cls(0)
+        deadline.end = end
+        return deadline
+
+    @classmethod
+    def from_ms(cls, double ms_left):
+        return cls(ms_left / 1000)
+
+    cpdef double secs_left(Deadline self):
+        """Seconds until the deadline, 0 once it's passed"""
+        return max(self.end - monotonic_secs(), 0)
+
+    def ms_left(Deadline self):
+        return self.secs_left() * 1000
+
+    def passed(Deadline self):
+        return self.passed_c()
+
+    def __reduce__(Deadline self):
+        return (deadline_at, (self.end,))
+
+    def __repr__(Deadline self):
+        return "Deadline({:.1f}ms left)".format(self.ms_left())
+
+
+def deadline_at(double end):
+    """For unpickling deadlines sent to worker processes"""
+    return Deadline.at(end)
@@ -1,2 +1,21 @@
+from libc.stdint cimport uint32_t, uint64_t
+
+cdef class Random:
+    cdef uint64_t state[4]
+    cdef uint64_t next(Random self) nogil
+    cdef uint32_t bounded(Random self, uint32_t bound) nogil
+    cdef double next_double(Random self) nogil
+    cdef void sample_indexes(Random self, int* population, int length,
+                             int num_wanted) nogil
+    cpdef seed(Random self, unsigned long long value)
+    cpdef jump(Random self)
+    cpdef float uniform(Random self, float lower, float upper)
+    cpdef int randint(Random self, int lower, int upper) except? -1
+    cpdef list sample(Random self, list population, int num_wanted)
+
+cpdef Random default_stream()
+cpdef seed(unsigned long long value)
 cpdef float uniform(float lower, float upper)
+cpdef int randint(int lower, int upper) except? -1
 cpdef list sample(list population, int num_wanted)
+cdef void sample_indexes(int* population, int length, int num_wanted)
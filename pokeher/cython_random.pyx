@@ -1,39 +1,146 @@
-from libc.stdlib cimport rand, srand
-cdef extern from "limits.h":
-    int RAND_MAX
+from libc.stdint cimport uint32_t, uint64_t
 
-import time, math
-srand(math.trunc(time.time()))
+import os, time
+
+"""
+xoshiro256** (Blackman & Vigna): fast, 256 bits of state per stream and
+jump() to split off 2^128 draws at a time for independent parallel streams
+"""
+
+cdef uint64_t JUMP[4]
+JUMP[0] = 0x180ec6d33cfd0abaULL
+JUMP[1] = 0xd5a61266f0c9392cULL
+JUMP[2] = 0xa9582618e03fc9aaULL
+JUMP[3] = 0x39abdc4529b1661cULL
+
+
+cdef inline uint64_t rotl(uint64_t x, int k) nogil:
+    return (x << k) | (x >> (64 - k))
+
+
+cdef inline uint64_t splitmix64(uint64_t* x) nogil:
+    """Expands a seed into well-mixed state words"""
+    cdef uint64_t z
+    x[0] += 0x9e3779b97f4a7c15ULL
+    z = x[0]
+    z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9ULL
+    z = (z ^ (z >> 27)) * 0x94d049bb133111ebULL
+    return z ^ (z >> 31)
+
+
+cdef class Random:
+    """A random stream with its own state, seed it for repeatable runs"""
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = int(time.time() * 1000000) ^ (os.getpid() << 32)
+        self.seed(seed)
+
+    cpdef seed(Random self, unsigned long long value):
+        cdef uint64_t mix = value
+        cdef int i
+        for i in range(4):
+            self.state[i] = splitmix64(&mix)
+
+    cpdef jump(Random self):
+        """Skips ahead 2^128 draws. Streams seeded alike then jumped a
+        different number of times never overlap"""
+        cdef uint64_t jumped[4]
+        cdef int i, b
+        for i in range(4):
+            jumped[i] = 0
+        for i in range(4):
+            for b in range(64):
+                if JUMP[i] & (<uint64_t>1 << b):
+                    jumped[0] ^= self.state[0]
+                    jumped[1] ^= self.state[1]
+                    jumped[2] ^= self.state[2]
+                    jumped[3] ^= self.state[3]
+                self.next()
+        for i in range(4):
+            self.state[i] = jumped[i]
+
+    cdef uint64_t next(Random self) nogil:
+        cdef uint64_t result = rotl(self.state[1] * 5, 7) * 9
+        cdef uint64_t t = self.state[1] << 17
+        self.state[2] ^= self.state[0]
+        self.state[3] ^= self.state[1]
+        self.state[1] ^= self.state[2]
+        self.state[0] ^= self.state[3]
+        self.state[2] ^= t
+        self.state[3] = rotl(self.state[3], 45)
+        return result
+
+    cdef uint32_t bounded(Random self, uint32_t bound) nogil:
+        """Unbiased int in [0, bound), Lemire's multiply & reject"""
+        cdef uint64_t product = (self.next() >> 32) * bound
+        cdef uint32_t low = <uint32_t>product
+        cdef uint32_t threshold
+        if low < bound:
+            threshold = (-bound) % bound
+            while low < threshold:
+                product = (self.next() >> 32) * bound
+                low = <uint32_t>product
+        return product >> 32
+
+    cdef double next_double(Random self) nogil:
+        """Uniform double in [0, 1)"""
+        return (self.next() >> 11) * (1.0 / 9007199254740992.0)
+
+    cpdef float uniform(Random self, float lower, float upper):
+        """Same as Python's random.uniform"""
+        return lower + (upper - lower) * self.next_double()
+
+    cpdef int randint(Random self, int lower, int upper) except? -1:
+        """Same as Python's random.randint, includes both ends"""
+        if upper < lower:
+            raise ValueError("empty range for randint({}, {})"
+                             .format(lower, upper))
+        return lower + <int>self.bounded(<uint32_t>(upper - lower) + 1)
+
+    cpdef list sample(Random self, list population, int num_wanted):
+        """Random sampling without replacement"""
+        cdef int i, j
+        cdef int population_len = len(population)
+        if num_wanted >= population_len:
+            return population
+
+        cdef list picks = list(population)
+        for i in range(max(num_wanted, 0)):
+            j = i + self.bounded(population_len - i)
+            picks[i], picks[j] = picks[j], picks[i]
+        del picks[max(num_wanted, 0):]
+        return picks
+
+    cdef void sample_indexes(Random self, int* population, int length,
+                             int num_wanted) nogil:
+        """Random sampling without replacement, in place. Partial Fisher-Yates
+        moves num_wanted random members of population into its first slots"""
+        cdef int i, j, swap
+        for i in range(min(num_wanted, length)):
+            j = i + self.bounded(length - i)
+            swap = population[i]
+            population[i] = population[j]
+            population[j] = swap
+
+
+cdef Random _default = Random()
+
+cpdef Random default_stream():
+    """The stream behind the module level functions"""
+    return _default
+
+cpdef seed(unsigned long long value):
+    """Reseeds the default stream, e.g. for a repeatable benchmark"""
+    _default.seed(value)
 
 cpdef float uniform(float lower, float upper):
-    """Cython wrapper around Python's random.uniform"""
-    cdef float multiplier = rand() / float(RAND_MAX)
-    cdef float range = upper - lower
-    return lower + (range * multiplier)
-
-cpdef int randint(int lower, int upper):
-    cdef int range = upper - lower
-    # special case to avoid % 1 (always 0)
-    if range == 1:
-        range = 2
-    return lower + (rand() % range)
+    return _default.uniform(lower, upper)
+
+cpdef int randint(int lower, int upper) except? -1:
+    return _default.randint(lower, upper)
 
 cpdef list sample(list population, int num_wanted):
-    """Random sampling without replacement"""
-    cdef int population_len = len(population)
-    cdef uniform_len = population_len - 1
-    if num_wanted >= population_len or uniform_len == 0:
-        return population
-
-    cdef dict chosen = {}
-    cdef list picks = []
-    cdef int picked = 0
-    cdef int index
-    while picked < num_wanted:
-        index = randint(0, population_len)
-        if not chosen.get(index):
-            chosen[index] = True
-            picks.append(population[index])
-            picked += 1
-
-    return picks
+    return _default.sample(population, num_wanted)
+
+cdef void sample_indexes(int* population, int length, int num_wanted):
+    _default.sample_indexes(population, length, num_wanted)
@@ -0,0 +1,139 @@
+from __future__ import print_function
+import mmap
+import struct
+
+import numpy as np
+
+import utility
+
+
+class DataTable(object):
+    """Precomputed arrays in one fixed layout binary file. Nothing gets read
+    until the first load(), then the file is memory mapped read only: pages
+    come in as they're touched and forked processes share them
+
+    File layout (little endian):
+      header: magic, format version, kind of table, table version, sections
+      one directory entry per section: name, dtype, dimensions, byte offset,
+        shape (up to MAX_DIMS)
+      the packed section values, each starting on an ALIGN byte boundary
+    """
+    MAGIC = b'PKTBL1'
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct('<6sH8sHI')
+    MAX_DIMS = 4
+    SECTION = struct.Struct('<16s8sIQ{}Q'.format(MAX_DIMS))
+    ALIGN = 16
+
+    def __init__(self, data_file, kind, version, log_func=None):
+        if log_func is None:
+            log_func = self.print_log
+        self.path = utility.get_data_file(data_file)
+        self.kind = kind
+        self.version = version
+        self.log_func = log_func
+        self.sections = None
+        self.failed = False
+
+    def load(self):
+        """Maps the file the first time through, returns whether it's there"""
+        if self.sections is None and not self.failed:
+            try:
+                with open(self.path, 'rb') as in_stream:
+                    self.sections = self.__map(in_stream)
+                self.log_func("Mapped {k} table {f}".format(k=self.kind,
+                                                          f=self.path))
+            except (IOError, ValueError, struct.error) as e:
+                self.failed = True
+                self.log_func("Couldn't load {f} (e={e})".format(f=self.path,
+                                                                 e=e))
+        return self.sections is not None
+
+    def get(self, name):
+        """Returns the named section as a read only array, or None"""
+        if not self.load():
+            return None
+        return self.sections.get(name)
+
+    def __map(self, in_stream):
+        data = mmap.mmap(in_stream.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, format_version, kind, version, num_sections = \
+            self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or format_version != self.FORMAT_VERSION:
+            raise ValueError("not a data table")
+        if kind.rstrip(b'\0') != self.kind or version != self.version:
+            raise ValueError("not a version {v} {k} table"
+                             .format(v=self.version, k=self.kind))
+
+        sections = {}
+        entry = self.HEADER.size
+        for _ in range(num_sections):
+            fields = self.SECTION.unpack_from(data, entry)
+            name, dtype, dims, offset = fields[:4]
+            shape = fields[4:4 + dims]
+            count = int(np.prod(shape)) if dims else 1
+            values = np.frombuffer(data, dtype=dtype.rstrip(b'\0'),
+                                   count=count, offset=offset)
+            sections[name.rstrip(b'\0')] = values.reshape(shape)
+            entry += self.SECTION.size
+        return sections
+
+    @classmethod
+    def write(cls, out_stream, kind, version, sections):
+        """Writes a table file. sections is a list of (name, array), where an
+        array too big for memory can be a StreamedSection"""
+        streamed = []
+        for name, values in sections:
+            if not isinstance(values, StreamedSection):
+                values = StreamedSection.whole(values)
+            if len(values.shape) > cls.MAX_DIMS:
+                raise ValueError("{n} has more than {d} dimensions"
+                                 .format(n=name, d=cls.MAX_DIMS))
+            streamed.append((name, values))
+
+        out_stream.write(cls.HEADER.pack(cls.MAGIC, cls.FORMAT_VERSION, kind,
+                                         version, len(streamed)))
+        offset = cls.__align(cls.HEADER.size + len(streamed) * cls.SECTION.size)
+        for name, values in streamed:
+            shape = list(values.shape) + [0] * (cls.MAX_DIMS - len(values.shape))
+            out_stream.write(cls.SECTION.pack(name, values.dtype.str,
+                                              len(values.shape), offset, *shape))
+            offset = cls.__align(offset + values.nbytes)
+
+        written = cls.HEADER.size + len(streamed) * cls.SECTION.size
+        for name, values in streamed:
+            padding = cls.__align(written) - written
+            out_stream.write(b'\0' * padding)
+            written += padding
+            section_bytes = 0
+            for chunk in values.chunks:
+                data = np.asarray(chunk, dtype=values.dtype).tobytes()
+                out_stream.write(data)
+                section_bytes += len(data)
+            if section_bytes != values.nbytes:
+                raise ValueError("{n} had {w} bytes, not {e}".format(
+                    n=name, w=section_bytes, e=values.nbytes))
+            written += section_bytes
+
+    @classmethod
+    def __align(cls, offset):
+        return -(-offset // cls.ALIGN) * cls.ALIGN
+
+    @staticmethod
+    def print_log(what):
+        print(what)
+
+
+class StreamedSection(object):
+    """A table section written a chunk at a time, so it never has to fit in
+    memory. chunks is an iterable of arrays that fill shape in C order"""
+    def __init__(self, dtype, shape, chunks):
+        self.dtype = np.dtype(dtype).newbyteorder('<')
+        self.shape = tuple(shape)
+        self.chunks = chunks
+        self.nbytes = int(np.prod(self.shape)) * self.dtype.itemsize
+
+    @classmethod
+    def whole(cls, values):
+        values = np.asarray(values)
+        return cls(values.dtype, values.shape, [values])
@@ -0,0 +1,66 @@
+from __future__ import print_function
+
+import numpy as np
+
+from data_table import DataTable
+from hand_indexer import HandIndexer
+
+
+class FlopEquityCache(object):
+    """Precomputed flop equities, keyed by the suit-isomorphic index of
+    (hand, flop) and a fear bucket: the opponent's preflop hand filter & the
+    tier of their postflop bet. See standalone/flop_equities.py
+
+    Table sections:
+      buckets: int32 [bucket][hand filter, hand fear tier]
+      keys: sorted uint32 flop indexes (see INDEXER)
+      equities: float32 [bucket][key], NaN where we didn't compute one
+    """
+    KIND = b'flopeq'
+    VERSION = 3
+    # numbers each (hand, flop) class densely from 0 to INDEXER.size(1)
+    INDEXER = HandIndexer((2, 3))
+    # the postflop fear tiers, see fear.OpponentHandRangeFear
+    TIERS = ["CHECK", "MIN_RAISE", "RAISE", "BIG_RAISE", "OVERBET"]
+
+    def __init__(self, data_file='flop_equity.cache', log_func=None):
+        self.table = DataTable(data_file, self.KIND, self.VERSION, log_func)
+        self.buckets = None
+
+    def loaded(self):
+        """Maps the cache on first use"""
+        if self.buckets is None and self.table.load():
+            self.buckets = dict((tuple(bucket), i) for i, bucket
+                                in enumerate(self.table.get('buckets').tolist()))
+        return self.buckets is not None
+
+    def lookup(self, hand, table_cards, hand_filter=-1, tier="CHECK"):
+        """Returns the cached % equity, or None if we don't have one"""
+        if len(table_cards) != 3 or tier not in self.TIERS or not self.loaded():
+            return None
+        bucket = self.buckets.get((hand_filter, self.TIERS.index(tier)))
+        if bucket is None:
+            return None
+
+        keys = self.table.get('keys')
+        key = self.INDEXER.index_cards([hand.high, hand.low], table_cards)
+        slot = np.searchsorted(keys, key)
+        if slot >= len(keys) or keys[slot] != key:
+            return None
+        equity = self.table.get('equities')[bucket, slot]
+        if np.isnan(equity):
+            return None
+        return float(equity)
+
+    @classmethod
+    def write(cls, out_stream, keys, buckets, equities):
+        """Writes a cache file. keys are flop indexes, buckets a list of
+        (hand filter, tier name) and equities an array of [bucket][key]"""
+        order = np.argsort(keys)
+        buckets = [(hand_filter, cls.TIERS.index(tier))
+                   for hand_filter, tier in buckets]
+        DataTable.write(out_stream, cls.KIND, cls.VERSION, [
+            ('buckets', np.array(buckets, dtype='<i4').reshape((-1, 2))),
+            ('keys', np.asarray(keys, dtype='<u4')[order]),
+            ('equities', np.asarray(equities, dtype='<f4')[:, order]),
+        ])
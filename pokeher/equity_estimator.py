@@ -0,0 +1,59 @@
+from __future__ import division
+
+import math
+
+
+class EquityEstimator(object):
+    """Anytime equity estimate built from chunks of simulation results.
+    Keeps a running (trial-weighted) mean so we can stop as soon as the
+    confidence interval is clear of every threshold we care about.
+
+    The interval is a Wilson score interval on the win rate, splits counting
+    as half a win. It stays sensible at 0% & 100%, where the usual normal
+    interval shrinks to nothing, so lopsided spots can stop after a few
+    hundred trials. It gets checked after every chunk, so it's wider than a
+    single 99% interval would be
+    """
+    Z_SCORE = 3.29 # 99.9% confidence, for checking again & again
+    MIN_TRIALS = 200
+
+    def __init__(self, thresholds=()):
+        self.thresholds = sorted(thresholds)
+        self.trials = 0
+        self.chunks = 0
+        self.mean = 0
+
+    def add(self, equity, trials):
+        """Adds a chunk: the % equity from simulating some number of trials"""
+        if trials <= 0:
+            return
+        self.chunks += 1
+        self.trials += trials
+        self.mean += (equity - self.mean) * trials / self.trials
+
+    def interval(self):
+        """The confidence interval around the equity"""
+        if not self.trials:
+            return 0, 100
+        n = self.trials
+        p = self.mean / 100
+        z2 = self.Z_SCORE ** 2
+        scale = 1 + z2 / n
+        center = (p + z2 / (2 * n)) / scale
+        margin = self.Z_SCORE * math.sqrt(p * (1 - p) / n
+                                          + z2 / (4 * n * n)) / scale
+        return 100 * (center - margin), 100 * (center + margin)
+
+    def is_decided(self):
+        """True when no threshold falls inside the confidence interval, so
+        more trials won't change which side of each threshold we're on"""
+        if self.trials < self.MIN_TRIALS:
+            return False
+        low, high = self.interval()
+        return not any(low <= t <= high for t in self.thresholds)
+
+    def distance(self):
+        """How far the equity is from the nearest threshold, in % equity"""
+        if not self.thresholds:
+            return float('inf')
+        return min(abs(self.mean - t) for t in self.thresholds)
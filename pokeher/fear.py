@@ -16,6 +16,29 @@ class Fear(object):
             self.data.hand_fear = max(self.data.hand_fear,
                                       hand_fear.minimum_handscore())
 
+    def likely_fears(self):
+        """The (preflop fear, hand fear) each size of bet from the opponent
+        would leave us with, smallest bet first"""
+        fears = []
+        if not self.data.table_cards:
+            for tier in OpponentPreflopFear.tier_names():
+                hand_filter = max(self.data.preflop_fear,
+                                  OpponentPreflopFear.RAISE_FEARS[tier])
+                fears.append((hand_filter, self.data.hand_fear))
+        else:
+            table_score = self.data.hand_context().table_score()
+            for tier in OpponentHandRangeFear.tier_names():
+                hand_fear = max(self.data.hand_fear,
+                                OpponentHandRangeFear.fear_handscore(
+                                    table_score, tier))
+                fears.append((self.data.preflop_fear, hand_fear))
+
+        unique = []
+        for fear in fears:
+            if fear not in unique:
+                unique.append(fear)
+        return unique
+
 
 class OpponentFear(object):
     def __init__(self, data_obj, to_call):
@@ -28,6 +51,11 @@ class OpponentFear(object):
         tiers = BetTiers(pot, bb, is_preflop)
         self.tier = tiers.tier(to_call)
 
+    @classmethod
+    def tier_names(cls):
+        """The tiers we have a fear for, least scary first"""
+        return sorted(cls.RAISE_FEARS, key=cls.RAISE_FEARS.get)
+
 
 class OpponentPreflopFear(OpponentFear):
     """Class that tracks opponent's preflop actions to estimate their
@@ -55,14 +83,40 @@ class OpponentHandRangeFear(OpponentFear):
     }
 
     def minimum_handscore(self):
-        table_best = self.find_table_score(self.data.table_cards)
-        type_increase, kicker = self.RAISE_FEARS[self.tier.name]
-        table_best.type += type_increase
-        fear_kicker = tuple([kicker] * 5)
-        table_best.kicker = max(table_best.kicker, fear_kicker)
-        return table_best
-
-    def find_table_score(self, cards):
+        table_score = self.data.hand_context().table_score()
+        return self.fear_handscore(table_score, self.tier.name)
+
+    @classmethod
+    def tier_handscore(cls, table_cards, tier_name):
+        """The weakest hand we think the opponent has after a bet in tier_name"""
+        return cls.fear_handscore(cls.find_table_score(table_cards), tier_name)
+
+    @classmethod
+    def fear_handscore(cls, table_score, tier_name):
+        """tier_handscore for a table we've already scored"""
+        type_increase, kicker = cls.RAISE_FEARS[tier_name]
+        fear = handscore.HandScore(table_score.type + type_increase)
+        fear.kicker = max(table_score.kicker, tuple([kicker] * 5))
+        return fear
+
+    @classmethod
+    def find_tier(cls, table_cards, hand_fear, table_score=None):
+        """Returns the name of the weakest tier that gives hand_fear, or None"""
+        if table_score is None:
+            table_score = cls.find_table_score(table_cards)
+        for tier_name in cls.tier_names():
+            if cls.fear_handscore(table_score, tier_name) == hand_fear:
+                return tier_name
+        # before anyone bets there's no fear, same as a check
+        if hand_fear == handscore.HandScore():
+            return "CHECK"
+        return None
+
+    @staticmethod
+    def find_table_score(cards):
+        if len(cards) >= 5:
+            strength = handscore.hand_strength(cards)
+            return handscore.HandScore.from_strength(strength)
         builder = handscore.HandBuilder(cards)
         score = builder.score_hand()
         score.type = max(score.type, 0)
@@ -1,48 +1,48 @@
 from cards import Hand
 import handscore
+from hand_context import HandContext
+from wiring import GameEvents
 
 """
 Data classes relating to the game of poker
 """
 
 
-class Match(object):
+class Match(GameEvents):
     """Container for information about a group of games"""
     def reset_match(self):
         self.round = 0
         self.opponents = []
         self.me = None
         self.time_per_move = 500
+        # None until the engine tells us
+        self.time_bank = None
+        # last known, stacks carry over from hand to hand
+        self.stacks = {}
+
+    def on_seat(self, bot):
+        if bot != self.me and bot not in self.opponents:
+            self.opponents.append(bot)
+
+    def on_your_bot(self, bot):
+        self.me = bot
+        if bot in self.opponents:
+            self.opponents.remove(bot)
+
+    def on_round(self, number):
+        self.round = number
+
+    def on_time_bank(self, ms):
+        self.time_bank = ms
 
-    def update_match(self):
-        if 'your_bot' in self.sharedData:
-            self.me = self.sharedData.pop('your_bot')
-            if self.me in self.opponents:
-                del self.opponents[self.me]
-
-        if 'round' in self.sharedData:
-            round_string = self.sharedData.pop('round')
-            try:
-                self.round = int(round_string)
-            except ValueError:
-                pass
-
-        if 'bots' in self.sharedData:
-            bot_list = self.sharedData.pop('bots')
-            for bot in bot_list:
-                if bot == self.me:
-                    continue
-                self.opponents.append(bot)
-
-        if 'time_per_move' in self.sharedData:
-            time_string = self.sharedData.pop('time_per_move')
-            try:
-                self.time_per_move = int(time_string)
-            except ValueError:
-                pass
-
-
-class Round(object):
+    def on_time_per_move(self, ms):
+        self.time_per_move = ms
+
+    def on_stack(self, bot, amount):
+        self.stacks[bot] = amount
+
+
+class Round(GameEvents):
     """Memory for a full hand of poker"""
     def reset_round(self):
         self.table_cards = []
@@ -53,103 +53,64 @@ class Round(object):
         self.big_blind = 0
         self.small_blind = 0
         self.button = None
-        self.stacks = {}
         self.preflop_fear = -1
         self.hand_fear = handscore.HandScore()
+        self.folded = set()
+        self.context = HandContext()
+
+    def on_round_over(self, winner, amount):
+        self.reset_round()
+
+    def on_small_blind(self, amount):
+        self.small_blind = amount
+
+    def on_big_blind(self, amount):
+        self.big_blind = amount
+
+    def on_button(self, bot):
+        self.button = bot
+
+    def on_hand(self, bot, cards):
+        if bot == getattr(self, 'me', None):
+            self.hand = Hand(cards[0], cards[1])
+            self.context.update(self.hand, self.table_cards)
 
-    def update_round(self):
-        if 'roundOver' in self.sharedData:
-            round_is_over = self.sharedData.pop('roundOver')
-            if round_is_over:
-                self.reset_round()
-
-        self.parse_blinds()
-        self.parse_cards()
-        self.parse_pot()
-        self.parse_bets()
-        self.parse_stacks()
-
-        if 'on_button' in self.sharedData:
-            self.button = self.sharedData.pop('on_button')
-
-    def parse_cards(self):
-        if hasattr(self, 'me') and self.me:
-            key = ('hand', self.me)
-            if key in self.sharedData:
-                cards = self.sharedData.pop(key)
-                self.hand = Hand(cards[0], cards[1])
-
-        if 'table' in self.sharedData:
-            self.table_cards = self.sharedData.pop('table')
-
-    def parse_pot(self):
-        if 'pot' in self.sharedData:
-            pot_str = self.sharedData.pop('pot')
-            try:
-                self.pot = int(pot_str)
-            except ValueError:
-                pass
-
-        if 'amount_to_call' in self.sharedData:
-            call_str = self.sharedData.pop('amount_to_call')
-            try:
-                self.to_call = int(call_str)
-            except ValueError:
-                pass
-
-    def parse_blinds(self):
-        if 'small_blind' in self.sharedData:
-            sb_string = self.sharedData.pop('small_blind')
-            try:
-                self.small_blind = int(sb_string)
-            except ValueError:
-                pass
-
-        if 'big_blind' in self.sharedData:
-            bb_string = self.sharedData.pop('big_blind')
-            try:
-                self.big_blind = int(bb_string)
-            except ValueError:
-                pass
-
-    def parse_bets(self):
-        reset = (self.to_call == 0)
-        for bot in self.__get_bots():
-            bet_key = ('bet', bot)
-            bet = self.sharedData.get(bet_key)
-            if reset:
+    def on_table(self, cards):
+        self.table_cards = cards
+        self.context.update(self.hand, self.table_cards)
+
+    def on_pot(self, amount):
+        self.pot = amount
+
+    def on_amount_to_call(self, amount):
+        self.to_call = amount
+        if not amount:
+            # new betting round
+            for bot in self.bets:
                 self.bets[bot] = 0
-            elif bet:
-                self.bets[bot] = bet
-
-    def parse_stacks(self):
-        for bot in self.__get_bots():
-            stack_key = ('stack', bot)
-            stack = self.sharedData.get(stack_key, "")
-            try:
-                self.stacks[bot] = int(stack)
-            except ValueError:
-                self.stacks[bot] = 0
-
-    def __get_bots(self):
-        if not hasattr(self, 'opponents') or not self.opponents:
-            try:
-                return [self.me]
-            except AttributeError:
-                return []
-        return self.opponents + [self.me]
+
+    def on_bet(self, bot, amount):
+        self.bets[bot] = self.bets.get(bot, 0) + amount
+
+    def on_fold(self, bot):
+        self.folded.add(bot)
 
 
 class GameData(Match, Round):
-    """Aggregate data classes mixed in together"""
-    def __init__(self, sharedData):
-        self.sharedData = sharedData
+    """Aggregate data classes mixed in together, kept up to date by the
+    parser's events"""
+    def __init__(self):
         self.reset()
 
     def reset(self):
         self.reset_match()
         self.reset_round()
 
-    def update(self):
-        self.update_match()
-        self.update_round()
+    def live_opponents(self):
+        """Opponents who haven't folded this hand"""
+        return [bot for bot in self.opponents if bot not in self.folded]
+
+    def hand_context(self):
+        """The evaluation context, caught up with the cards we know about"""
+        self.context.update(self.hand, self.table_cards)
+        return self.context
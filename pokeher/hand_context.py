@@ -0,0 +1,68 @@
+import cards
+import handscore
+from fear import OpponentHandRangeFear
+from hand_simulator import HandSimulator
+
+
+class HandContext(object):
+    """Evaluation state for the hand in progress. The dead card mask
+    catches up one card at a time as the table comes out. Everything else is
+    worked out once per street & kept until the next card, so decisions on
+    the same street share it: the table's own score, our best hand and a
+    simulator (which keeps its opponent ranges)
+    """
+    def __init__(self):
+        self.reset(None)
+
+    def reset(self, hand):
+        self.hand = hand
+        self.table_cards = []
+        self.dead_mask = cards.cards_to_mask([hand.high, hand.low]) if hand else 0
+        self.street = {}
+
+    def update(self, hand, table_cards):
+        """Catches up with our hand & the table, only new cards cost anything"""
+        known = len(self.table_cards)
+        if not self.__same_hand(hand) or table_cards[:known] != self.table_cards:
+            self.reset(hand)
+            known = 0
+        if len(table_cards) == known:
+            return
+        for card in table_cards[known:]:
+            self.dead_mask |= cards.cards_to_mask([card])
+        self.table_cards = list(table_cards)
+        self.street = {}
+
+    def __same_hand(self, hand):
+        if hand is None or self.hand is None:
+            return hand is self.hand
+        return hand == self.hand
+
+    def deck_mask(self):
+        """The cards we haven't seen"""
+        return cards.FULL_DECK_MASK & ~self.dead_mask
+
+    def table_score(self):
+        """Score of the table cards by themselves"""
+        if 'table_score' not in self.street:
+            self.street['table_score'] = \
+                OpponentHandRangeFear.find_table_score(self.table_cards)
+        return self.street['table_score']
+
+    def best_hand(self):
+        """Our best 5 cards & their score, once there's a flop"""
+        if 'best_hand' not in self.street:
+            hole = [self.hand.high, self.hand.low]
+            if len(self.table_cards) >= 3:
+                best = handscore.HandBuilder(hole + self.table_cards).find_hand()
+            else:
+                best = hole, handscore.HandScore()
+            self.street['best_hand'] = best
+        return self.street['best_hand']
+
+    def simulator(self, preflop_equity):
+        """A simulator for this street, the same one for every decision"""
+        if 'simulator' not in self.street:
+            self.street['simulator'] = HandSimulator(self.hand, self.table_cards,
+                                                     preflop_equity)
+        return self.street['simulator']
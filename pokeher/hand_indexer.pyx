@@ -0,0 +1,307 @@
+from libc.stdint cimport uint64_t
+from bisect import bisect_right
+import itertools
+cimport cards
+
+"""Waugh style hand isomorphism: a dense index for every suit-isomorphic
+class of situation, round by round (preflop, flop, turn, river by default).
+
+Within a suit, a situation is the ranks dealt in each round. That gets an
+index from the colex number of each round's ranks among the ranks still left
+in the suit. Suits dealt the same number of cards in every round are
+interchangeable, so their indexes only count as a multiset. A round's index
+is then the offset of its per-suit card counts (sorted, so the suits'
+labels don't matter) plus a mixed radix number over the multisets.
+"""
+
+cdef enum:
+    NUM_SUITS = 4
+    NUM_RANKS = 13
+    MAX_ROUNDS = 4
+    MAX_CARDS = 7
+    COUNT_BITS = 3
+    CODE_BITS = 12 # COUNT_BITS * MAX_ROUNDS
+
+HOLDEM_ROUNDS = (2, 3, 1, 1)
+
+cdef uint64_t choose(uint64_t n, int k):
+    """n choose k for the small k we need, 0 when k > n"""
+    cdef uint64_t result = 1
+    cdef int i
+    if k < 0 or <uint64_t>k > n:
+        return 0
+    for i in range(k):
+        result = result * (n - i) // (i + 1)
+    return result
+
+cdef uint64_t unrank_largest(uint64_t value, int k, uint64_t upper):
+    """The largest n < upper with choose(n, k) <= value"""
+    cdef uint64_t low = k - 1, high = upper - 1, middle
+    while low < high:
+        middle = (low + high + 1) // 2
+        if choose(middle, k) <= value:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+def suit_counts(int code, int num_rounds):
+    """Unpacks a suit's per-round card counts"""
+    return tuple((code >> (COUNT_BITS * (num_rounds - 1 - j))) & 7
+                 for j in range(num_rounds))
+
+cdef uint64_t suit_size(counts):
+    """How many ways one suit can be dealt the per-round counts"""
+    cdef uint64_t size = 1
+    cdef int remaining = NUM_RANKS, count
+    for count in counts:
+        size *= choose(remaining, count)
+        remaining -= count
+    return size
+
+
+cdef class HandIndexer:
+    """Maps situations to dense indexes & back. A situation is card ints in
+    round order: with the default rounds, 2 hole cards then the table cards.
+    Every suit relabeling of a situation (and reordering within a round) gets
+    the same index, and every index in range(size(round)) is some situation
+    """
+    cdef readonly tuple rounds
+    cdef int num_rounds
+    cdef int round_start[MAX_ROUNDS + 1]
+    cdef list sizes
+    # per round: {packed suit codes: (offset, groups)}, a group being
+    # (suit code, number of suits, ways to deal one suit, radix)
+    cdef list configs
+    # per round: sorted offsets & the matching (codes, groups)
+    cdef list offsets
+    cdef list ordered
+
+    def __init__(self, rounds=HOLDEM_ROUNDS):
+        cdef int r
+        if not 0 < len(rounds) <= MAX_ROUNDS or min(rounds) < 1 \
+          or sum(rounds) > MAX_CARDS:
+            raise ValueError("can't index rounds {}".format(rounds))
+        self.rounds = tuple(rounds)
+        self.num_rounds = len(rounds)
+        self.round_start[0] = 0
+        for r in range(self.num_rounds):
+            self.round_start[r + 1] = self.round_start[r] + rounds[r]
+
+        self.sizes = []
+        self.configs = []
+        self.offsets = []
+        self.ordered = []
+        for r in range(self.num_rounds):
+            self.__build_round(r)
+
+    def __build_round(self, int r):
+        """Lays out every split of the cards between suits, end to end"""
+        configs = {}
+        offsets = []
+        ordered = []
+        offset = 0
+        for codes in sorted(self.__splits(r)):
+            groups = []
+            for code, suits in itertools.groupby(codes):
+                count = len(list(suits))
+                choices = suit_size(suit_counts(code, r + 1))
+                groups.append((code, count, choices,
+                               choose(choices + count - 1, count)))
+            configs[self.__key(codes)] = (offset, groups)
+            offsets.append(offset)
+            ordered.append((codes, groups))
+            size = 1
+            for _, _, _, radix in groups:
+                size *= radix
+            offset += size
+        self.sizes.append(offset)
+        self.configs.append(configs)
+        self.offsets.append(offsets)
+        self.ordered.append(ordered)
+
+    def __splits(self, int r):
+        """Each way to deal rounds 0..r between the suits, as per suit count
+        codes sorted biggest first"""
+        per_round = [[split for split in itertools.product(
+                          range(self.rounds[j] + 1), repeat=NUM_SUITS)
+                      if sum(split) == self.rounds[j]]
+                     for j in range(r + 1)]
+        splits = set()
+        for deal in itertools.product(*per_round):
+            counts = zip(*deal)
+            if max(sum(suit) for suit in counts) > NUM_RANKS:
+                continue
+            codes = []
+            for suit in counts:
+                code = 0
+                for count in suit:
+                    code = (code << COUNT_BITS) | count
+                codes.append(code)
+            splits.add(tuple(sorted(codes, reverse=True)))
+        return splits
+
+    cdef object __key(self, codes):
+        key = 0
+        for code in codes:
+            key = (key << CODE_BITS) | code
+        return key
+
+    def size(self, int round):
+        """How many canonical situations a round has"""
+        return self.sizes[round]
+
+    cdef int __round_for(self, int num_cards) except -1:
+        cdef int r
+        for r in range(self.num_rounds):
+            if self.round_start[r + 1] == num_cards:
+                return r
+        raise ValueError("{n} cards isn't the end of a round".format(n=num_cards))
+
+    def index(self, indexes):
+        """Index of a situation given as card ints in round order. How many
+        cards there are picks the round"""
+        cdef int num_cards = len(indexes)
+        cdef int r = self.__round_for(num_cards)
+        cdef int i, j = 0, s, t, card, suit, rank, count
+        cdef uint64_t seen = 0, group, result, multiplier = 1, radix
+        cdef int masks[NUM_SUITS][MAX_ROUNDS]
+        cdef int counts[NUM_SUITS][MAX_ROUNDS]
+        cdef int codes[NUM_SUITS]
+        cdef int order[NUM_SUITS]
+        cdef uint64_t suit_index[NUM_SUITS]
+
+        for s in range(NUM_SUITS):
+            for i in range(MAX_ROUNDS):
+                masks[s][i] = 0
+                counts[s][i] = 0
+        for i in range(num_cards):
+            card = indexes[i]
+            if card < 0 or card >= cards.DECK_SIZE \
+              or seen & cards.index_mask(card):
+                raise ValueError("bad or repeated card {c}".format(c=card))
+            seen |= cards.index_mask(card)
+            while i >= self.round_start[j + 1]:
+                j += 1
+            suit = card // NUM_RANKS
+            rank = card % NUM_RANKS
+            masks[suit][j] |= 1 << rank
+            counts[suit][j] += 1
+
+        # suits biggest code first, then biggest index: the canonical order
+        for s in range(NUM_SUITS):
+            codes[s] = 0
+            for i in range(r + 1):
+                codes[s] = (codes[s] << COUNT_BITS) | counts[s][i]
+            suit_index[s] = self.__suit_index(masks[s], counts[s], r + 1)
+            t = s
+            while t > 0 and (codes[order[t - 1]] < codes[s] or
+                             (codes[order[t - 1]] == codes[s] and
+                              suit_index[order[t - 1]] < suit_index[s])):
+                order[t] = order[t - 1]
+                t -= 1
+            order[t] = s
+
+        key = 0
+        for s in range(NUM_SUITS):
+            key = (key << CODE_BITS) | codes[order[s]]
+        offset, groups = self.configs[r][key]
+
+        result = offset
+        s = 0
+        for _, count, _, radix in groups:
+            # the multiset of indexes, smallest first, as a colex number
+            group = 0
+            for i in range(1, count + 1):
+                group += choose(suit_index[order[s + count - i]] + i - 1, i)
+            result += group * multiplier
+            multiplier *= radix
+            s += count
+        return result
+
+    cdef uint64_t __suit_index(self, int* masks, int* counts, int num_rounds):
+        """Mixed radix of each round's colex number among the unused ranks"""
+        cdef uint64_t index = 0, multiplier = 1, colex
+        cdef int used = 0, remaining = NUM_RANKS, j, rank, position, k
+        for j in range(num_rounds):
+            colex = 0
+            position = 0
+            k = 1
+            for rank in range(NUM_RANKS):
+                if used & (1 << rank):
+                    continue
+                if masks[j] & (1 << rank):
+                    colex += choose(position, k)
+                    k += 1
+                position += 1
+            index += colex * multiplier
+            multiplier *= choose(remaining, counts[j])
+            remaining -= counts[j]
+            used |= masks[j]
+        return index
+
+    def index_cards(self, hand, table_cards=()):
+        """Index of a situation given as Cards"""
+        cdef cards.Card card
+        return self.index([cards.card_index(card)
+                           for card in itertools.chain(hand, table_cards)])
+
+    def unindex(self, int round, index):
+        """A situation with the index, as a tuple of sorted card ints for each
+        round. Suits get handed out in canonical order"""
+        cdef int s, j, count, i
+        cdef uint64_t group, top
+        if round < 0 or round >= self.num_rounds \
+          or not 0 <= index < self.sizes[round]:
+            raise ValueError("no index {i} in round {r}".format(i=index,
+                                                                 r=round))
+        config = bisect_right(self.offsets[round], index) - 1
+        codes, groups = self.ordered[round][config]
+        remainder = index - self.offsets[round][config]
+
+        dealt = [[] for _ in range(round + 1)]
+        s = 0
+        for code, count, choices, radix in groups:
+            group = remainder % radix
+            remainder //= radix
+            top = choices + count - 1
+            suit_indexes = []
+            for i in range(count, 0, -1):
+                top = unrank_largest(group, i, top)
+                group -= choose(top, i)
+                suit_indexes.append(top - (i - 1))
+            for suit_index in suit_indexes:
+                counts = suit_counts(code, round + 1)
+                for j, ranks in enumerate(self.__suit_ranks(suit_index, counts)):
+                    dealt[j].extend([s * NUM_RANKS + rank for rank in ranks])
+                s += 1
+        return tuple(tuple(sorted(cards_dealt)) for cards_dealt in dealt)
+
+    cdef list __suit_ranks(self, uint64_t index, counts):
+        """Undoes __suit_index: the ranks dealt in each round"""
+        cdef uint64_t colex, radix, position
+        cdef int used = 0, remaining = NUM_RANKS, count, k, rank
+        rounds = []
+        for count in counts:
+            radix = choose(remaining, count)
+            colex = index % radix
+            index //= radix
+            positions = set()
+            position = remaining
+            for k in range(count, 0, -1):
+                position = unrank_largest(colex, k, position)
+                colex -= choose(position, k)
+                positions.add(position)
+            ranks = []
+            position = 0
+            for rank in range(NUM_RANKS):
+                if used & (1 << rank):
+                    continue
+                if position in positions:
+                    ranks.append(rank)
+                position += 1
+            for rank in ranks:
+                used |= 1 << rank
+            remaining -= count
+            rounds.append(ranks)
+        return rounds
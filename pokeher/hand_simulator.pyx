@@ -1,14 +1,116 @@
+from libc.stdint cimport uint64_t
 cimport cython_random as random
 cimport cards
 cimport handscore
 import cards
+from clock cimport Deadline
+from cards cimport DECK_SIZE, index_mask
 from handscore import HandBuilder, HandScore
-from handscore cimport HandBuilder, HandScore
+from handscore cimport HandBuilder, HandScore, mask_strength
 from utility import MathUtils
 
 
 cdef enum:
+    TABLE_SIZE = 5
+    MAX_COMBOS = 1326 # 52 choose 2 hole card combinations
+    MAX_OPPONENTS = 22 # (52 - 2 - 5) / 2, as many as the deck can deal to
+    DRAW_ATTEMPTS = 20 # range draws per opponent before we take any cards
+    MAX_REJECTS = 50 # deals per try before deciding min_hand can't be made
     FAILED_TRY = -1
+    DEADLINE_CHECK = 64 # tries between looks at the clock, a power of two
+
+
+cdef class OpponentRange:
+    """The hole cards we think the opponent could have, each with a weight.
+    Sampled through an alias table, so every draw is a usable opponent hand
+    and costs the same however tight the range is
+    """
+    cdef readonly int size
+    cdef readonly double total_weight
+    cdef int card1[MAX_COMBOS]
+    cdef int card2[MAX_COMBOS]
+    cdef double weight[MAX_COMBOS]
+    # alias table: slot i is combo i with probability prob[i], else alias[i]
+    cdef double prob[MAX_COMBOS]
+    cdef int alias[MAX_COMBOS]
+
+    def __init__(self):
+        self.size = 0
+        self.total_weight = 0
+
+    def __len__(self):
+        return self.size
+
+    cpdef add(OpponentRange self, int card1, int card2, double weight=1):
+        """Adds two card indexes to the range, zero weights are left out"""
+        if weight <= 0:
+            return
+        if self.size >= MAX_COMBOS:
+            raise ValueError("more than {} combos in range".format(MAX_COMBOS))
+        self.card1[self.size] = card1
+        self.card2[self.size] = card2
+        self.weight[self.size] = weight
+        self.size += 1
+        self.total_weight += weight
+
+    cpdef build(OpponentRange self):
+        """Builds the alias table (Vose's method), call after the last add"""
+        cdef int i, less, more
+        cdef int small_count = 0, large_count = 0
+        cdef int small[MAX_COMBOS]
+        cdef int large[MAX_COMBOS]
+        cdef double scaled[MAX_COMBOS]
+
+        for i in range(self.size):
+            scaled[i] = self.weight[i] * self.size / self.total_weight
+            if scaled[i] < 1:
+                small[small_count] = i
+                small_count += 1
+            else:
+                large[large_count] = i
+                large_count += 1
+
+        while small_count and large_count:
+            small_count -= 1
+            less = small[small_count]
+            more = large[large_count - 1]
+            self.prob[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                large_count -= 1
+                small[small_count] = more
+                small_count += 1
+
+        # whatever is left over is 1, give or take rounding
+        for i in range(large_count):
+            self.prob[large[i]] = 1
+        for i in range(small_count):
+            self.prob[small[i]] = 1
+
+    cdef int sample(OpponentRange self, random.Random rng) nogil:
+        """Returns the slot of a random combo, by weight"""
+        cdef int slot = rng.bounded(self.size)
+        if rng.next_double() < self.prob[slot]:
+            return slot
+        return self.alias[slot]
+
+    def draw(self, random.Random rng=None):
+        """Returns a random (Card, Card) from the range"""
+        cdef int slot
+        if not self.size:
+            raise ValueError("empty opponent range")
+        if rng is None:
+            rng = random.default_stream()
+        slot = self.sample(rng)
+        return cards.from_index(self.card1[slot]), \
+            cards.from_index(self.card2[slot])
+
+    def combos(self):
+        """Returns [(Card, Card, weight)] for every combo in the range"""
+        return [(cards.from_index(self.card1[i]),
+                 cards.from_index(self.card2[i]), self.weight[i])
+                for i in range(self.size)]
 
 
 cdef class HandSimulator:
@@ -17,15 +119,53 @@ cdef class HandSimulator:
     pot equity (percent of pot we can expect to win)
     """
     cdef list hand
-    cdef readonly list deck, table_cards
+    cdef readonly list table_cards
     cdef readonly dict equity
+    cdef uint64_t hand_mask, table_mask
+    cdef int table_indexes[TABLE_SIZE]
+    cdef int cards_needed
+    # remaining cards as ints, shuffled in place by every trial
+    cdef int deck_cards[DECK_SIZE]
+    cdef int deck_size
+    # preflop equity of every two card combination, indexed [card1][card2]
+    cdef float pair_equity[DECK_SIZE][DECK_SIZE]
+    cdef bint has_pair_equity
+    # opponent ranges by (hand filter, min hand strength)
+    cdef dict ranges
+    cdef readonly random.Random rng
+    # how many tries the last simulate() got through
+    cdef readonly int last_tries
 
-    def __init__(self, cards.Hand hand, table_cards=[], preflop_equity={}):
+    def __init__(self, cards.Hand hand, table_cards=[], preflop_equity={},
+                 random.Random rng=None):
+        cdef int i
+        cdef uint64_t dead
         self.hand = [hand.high, hand.low]
         self.table_cards = table_cards
         self.equity = preflop_equity
-        self.deck = [c for c in cards.full_deck() \
-                     if not c in self.table_cards and not c in self.hand]
+        self.hand_mask = cards.cards_to_mask(self.hand)
+        self.table_mask = cards.cards_to_mask(self.table_cards)
+        self.has_pair_equity = False
+        self.ranges = {}
+        # pass a seeded stream for repeatable simulations
+        self.rng = rng if rng is not None else random.default_stream()
+
+        self.cards_needed = TABLE_SIZE - len(self.table_cards)
+        for i, index in enumerate(cards.to_indexes(self.table_cards)):
+            self.table_indexes[i] = index
+
+        dead = self.hand_mask | self.table_mask
+        self.deck_size = 0
+        for i in range(DECK_SIZE):
+            if not dead & index_mask(i):
+                self.deck_cards[self.deck_size] = i
+                self.deck_size += 1
+
+    property deck:
+        """The cards left in the deck"""
+        def __get__(self):
+            return cards.from_indexes(self.deck_cards[i]
+                                      for i in range(self.deck_size))
 
     def best_hand(self):
         """Returns the best hand possible given the cards the simulator knows about"""
@@ -34,41 +174,172 @@ cdef class HandSimulator:
         else:
             return self.hand, HandScore()
 
-    def simulate(self, int iterations, int hand_filter=-1, HandScore min_hand=HandScore()):
-        """Repeatedly run the simulation, return the % pot equity"""
-        cdef int i
-        cdef int tries = 0
-        cdef double wins = 0
+    def simulate(self, int iterations, int hand_filter=-1,
+                 HandScore min_hand=HandScore(), int num_opponents=1,
+                 OpponentRange opponents=None, Deadline deadline=None):
+        """Repeatedly run the simulation, return the % pot equity. With more
+        than one opponent they're all dealt from the same range and play the
+        same runout, split pots count as our share of the pot. Pass in
+        opponents to play a range of your own instead of the preflop filter.
+        Runouts where an opponent doesn't end up with at least min_hand don't
+        count, and if none of them do we fall back to ignoring min_hand.
+        With a deadline it stops early once that passes, last_tries says how
+        many tries the equity is from"""
+        cdef int min_strength = min_hand.strength()
+        cdef long attempts = 0
+        cdef long max_attempts = <long>iterations * MAX_REJECTS
+        cdef double result, wins = 0
+        if opponents is None:
+            opponents = self.opponent_range(hand_filter)
 
-        while iterations - tries > 0:
-            for i in xrange(0, iterations - tries):
-                result = self.__try_hand(hand_filter, min_hand)
-                if result != FAILED_TRY:
-                    wins += result
-                    tries += 1
+        self.last_tries = 0
+        if num_opponents < 1 or \
+          num_opponents * 2 > self.deck_size - self.cards_needed:
+            raise ValueError("can't deal to {} opponents".format(num_opponents))
+        if not opponents.size:
+            raise ValueError("empty opponent range")
+        while self.last_tries < iterations and attempts < max_attempts:
+            if deadline is not None and attempts % DEADLINE_CHECK == 0 \
+              and attempts and deadline.passed_c():
+                break
+            attempts += 1
+            if num_opponents == 1:
+                result = self.__try_hand(opponents, min_strength)
+            else:
+                result = self.__try_multiway(opponents, num_opponents,
+                                             min_strength)
+            if result == FAILED_TRY:
+                continue
+            wins += result
+            self.last_tries += 1
+
+        if not self.last_tries and iterations > 0 and attempts >= max_attempts:
+            # nothing they could have makes min_hand, fear them less
+            return self.simulate(iterations, hand_filter, HandScore(),
+                                 num_opponents, opponents, deadline)
+        if not self.last_tries:
+            return 0
+        return MathUtils.percentage(wins, self.last_tries)
 
+    cpdef OpponentRange opponent_range(HandSimulator self, int hand_filter=-1):
+        """The hole cards the opponent could have. Everything by default,
+        with a hand_filter the hands whose preflop equity passes it,
+        weighted by that equity since stronger hands raise more often. A
+        filter nothing passes falls back to everything. Built once per
+        filter"""
+        cdef int i, j, card1, card2
+        cdef bint use_filter = hand_filter > 0 and self.equity
+        cdef OpponentRange opponents
+
+        if hand_filter in self.ranges:
+            return self.ranges[hand_filter]
+        if use_filter:
+            self.__load_pair_equity()
+
+        opponents = OpponentRange()
+        for i in range(self.deck_size):
+            for j in range(i + 1, self.deck_size):
+                card1, card2 = self.deck_cards[i], self.deck_cards[j]
+                if not use_filter:
+                    opponents.add(card1, card2)
+                elif self.pair_equity[card1][card2] > hand_filter:
+                    opponents.add(card1, card2, self.pair_equity[card1][card2])
+        if not opponents.size:
+            opponents = self.opponent_range()
+        else:
+            opponents.build()
+        self.ranges[hand_filter] = opponents
+        return opponents
+
+    def exact_equity(self, int hand_filter=-1, HandScore min_hand=HandScore(),
+                     int max_to_come=2):
+        """Returns the % pot equity from every possible runout & opponent hand
+        in the range. Refuses to count more than max_to_come cards to come,
+        preflop (5 to come) takes minutes"""
+        cdef int i, j
+        cdef int picks[TABLE_SIZE]
+        cdef int min_strength = min_hand.strength()
+        cdef uint64_t runout
+        cdef double wins = 0, tries = 0
+        cdef OpponentRange opponents
+
+        if self.cards_needed > max_to_come:
+            raise ValueError("too many runouts to enumerate from {} table cards"
+                             .format(len(self.table_cards)))
+        opponents = self.opponent_range(hand_filter)
+
+        # walk every combination of cards_needed deck cards in order
+        for i in range(self.cards_needed):
+            picks[i] = i
+        while True:
+            runout = self.table_mask
+            for i in range(self.cards_needed):
+                runout |= index_mask(self.deck_cards[picks[i]])
+            self.__enumerate_opponents(runout, opponents, min_strength,
+                                       &wins, &tries)
+
+            i = self.cards_needed - 1
+            while i >= 0 and picks[i] == self.deck_size - self.cards_needed + i:
+                i -= 1
+            if i < 0:
+                break
+            picks[i] += 1
+            for j in range(i + 1, self.cards_needed):
+                picks[j] = picks[j - 1] + 1
+
+        if not tries and min_strength > HandScore().strength():
+            # nothing they could have makes min_hand, fear them less
+            return self.exact_equity(hand_filter, HandScore(), max_to_come)
         return MathUtils.percentage(wins, tries)
 
-    cdef double __try_hand(HandSimulator self, int hand_filter, HandScore min_hand):
-        """Deal out two opponent cards and 5 table cards"""
-        cdef int cards_needed
-        cdef handscore.HandScore our_score, their_score
+    cdef void __enumerate_opponents(HandSimulator self, uint64_t table_mask,
+                                    OpponentRange opponents, int min_strength,
+                                    double* wins, double* tries):
+        """Plays our hand against every opponent hand left on a full table
+        that makes at least min_strength"""
+        cdef int i, their_score
+        cdef uint64_t opponent_mask
+        cdef double weight
+        cdef int our_score = mask_strength(self.hand_mask | table_mask)
 
-        cdef list cards = random.sample(self.deck, 7)
-        cdef list opponent = cards[0:2]
+        for i in range(opponents.size):
+            opponent_mask = index_mask(opponents.card1[i]) \
+                | index_mask(opponents.card2[i])
+            if table_mask & opponent_mask:
+                continue
+            their_score = mask_strength(opponent_mask | table_mask)
+            if their_score < min_strength:
+                continue
+            weight = opponents.weight[i]
 
-        if hand_filter > 0 and self.equity and \
-          not self.passes_filter(opponent[0], opponent[1], hand_filter):
-            return FAILED_TRY
+            if our_score > their_score:
+                wins[0] += weight
+            elif our_score == their_score:
+                wins[0] += 0.5 * weight
+            tries[0] += weight
+
+    cdef double __try_hand(HandSimulator self, OpponentRange opponents,
+                           int min_strength):
+        """Draw the opponent's cards from their range, deal out the rest of
+        the table cards. FAILED_TRY if they end up short of min_strength"""
+        cdef int i, our_score, their_score
+        cdef uint64_t common_mask, opponent_mask
+        cdef int dealt[2]
+        cdef int slot = opponents.sample(self.rng)
 
-        cards_needed = 5 - len(self.table_cards)
-        common_cards = cards[2:(2+cards_needed)] + self.table_cards
+        dealt[0] = opponents.card1[slot]
+        dealt[1] = opponents.card2[slot]
+        self.__deal_runout(dealt, 2)
+        common_mask = self.table_mask
+        for i in range(self.cards_needed):
+            common_mask |= index_mask(self.deck_cards[i])
 
         # Find the best hand for each set of hole cards
-        _, their_score = HandBuilder(opponent + common_cards).find_hand()
-        if their_score < min_hand:
+        opponent_mask = index_mask(dealt[0]) | index_mask(dealt[1])
+        their_score = mask_strength(opponent_mask | common_mask)
+        if their_score < min_strength:
             return FAILED_TRY
-        _, our_score = HandBuilder(self.hand + common_cards).find_hand()
+        our_score = mask_strength(self.hand_mask | common_mask)
 
         # return our equity: fraction of the pot we won
         if our_score > their_score:
@@ -78,6 +349,102 @@ cdef class HandSimulator:
         else:
             return 0
 
+    cdef double __try_multiway(HandSimulator self, OpponentRange opponents,
+                               int num_opponents, int min_strength):
+        """Deals every opponent, then one runout for everybody. Returns our
+        share of the pot: nothing if anyone beats us, split with any ties.
+        FAILED_TRY if any of them end up short of min_strength"""
+        cdef int i, our_score
+        cdef int ties = 0
+        cdef uint64_t common_mask
+        cdef int dealt[2 * MAX_OPPONENTS]
+        cdef int their_scores[MAX_OPPONENTS]
+
+        self.__deal_opponents(opponents, dealt, num_opponents)
+        self.__deal_runout(dealt, 2 * num_opponents)
+        common_mask = self.table_mask
+        for i in range(self.cards_needed):
+            common_mask |= index_mask(self.deck_cards[i])
+
+        for i in range(num_opponents):
+            their_scores[i] = mask_strength(index_mask(dealt[2 * i])
+                                            | index_mask(dealt[2 * i + 1])
+                                            | common_mask)
+            if their_scores[i] < min_strength:
+                return FAILED_TRY
+
+        our_score = mask_strength(self.hand_mask | common_mask)
+        for i in range(num_opponents):
+            if their_scores[i] > our_score:
+                return 0
+            elif their_scores[i] == our_score:
+                ties += 1
+        return 1.0 / (1 + ties)
+
+    cdef void __deal_opponents(HandSimulator self, OpponentRange opponents,
+                               int* dealt, int num_opponents):
+        """Draws hole cards for each opponent that don't clash with anyone
+        dealt before them. If the range keeps clashing (it's tiny and the
+        table's full) that opponent gets any two cards left"""
+        cdef int i, attempt, slot, card1, card2
+        cdef uint64_t used = 0
+        cdef bint found
+
+        for i in range(num_opponents):
+            found = False
+            for attempt in range(DRAW_ATTEMPTS):
+                slot = opponents.sample(self.rng)
+                card1, card2 = opponents.card1[slot], opponents.card2[slot]
+                if not used & (index_mask(card1) | index_mask(card2)):
+                    found = True
+                    break
+            if not found:
+                self.rng.sample_indexes(self.deck_cards,
+                                        self.__set_aside(dealt, 2 * i), 2)
+                card1, card2 = self.deck_cards[0], self.deck_cards[1]
+            dealt[2 * i] = card1
+            dealt[2 * i + 1] = card2
+            used |= index_mask(card1) | index_mask(card2)
+
+    cdef void __deal_runout(HandSimulator self, int* dealt, int count) nogil:
+        """Deals the rest of the table into the front of the deck, around
+        the count hole cards already dealt"""
+        self.rng.sample_indexes(self.deck_cards, self.__set_aside(dealt, count),
+                                self.cards_needed)
+
+    cdef int __set_aside(HandSimulator self, int* dealt, int count) nogil:
+        """Moves the dealt cards to the back of the deck, returns how many
+        cards are left in front of them"""
+        cdef int i, j
+        cdef int end = self.deck_size
+        for i in range(count):
+            for j in range(end):
+                if self.deck_cards[j] == dealt[i]:
+                    end -= 1
+                    self.deck_cards[j] = self.deck_cards[end]
+                    self.deck_cards[end] = dealt[i]
+                    break
+        return end
+
+    cdef __load_pair_equity(HandSimulator self):
+        """Looks up the preflop equity of every pair of cards, once"""
+        cdef int i, j
+        cdef float pair
+        cdef cards.Card card1, card2
+        if self.has_pair_equity:
+            return
+        deck = cards.full_deck()
+        for i in range(DECK_SIZE):
+            for j in range(i + 1, DECK_SIZE):
+                card1, card2 = deck[i], deck[j]
+                if card1.value > card2.value:
+                    pair = self.equity.get(cards.simple(card1, card2), 0)
+                else:
+                    pair = self.equity.get(cards.simple(card2, card1), 0)
+                self.pair_equity[i][j] = pair
+                self.pair_equity[j][i] = pair
+        self.has_pair_equity = True
+
     cpdef bint passes_filter(HandSimulator self, cards.Card card1, cards.Card card2, int hand_filter):
         """Returns true if the hand's preflop equity is greater than the filter value"""
         cdef cards.Card high, low
@@ -1,6 +1,9 @@
+from libc.stdint cimport uint64_t
+
 cdef class HandScore:
     cdef public int type
     cdef public object kicker
+    cpdef int strength(self)
 
 cdef class HandBuilder:
     cdef list cards
@@ -9,3 +12,7 @@ cdef class HandBuilder:
     cpdef int select_flush_suit(self)
     cpdef bint is_straight(self)
     cpdef list __score_cards_to_ranks(self, HandScore score)
+    cdef int __flush_suit(self)
+
+cdef int mask_strength(uint64_t hand_mask) nogil
+cpdef int hand_strength(card_list)
@@ -1,9 +1,9 @@
 from cpython cimport array as c_array
+from libc.stdint cimport uint64_t
 from array import array
 cimport cython_util as util
 cimport cards
 import cards
-import itertools
 
 
 cdef enum:
@@ -52,14 +52,192 @@ cdef class HandScore:
     def __repr__(self):
         return '{self.type}, {self.kicker}'.format(self=self)
 
+    cpdef int strength(self):
+        """Returns the score packed into a single comparable integer, see
+        mask_strength. Short or missing kickers are padded with zeroes, which
+        keeps the ordering the same as comparing against full 5-card scores"""
+        cdef int i, value
+        cdef int packed = 0
+        if self.type == NO_SCORE:
+            return NO_SCORE
+
+        kicker = self.kicker or ()
+        for i in range(HAND_LENGTH):
+            value = 0
+            if i < len(kicker) and kicker[i] is not None:
+                value = kicker[i]
+            packed = (packed << 4) | value
+        return (self.type << KICKER_BITS) | packed
+
+    @staticmethod
+    def from_strength(int strength):
+        """Builds a HandScore from an integer made by mask_strength"""
+        cdef int i
+        score = HandScore()
+        if strength < 0:
+            return score
+        score.type = strength >> KICKER_BITS
+        score.kicker = tuple((strength >> (4 * i)) & 0xF
+                             for i in range(HAND_LENGTH - 1, -1, -1))
+        return score
+
     def __str__(self):
         return "{t}, {k}".format(t=TYPES[self.type + 1], k=self.kicker)
 
 cdef enum:
     HAND_LENGTH = 5
+    KICKER_BITS = 20 # 5 card values, 4 bits each
+    RANK_MASKS = 8192 # 2 ** 13, every subset of card values
 
 cdef c_array.array int_array_template = array('i', [])
 
+"""Rank-table hand evaluator
+
+Cards are packed into a 52 bit mask (see cards.cards_to_mask), 13 bits per
+suit with bit 0 for a two.
+The evaluator pulls out the per-suit rank masks and looks up straights and
+top cards in tables indexed by a 13-bit rank mask, so scoring 5, 6 or 7 cards
+costs the same handful of table lookups and never builds a HandScore.
+
+Strengths pack the hand type and 5 kicker values (4 bits each) into an int,
+so they compare exactly like the equivalent HandScore objects.
+"""
+
+# number of bits set in each rank mask
+cdef unsigned char BIT_COUNT[RANK_MASKS]
+# highest card of the best straight in each rank mask, 0 for no straight
+cdef unsigned char STRAIGHT_HIGH[RANK_MASKS]
+# the 5 highest card values in each rank mask, packed like a kicker
+cdef int TOP_FIVE[RANK_MASKS]
+
+cdef void _build_rank_tables():
+    cdef int mask, value, found, high
+    cdef int ace_low = (1 << 12) | 0xF # A-2-3-4-5
+
+    for mask in range(RANK_MASKS):
+        found = 0
+        TOP_FIVE[mask] = 0
+        for value in range(14, 1, -1):
+            if mask & (1 << (value - 2)):
+                if found < HAND_LENGTH:
+                    TOP_FIVE[mask] |= value << (4 * (HAND_LENGTH - 1 - found))
+                found += 1
+        BIT_COUNT[mask] = found
+
+        STRAIGHT_HIGH[mask] = 0
+        for high in range(14, 5, -1):
+            if (mask >> (high - 6)) & 0x1F == 0x1F:
+                STRAIGHT_HIGH[mask] = high
+                break
+        else:
+            if mask & ace_low == ace_low:
+                STRAIGHT_HIGH[mask] = 5
+
+_build_rank_tables()
+
+cdef inline int _top_cards(int mask, int count) nogil:
+    """The highest count card values in mask, packed at the bottom of an int"""
+    return TOP_FIVE[mask] >> (4 * (HAND_LENGTH - count))
+
+cdef inline int _high_value(int mask) nogil:
+    return TOP_FIVE[mask] >> (4 * (HAND_LENGTH - 1))
+
+cdef inline int _straight(int type, int high) nogil:
+    cdef int kicker
+    if high == 5: # Ace-low, sorted 5-4-3-2-A like score_hand does
+        kicker = 0x5432E
+    else:
+        kicker = (high << 16) | ((high - 1) << 12) | ((high - 2) << 8) \
+                 | ((high - 3) << 4) | (high - 4)
+    return (type << KICKER_BITS) | kicker
+
+cdef inline int _repeat(int value, int times) nogil:
+    cdef int i, packed = 0
+    for i in range(times):
+        packed = (packed << 4) | value
+    return packed
+
+cdef int mask_strength(uint64_t hand_mask) nogil:
+    """Scores the best 5-card hand out of a 5, 6 or 7 card mask"""
+    cdef int suit, suit_mask, high, top, second
+    cdef int any_of = 0, two_of = 0, three_of = 0, four_of
+    cdef int suits[4]
+
+    for suit in range(4):
+        suit_mask = (hand_mask >> (13 * suit)) & 0x1FFF
+        suits[suit] = suit_mask
+        # with 7 cards a flush can't share the table with quads or a boat
+        if BIT_COUNT[suit_mask] >= HAND_LENGTH:
+            high = STRAIGHT_HIGH[suit_mask]
+            if high:
+                return _straight(STRAIGHT_FLUSH, high)
+            return (FLUSH << KICKER_BITS) | TOP_FIVE[suit_mask]
+        three_of |= two_of & suit_mask
+        two_of |= any_of & suit_mask
+        any_of |= suit_mask
+    four_of = suits[0] & suits[1] & suits[2] & suits[3]
+
+    if four_of:
+        high = _high_value(four_of)
+        return (QUADS << KICKER_BITS) | (_repeat(high, 4) << 4) \
+            | _top_cards(any_of ^ (1 << (high - 2)), 1)
+
+    if three_of:
+        high = _high_value(three_of)
+        second = two_of ^ (1 << (high - 2))
+        if second:
+            second = _high_value(second)
+            return (FULL_HOUSE << KICKER_BITS) | (_repeat(high, 3) << 8) \
+                | _repeat(second, 2)
+
+    high = STRAIGHT_HIGH[any_of]
+    if high:
+        return _straight(STRAIGHT, high)
+
+    if three_of:
+        top = _high_value(three_of)
+        return (TRIPS << KICKER_BITS) | (_repeat(top, 3) << 8) \
+            | _top_cards(any_of ^ three_of, 2)
+
+    if two_of:
+        top = _high_value(two_of)
+        second = two_of ^ (1 << (top - 2))
+        if second:
+            second = _high_value(second)
+            return (TWO_PAIR << KICKER_BITS) | (_repeat(top, 2) << 12) \
+                | (_repeat(second, 2) << 4) \
+                | _top_cards(any_of ^ (1 << (top - 2)) ^ (1 << (second - 2)), 1)
+        return (PAIR << KICKER_BITS) | (_repeat(top, 2) << 12) \
+            | _top_cards(any_of ^ two_of, 3)
+
+    return (HIGH_CARD << KICKER_BITS) | TOP_FIVE[any_of]
+
+cpdef int hand_strength(card_list):
+    """Returns the strength of the best 5-card hand from 5 to 7 cards.
+    Bigger is better, and HandScore.from_strength turns it back into a score"""
+    if len(card_list) < HAND_LENGTH:
+        return NO_SCORE
+    return mask_strength(cards.cards_to_mask(card_list))
+
+def combo_strengths(long long start, int num_cards, int[:] out):
+    """Fills out with the strengths of the 5 to 7 card combinations numbered
+    start onwards, in colex order (see cards.colex_index)"""
+    cdef int combo[7]
+    cdef int i, j
+    cdef uint64_t mask
+    if num_cards < HAND_LENGTH or num_cards > 7:
+        raise ValueError("can only score 5 to 7 cards")
+    if start < 0 or start + out.shape[0] > cards.deck_combinations(num_cards):
+        raise ValueError("past the last {n} card combination".format(n=num_cards))
+    with nogil:
+        cards.colex_unrank(start, num_cards, combo)
+        for i in range(out.shape[0]):
+            mask = 0
+            for j in range(num_cards):
+                mask |= cards.index_mask(combo[j])
+            out[i] = mask_strength(mask)
+            cards.colex_next(combo, num_cards)
+
 cdef class HandBuilder:
     """Makes the best hand from a given set of cards, scores hands
     """
@@ -73,18 +251,36 @@ cdef class HandBuilder:
 
     def find_hand(self):
         """Returns the best hand & score of length HAND_LENGTH"""
+        cdef cards.Card card
+        cdef int suit = -1
         if self.length < HAND_LENGTH:
             return None, HandScore()
 
-        best_hand_score = HandScore()
-        best_hand = None
-        for hand in itertools.combinations(self.cards, HAND_LENGTH):
-            score = HandBuilder(list(hand)).score_hand()
-
-            if score > best_hand_score:
-                best_hand_score = score
-                best_hand = hand
-        return best_hand, best_hand_score
+        score = HandScore.from_strength(hand_strength(self.cards))
+        if score.type == FLUSH or score.type == STRAIGHT_FLUSH:
+            suit = self.__flush_suit()
+
+        # pull the cards that make up the score back out, in their original order
+        wanted = {}
+        for value in score.kicker:
+            wanted[value] = wanted.get(value, 0) + 1
+        best_hand = []
+        for card in self.cards:
+            if wanted.get(card.value) and (suit == -1 or card.suit == suit):
+                wanted[card.value] -= 1
+                best_hand.append(card)
+        return tuple(best_hand), score
+
+    cdef int __flush_suit(self):
+        """Returns the suit that at least HAND_LENGTH of our cards share"""
+        cdef cards.Card card
+        cdef int counts[4]
+        counts[:] = [0, 0, 0, 0]
+        for card in self.cards:
+            counts[card.suit] += 1
+            if counts[card.suit] >= HAND_LENGTH:
+                return card.suit
+        return -1
 
     def score_hand(self):
         """Returns the HandScore of a 5-card hand
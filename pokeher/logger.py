@@ -0,0 +1,95 @@
+import threading
+from collections import deque
+
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+OFF = 100
+
+
+class BotLogger(object):
+    """Levelled logging for the bot. Messages are format strings & their
+    arguments, only formatted once we know they'll be written, so a message
+    below the level costs a comparison.
+
+    write_lines(lines) gets the lines in batches. In the background (the
+    default) a writer thread does it, so a slow log never holds up a
+    decision. At most MAX_PENDING lines wait for the writer, past that
+    they're dropped & counted
+    """
+    MAX_PENDING = 1000
+
+    def __init__(self, write_lines, level=DEBUG, background=True):
+        self.write_lines = write_lines
+        self.level = level if write_lines else OFF
+        self.background = background
+        self.condition = threading.Condition()
+        self.pending = deque()
+        self.dropped = 0
+        self.writing = False
+        self.thread = None
+
+    def enabled(self, level):
+        return level >= self.level
+
+    def log(self, level, msg, *args, **kwargs):
+        if level < self.level:
+            return
+        if args or kwargs:
+            msg = msg.format(*args, **kwargs)
+        if not self.background:
+            self.write_lines([msg])
+            return
+        with self.condition:
+            if len(self.pending) >= self.MAX_PENDING:
+                self.dropped += 1
+                return
+            self.pending.append(msg)
+            self.__start()
+            self.condition.notify_all()
+
+    def debug(self, msg, *args, **kwargs):
+        self.log(DEBUG, msg, *args, **kwargs)
+
+    def info(self, msg, *args, **kwargs):
+        self.log(INFO, msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self.log(WARNING, msg, *args, **kwargs)
+
+    def error(self, msg, *args, **kwargs):
+        self.log(ERROR, msg, *args, **kwargs)
+
+    def flush(self):
+        """Waits until every line so far has been written"""
+        with self.condition:
+            while self.pending or self.writing:
+                self.condition.wait()
+
+    def __start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.__run, name="logger")
+            self.thread.daemon = True
+            self.thread.start()
+
+    def __run(self):
+        while True:
+            with self.condition:
+                while not self.pending:
+                    self.condition.wait()
+                lines = list(self.pending)
+                self.pending.clear()
+                if self.dropped:
+                    lines.append("dropped {} log lines".format(self.dropped))
+                    self.dropped = 0
+                self.writing = True
+            try:
+                self.write_lines(lines)
+            except (IOError, ValueError):
+                # nowhere left to log to
+                pass
+            finally:
+                with self.condition:
+                    self.writing = False
+                    self.condition.notify_all()
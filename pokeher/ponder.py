@@ -0,0 +1,169 @@
+from __future__ import division
+
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
+
+import cards
+import cython_random as random
+from hand_simulator import HandSimulator
+from simulator_pool import new_seed
+
+# daemon threads die noisily during interpreter shutdown, so stop them first
+_running = weakref.WeakSet()
+
+
+@atexit.register
+def _stop_all():
+    for ponderer in list(_running):
+        ponderer.stop()
+
+
+class Situation(object):
+    """Something the next decision might have to simulate, and how many
+    trials it's worth running ahead of time"""
+    def __init__(self, hand, table_cards, hand_filter, min_hand,
+                 num_opponents=1, tries=20000):
+        self.hand = hand
+        self.table_cards = list(table_cards)
+        self.hand_filter = hand_filter
+        self.min_hand = min_hand
+        self.num_opponents = num_opponents
+        self.tries = tries
+        self.key = situation_key(hand, table_cards, hand_filter, min_hand,
+                                 num_opponents)
+
+
+def situation_key(hand, table_cards, hand_filter, min_hand, num_opponents):
+    return (tuple(cards.to_indexes([hand.high, hand.low])),
+            tuple(cards.to_indexes(table_cards)), hand_filter,
+            min_hand.strength(), num_opponents)
+
+
+class Ponderer(object):
+    """Simulates on a background thread while we wait on the opponent. The
+    brain plans the situations its next decision is likely to need, results
+    pile up as chunks of (% equity, tries) and get handed over with take().
+    The thread sits still while paused, so it never slows a decision down
+    """
+    CHUNK_SIZE = 1000
+
+    def __init__(self, preflop_equity):
+        self.preflop_equity = preflop_equity
+        self.rng = random.Random(new_seed())
+        self.condition = threading.Condition()
+        self.situations = []
+        self.results = {}
+        self.simulators = {}
+        self.pause_count = 0
+        self.stopped = False
+        self.thread = None
+
+    def plan(self, situations):
+        """Replaces the work queue, highest priority first. Results for
+        situations that are still planned are kept"""
+        with self.condition:
+            self.situations = list(situations)
+            keys = set(situation.key for situation in self.situations)
+            self.results = dict((key, chunks) for key, chunks
+                                in self.results.items() if key in keys)
+            boards = set(key[:2] for key in keys)
+            self.simulators = dict((board, simulator) for board, simulator
+                                   in self.simulators.items() if board in boards)
+            self.__start()
+            self.condition.notify()
+
+    def take(self, hand, table_cards, hand_filter, min_hand, num_opponents=1):
+        """The chunks simulated for a situation so far, which stop there"""
+        key = situation_key(hand, table_cards, hand_filter, min_hand,
+                            num_opponents)
+        with self.condition:
+            self.situations = [situation for situation in self.situations
+                               if situation.key != key]
+            return self.results.pop(key, [])
+
+    @contextmanager
+    def paused(self):
+        """Holds the thread still, e.g. while making a decision"""
+        with self.condition:
+            self.pause_count += 1
+        try:
+            yield
+        finally:
+            with self.condition:
+                self.pause_count -= 1
+                self.condition.notify()
+
+    def stop(self):
+        """Stops the thread & drops everything planned, e.g. when the hand
+        is over. The next plan() starts it up again"""
+        if self.thread is None:
+            return
+        with self.condition:
+            self.stopped = True
+            self.situations = []
+            self.results = {}
+            self.simulators = {}
+            self.condition.notify()
+        self.thread.join()
+        self.thread = None
+        self.stopped = False
+        _running.discard(self)
+
+    def __start(self):
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.__run,
+                                           name="ponderer")
+            self.thread.daemon = True
+            self.thread.start()
+            _running.add(self)
+
+    def __next_situation(self):
+        """The first planned situation that still wants trials"""
+        for situation in self.situations:
+            done = sum(tries for _, tries in
+                       self.results.get(situation.key, []))
+            if done < situation.tries:
+                return situation
+        return None
+
+    def __run(self):
+        while True:
+            with self.condition:
+                situation = None
+                while not self.stopped:
+                    if not self.pause_count:
+                        situation = self.__next_situation()
+                        if situation:
+                            break
+                    self.condition.wait()
+                if self.stopped:
+                    return
+                simulator = self.__simulator(situation)
+
+            try:
+                equity = simulator.simulate(self.CHUNK_SIZE,
+                                            situation.hand_filter,
+                                            situation.min_hand,
+                                            situation.num_opponents)
+            except ValueError:
+                # more opponents than the deck can deal to, give up on it
+                with self.condition:
+                    self.situations = [planned for planned in self.situations
+                                       if planned is not situation]
+                continue
+            with self.condition:
+                # only keep it if the situation's still wanted
+                if any(planned.key == situation.key
+                       for planned in self.situations):
+                    self.results.setdefault(situation.key, []) \
+                        .append((equity, self.CHUNK_SIZE))
+
+    def __simulator(self, situation):
+        board = situation.key[:2]
+        if board not in self.simulators:
+            self.simulators[board] = HandSimulator(
+                situation.hand, situation.table_cards, self.preflop_equity,
+                self.rng)
+        return self.simulators[board]
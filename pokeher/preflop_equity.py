@@ -1,14 +1,55 @@
-from __future__ import print_function
+from __future__ import division, print_function
 import cPickle as pickle
+import os
+
+import numpy as np
+
+import cards
+import constants as C
 import utility
+from data_table import DataTable
+
+
+def canonical_hands():
+    """One Hand for each of the 169 preflop hands that differ by more than
+    their suits: pairs, then suited & unsuited for every other two values"""
+    hands = []
+    for high in range(C.ACE, 1, -1):
+        for low in range(high, 1, -1):
+            hands.append(cards.Hand(cards.Card(high, C.CLUBS),
+                                    cards.Card(low, C.DIAMONDS)))
+            if low != high:
+                hands.append(cards.Hand(cards.Card(high, C.CLUBS),
+                                        cards.Card(low, C.CLUBS)))
+    return hands
+
+
+HANDS = [hand.simple() for hand in canonical_hands()]
+INDEX = dict((simple, i) for i, simple in enumerate(HANDS))
 
 
 class PreflopEquity(object):
-    """Mapping of Hand.simple() -> win % for preflop two card hands"""
-    def __init__(self, data_file='preflop_wins_50000.pickle', log_func=None):
+    """Mapping of Hand.simple() -> win % for preflop two card hands
+
+    Table sections:
+      wins: float32 win % for each hand, in canonical_hands() order
+    Falls back to the older pickled dict when there's no table
+    """
+    KIND = b'preflop'
+    VERSION = 1
+
+    def __init__(self, data_file='preflop_wins_50000.table', log_func=None):
         if log_func is None:
             log_func = self.print_log
         self.data = {}
+        table = DataTable(data_file, self.KIND, self.VERSION, log_func)
+        if table.load():
+            self.data = dict(zip(HANDS, table.get('wins').tolist()))
+        else:
+            self.__load_pickle(os.path.splitext(data_file)[0] + '.pickle',
+                               log_func)
+
+    def __load_pickle(self, data_file, log_func):
         infile = utility.get_data_file(data_file)
         try:
             in_stream = open(infile, 'r')
@@ -20,6 +61,75 @@ class PreflopEquity(object):
         except IOError as e:
             log_func("IO error loading {f} (e={e})".format(f=infile, e=e))
 
+    @classmethod
+    def write(cls, out_stream, wins):
+        """Writes a table file, wins is {Hand.simple(): win %}"""
+        DataTable.write(out_stream, cls.KIND, cls.VERSION, [
+            ('wins', np.array([wins[simple] for simple in HANDS], dtype='<f4')),
+        ])
+
     @staticmethod
     def print_log(what):
         print(what)
+
+
+class PreflopMatchups(object):
+    """Head to head % equity of every preflop hand against every other, as a
+    169x169 matrix in canonical_hands() order. Mapped on first use.
+    See standalone/preflop_matchups.py
+
+    Table sections:
+      equities: float32 [our hand][their hand]
+    """
+    KIND = b'matchups'
+    VERSION = 2
+    HANDS = HANDS
+    INDEX = INDEX
+    # how many two card combos make each hand: 6 pairs, 4 suited, 12 unsuited
+    COMBOS = np.array([6 if hand.is_pair() else 4 if hand.is_suited() else 12
+                       for hand in canonical_hands()], dtype=np.float64)
+
+    def __init__(self, data_file='preflop_matchups.matrix', log_func=None):
+        if log_func is None:
+            log_func = PreflopEquity.print_log
+        self.table = DataTable(data_file, self.KIND, self.VERSION, log_func)
+
+    @property
+    def equities(self):
+        return self.table.get('equities')
+
+    def loaded(self):
+        return self.table.load()
+
+    def matchup(self, hand, other):
+        """% equity of one Hand against another"""
+        return float(self.equities[self.INDEX[hand.simple()],
+                                   self.INDEX[other.simple()]])
+
+    def range_equity(self, hand, weights):
+        """% equity of hand against a range: weights has one entry per
+        preflop hand, each hand counts for its weight times its combos.
+        Ignores the cards our hand takes out of the range"""
+        weights = np.asarray(weights, dtype=np.float64) * self.COMBOS
+        total = weights.sum()
+        if not total:
+            return 0
+        row = self.equities[self.INDEX[hand.simple()]]
+        return float(np.dot(row, weights) / total)
+
+    @classmethod
+    def filter_weights(cls, preflop_equity, hand_filter):
+        """The range left by a preflop hand filter: weight 1 for the hands
+        whose win % beats hand_filter, 0 for the rest"""
+        return np.array([1 if preflop_equity.get(simple, 0) > hand_filter else 0
+                         for simple in cls.HANDS], dtype=np.float64)
+
+    @classmethod
+    def write(cls, out_stream, equities):
+        """Writes a matrix file, equities is [our hand][their hand]"""
+        equities = np.asarray(equities, dtype='<f4')
+        if equities.shape != (len(cls.HANDS), len(cls.HANDS)):
+            raise ValueError("matchups need to be {n}x{n}"
+                             .format(n=len(cls.HANDS)))
+        DataTable.write(out_stream, cls.KIND, cls.VERSION,
+                        [('equities', equities)])
@@ -0,0 +1,126 @@
+from __future__ import division
+
+import multiprocessing
+import os
+import time
+
+import cards
+import cython_random as random
+from clock import Deadline
+from hand_simulator import HandSimulator
+from handscore import HandScore
+
+"""
+Runs HandSimulator across every core. Worker processes get started once, load
+the preflop equity once and each take their own random stream: the pool's seed
+jumped ahead once more than the last worker's, so no two streams overlap
+"""
+
+_preflop_equity = {}
+
+
+def new_seed():
+    return (int(time.time() * 1000000) ^ (os.getpid() << 32)) \
+        & 0xFFFFFFFFFFFFFFFF
+
+
+def seed_worker(seed, streams_taken):
+    """Pool initializer: gives each worker process its own random stream.
+    streams_taken is a shared multiprocessing.Value('i')"""
+    with streams_taken.get_lock():
+        streams_taken.value += 1
+        stream = streams_taken.value
+
+    random.seed(seed)
+    rng = random.default_stream()
+    for _ in range(stream):
+        rng.jump()
+
+
+def _init_worker(preflop_equity, seed, streams_taken):
+    global _preflop_equity
+    _preflop_equity = preflop_equity
+    seed_worker(seed, streams_taken)
+
+
+def _simulate(hand_indexes, table_indexes, iterations, hand_filter,
+              min_strength, deadline, step_size, num_opponents=1):
+    """Simulates in step_size chunks until it runs iterations or passes the
+    deadline, which the simulator checks as it goes. Returns (% equity,
+    number of tries)"""
+    high, low = cards.from_indexes(hand_indexes)
+    simulator = HandSimulator(cards.Hand(high, low),
+                              cards.from_indexes(table_indexes),
+                              _preflop_equity)
+    min_hand = HandScore.from_strength(min_strength)
+
+    wins = 0
+    tries = 0
+    while tries < iterations and not deadline.passed():
+        step = min(step_size, iterations - tries)
+        equity = simulator.simulate(step, hand_filter, min_hand, num_opponents,
+                                    deadline=deadline)
+        wins += equity * simulator.last_tries
+        tries += simulator.last_tries
+    if not tries:
+        return 0, 0
+    return wins / tries, tries
+
+
+class SimulatorPool(object):
+    """A persistent pool of simulation worker processes"""
+    RESULT_GRACE_SECS = 0.02
+
+    def __init__(self, preflop_equity, processes=None, seed=None):
+        if processes is None:
+            processes = multiprocessing.cpu_count()
+        if seed is None:
+            seed = new_seed()
+        self.processes = processes
+        self.streams_taken = multiprocessing.Value('i', 0)
+        self.pool = multiprocessing.Pool(
+            processes, _init_worker,
+            (preflop_equity, seed & 0xFFFFFFFFFFFFFFFF, self.streams_taken))
+
+    def simulate(self, hand, table_cards, iterations, hand_filter, min_hand,
+                 deadline, step_size=1000, num_opponents=1):
+        """Splits iterations across the workers, returns the merged
+        (% equity, number of tries)"""
+        wins = 0
+        tries = 0
+        for equity, count in self.simulate_chunks(
+                hand, table_cards, iterations, hand_filter, min_hand,
+                deadline, step_size, num_opponents):
+            wins += equity * count
+            tries += count
+        if not tries:
+            return 0, 0
+        return wins / tries, tries
+
+    def simulate_chunks(self, hand, table_cards, iterations, hand_filter,
+                        min_hand, deadline, step_size=1000,
+                        num_opponents=1):
+        """Splits iterations across the workers, returns a list of
+        (% equity, number of tries) from each worker that finished before
+        the deadline (a clock.Deadline)"""
+        args = (list(cards.to_indexes([hand.high, hand.low])),
+                list(cards.to_indexes(table_cards)),
+                -(-iterations // self.processes), hand_filter,
+                min_hand.strength(), deadline, step_size, num_opponents)
+        results = [self.pool.apply_async(_simulate, args)
+                   for _ in range(self.processes)]
+
+        # workers stop on the deadline, their results get RESULT_GRACE_SECS
+        # to arrive, all together
+        cutoff = Deadline.at(deadline.end + self.RESULT_GRACE_SECS)
+        chunks = []
+        for result in results:
+            try:
+                chunks.append(result.get(cutoff.secs_left()))
+            except multiprocessing.TimeoutError:
+                continue
+        return [chunk for chunk in chunks if chunk[1]]
+
+    def close(self):
+        self.pool.terminate()
+        self.pool.join()
@@ -1,76 +1,94 @@
-import re
-from cards import Card
+from cards import Card, full_deck
 import constants as C
 from actions import GameAction
 from wiring import Parser, GameParserDelegate
 
 
-class CardBuilder(object):
-    """Creates our internal cards from text strings"""
-
-    VALUE_MAP = {'T': 10, 'J': C.JACK, 'Q': C.QUEEN, 'K': C.KING, 'A': C.ACE}
-    SUIT_MAP = {'c': C.CLUBS, 'd': C.DIAMONDS, 'h': C.HEARTS, 's': C.SPADES}
+# 2-char theaigames card -> Card, Cards are immutable so they're shared
+CARDS = dict((card.aigames_str(), card) for card in full_deck())
 
-    CARD_REGEXP = r'.*\[(([2-9TJQKA][cdhs],?)+)\].*'
 
-    def from_2char(self, string):
-        """Returns a Card from a 2-char token like 9c"""
-        if not string or len(string) != 2:
+def parse_card_list(token):
+    """Returns a list of Cards from a token like [Ah,9d], or None"""
+    if not token or token[0] != '[' or token[-1] != ']':
+        return None
+    results = []
+    for card_str in token[1:-1].split(','):
+        card = CARDS.get(card_str)
+        if card is None:
             return None
+        results.append(card)
+    return results
 
-        value, suit = string[0], string[1]
-        mapped_value = self.VALUE_MAP.get(value)
-        if not mapped_value:
-            mapped_value = int(value)
-        mapped_suit = self.SUIT_MAP.get(suit)
 
-        try:
-            return Card(mapped_value, mapped_suit)
-        except:
-            return None
+def parse_int(value, default=None):
+    try:
+        return int(value)
+    except ValueError:
+        return default
 
-    def from_list(self, token_string):
-        """Returns a list of Cards from a string token like [Ah,9d]"""
-        if not token_string:
-            return None
 
-        match = re.match(self.CARD_REGEXP, (token_string))
-        if not match or not match.group(1):
+def build_routes(handlers):
+    """Compiles (first word, second word) -> handler pairs into the nested
+    tables dispatch() looks lines up in. A word of None matches anything:
+    specific routes beat (token, None), which beats (None, key)"""
+    routes = {None: {}}
+    for (token, key), handler in handlers.items():
+        routes.setdefault(token, {})[key] = handler
+    return routes
+
+
+def dispatch(routes, line):
+    """Hands a line to its handler by its first two words, returns whether
+    it was handled"""
+    words = line.split()
+    if not words:
+        return False
+    key = words[1] if len(words) > 1 else ""
+    by_key = routes.get(words[0])
+    handler = by_key and (by_key.get(key) or by_key.get(None))
+    if not handler:
+        handler = routes[None].get(key)
+        if not handler:
+            return False
+    return handler(words[0], key, words[2] if len(words) > 2 else "")
+
+
+class CardBuilder(object):
+    """Creates our internal cards from text strings"""
+
+    def from_2char(self, string):
+        """Returns a Card from a 2-char token like 9c"""
+        if not string:
             return None
-        cards = match.group(1).split(',')
+        return CARDS.get(string)
 
-        results = []
-        for card in cards:
-            result = self.from_2char(card)
-            if result:
-                results.append(result)
-        return results
+    def from_list(self, token_string):
+        """Returns a list of Cards from a string token like [Ah,9d]"""
+        return parse_card_list(token_string)
 
     def is_card_list(self, string):
-        """Returns true if the string matches the card regexp, or False"""
-        if not string:
-            return False
-        return re.match(self.CARD_REGEXP, string) is not None
+        """Returns true if the string is a list of cards"""
+        return parse_card_list(string) is not None
 
 
 class AiGameParser(Parser):
-    """Base class for the other STDIN parsers"""
+    """Base class for the other STDIN parsers. ROUTES are the lines handled,
+    see dispatch(), with the name of the method handling them. Handlers turn
+    the values into ints & cards and send them on as events"""
+    ROUTES = {}
+
+    def __init__(self, events):
+        Parser.__init__(self, events)
+        self.handlers = dict((route, getattr(self, name))
+                             for route, name in self.ROUTES.items())
+        self.routes = build_routes(self.handlers)
+
     def handle_line(self, line):
         """Return whether this parser fully handled the input line"""
         if not line:
             return False
-
-        token, key, value = self.__unpack_line(line)
-        return self._handle_line(token, key, value)
-
-    def __unpack_line(self, line):
-        words = line.split()
-        while len(words) < 3:
-            words.append("")
-        return words[0], words[1], words[2]
-
-    def _handle_line(self, token, key, line):
-        return False
+        return dispatch(self.routes, line)
 
 
 class SettingsParser(AiGameParser):
@@ -78,33 +96,47 @@ class SettingsParser(AiGameParser):
     Parses the following lines from an input stream
       Settings gameType NLHE (ignored)
       Settings gameMode tournament (ignored)
-      Settings time_bank 5000 (ignored)
       Settings hands_per_level 10 (ignored)
 
+      Settings time_bank 5000
       Settings time_per_move 500
       bot_0 seat 0
       bot_1 seat 1
       Settings your_bot bot_0
     """
     START_TOKEN = 'Settings'
-    HANDLED_KEYS = ['your_bot', 'time_per_move']
+    ROUTES = {
+        (None, 'seat'): '_handle_seat',
+        (None, 'post'): '_handle_seat',
+        (START_TOKEN, 'your_bot'): '_handle_your_bot',
+        (START_TOKEN, 'time_bank'): '_handle_time_bank',
+        (START_TOKEN, 'time_per_move'): '_handle_time_per_move',
+        # No other parsers need these lines
+        (START_TOKEN, None): '_handle_ignored',
+    }
 
-    def _handle_line(self, token, key, value):
+    def _handle_seat(self, token, key, value):
         # Just pull out any active bots, don't worry about seats yet
-        if key in ['seat', 'post']:
-            if not 'bots' in self._data:
-                self._data['bots'] = [token]
-            elif not token in self._data['bots']:
-                self._data['bots'].append(token)
-            return True
-
-        if token != self.START_TOKEN:
-            return False
+        self._events.on_seat(token)
+        return True
 
-        if key in self.HANDLED_KEYS:
-            self._data[key] = value
+    def _handle_your_bot(self, token, key, value):
+        self._events.on_your_bot(value)
+        return True
 
-        # No other parsers need these lines
+    def _handle_time_bank(self, token, key, value):
+        ms = parse_int(value)
+        if ms is not None:
+            self._events.on_time_bank(ms)
+        return True
+
+    def _handle_time_per_move(self, token, key, value):
+        ms = parse_int(value)
+        if ms is not None:
+            self._events.on_time_per_move(ms)
+        return True
+
+    def _handle_ignored(self, token, key, value):
         return True
 
 
@@ -117,23 +149,40 @@ class RoundParser(AiGameParser):
       Match on_button bot_0
     """
     TOKEN = 'Match'
-    KEYS = ['round', 'small_blind', 'big_blind', 'on_button']
+    ROUTES = {
+        (TOKEN, 'round'): '_handle_round',
+        (TOKEN, 'small_blind'): '_handle_small_blind',
+        (TOKEN, 'big_blind'): '_handle_big_blind',
+        (TOKEN, 'on_button'): '_handle_button',
+    }
+
+    def _handle_round(self, token, key, value):
+        number = parse_int(value)
+        if number is not None:
+            self._events.on_round(number)
+        return True
 
-    def _handle_line(self, token, key, value):
-        if token != self.TOKEN:
-            return False
+    def _handle_small_blind(self, token, key, value):
+        amount = parse_int(value)
+        if amount is not None:
+            self._events.on_small_blind(amount)
+        return True
 
-        if not key or not key in self.KEYS:
-            return False
+    def _handle_big_blind(self, token, key, value):
+        amount = parse_int(value)
+        if amount is not None:
+            self._events.on_big_blind(amount)
+        return True
 
-        self._data[key] = value
+    def _handle_button(self, token, key, value):
+        self._events.on_button(value)
         return True
 
 
 class TurnParser(AiGameParser):
     """
     Info before we have to make a decision
-      bot_1 fold 0 (ignored)
+      bot_1 fold 0
 
       bot_0 stack 1500
       bot_1 stack 1500
@@ -148,73 +197,103 @@ class TurnParser(AiGameParser):
       Match table [Tc,8d,9c]
       Action bot_0 5000
     """
-    BOT_DATA = ['raise', 'call', 'wins', 'check', 'hand', 'post', 'stack']
     BET_VERBS = ['raise', 'call', 'post']
-    IGNORED_ACTIONS = ['fold']
-
-    def __init__(self, data, goCallback):
-        self._data = data
+    ROUTES = dict([((None, verb), '_handle_bet') for verb in BET_VERBS] + [
+        ((None, 'stack'), '_handle_stack'),
+        ((None, 'check'), '_handle_check'),
+        ((None, 'hand'), '_handle_hand'),
+        ((None, 'wins'), '_handle_wins'),
+        ((None, 'fold'), '_handle_fold'),
+        (('Match', 'table'), '_handle_table'),
+        (('Match', 'max_win_pot'), '_handle_pot'),
+        (('Match', 'amount_to_call'), '_handle_amount_to_call'),
+        # sidepots etc, nothing we use
+        (('Match', None), '_handle_ignored'),
+        (('Action', None), '_handle_action'),
+    ])
+
+    def __init__(self, events, goCallback):
+        AiGameParser.__init__(self, events)
         self._goCallback = goCallback
 
-    def _handle_line(self, token, key, value):
-        parser = CardBuilder()
-        if parser.is_card_list(value):
-            value = parser.from_list(value)
-
-        # check for a 'wins' statement, make note of it
-        if key == 'wins':
-            self._data['roundOver'] = True
-
-        # Save the data as (key, bot_x) = value
-        if key in self.BOT_DATA:
-            if not 'bots' in self._data:
-                self._data['bots'] = [token]
-            else:
-                self._data['bots'].append(token)
-
-            if key in self.BET_VERBS:
-                try:
-                    value_int = int(value)
-                except:
-                    value_int = 0
-                bet_tuple = ('bet', token)
-                current_bet = self._data.get(bet_tuple, 0)
-                self._data[bet_tuple] = current_bet + value_int
-            else:
-                self._data[(key, token)] = value
-            return True
-
-        # Ignored stuff
-        elif key in self.IGNORED_ACTIONS:
-            return True
-
-        elif token == 'Match':
-            if key == 'max_win_pot':
-                self._data['pot'] = value
-            else:
-                self._data[key] = value
-            return True
-
-        elif token == 'Action':
-            if self._goCallback:
-                try:
-                    int_val = int(value)
-                except:
-                    int_val = 500
-                self._goCallback(key, int_val)
-                return True
+    def _handle_bet(self, token, key, value):
+        self._events.on_seat(token)
+        self._events.on_bet(token, parse_int(value, 0))
+        return True
 
-        return False
+    def _handle_stack(self, token, key, value):
+        self._events.on_seat(token)
+        self._events.on_stack(token, parse_int(value, 0))
+        return True
+
+    def _handle_check(self, token, key, value):
+        self._events.on_seat(token)
+        return True
+
+    def _handle_hand(self, token, key, value):
+        self._events.on_seat(token)
+        cards = parse_card_list(value)
+        if cards and len(cards) == 2:
+            self._events.on_hand(token, cards)
+        return True
+
+    def _handle_wins(self, token, key, value):
+        self._events.on_seat(token)
+        self._events.on_round_over(token, parse_int(value, 0))
+        return True
+
+    def _handle_fold(self, token, key, value):
+        self._events.on_fold(token)
+        return True
+
+    def _handle_table(self, token, key, value):
+        cards = parse_card_list(value)
+        if cards is not None:
+            self._events.on_table(cards)
+        return True
+
+    def _handle_pot(self, token, key, value):
+        amount = parse_int(value)
+        if amount is not None:
+            self._events.on_pot(amount)
+        return True
+
+    def _handle_amount_to_call(self, token, key, value):
+        amount = parse_int(value)
+        if amount is not None:
+            self._events.on_amount_to_call(amount)
+        return True
+
+    def _handle_ignored(self, token, key, value):
+        return True
+
+    def _handle_action(self, token, key, value):
+        if not self._goCallback:
+            return False
+        self._goCallback(key, parse_int(value, 500))
+        return True
 
 
 class TheAiGameParserDelegate(GameParserDelegate):
-    def set_up_parser(self, data, turn_callback):
-        """Links the workers & callback up from the Brain"""
-        self.workers = [SettingsParser(data),
-                        RoundParser(data),
-                        TurnParser(data, turn_callback), ]
+    def set_up_parser(self, events, turn_callback):
+        """Links the workers & callback up from the Brain, the workers send
+        what they parse to events (a GameEvents)"""
+        self.workers = [SettingsParser(events),
+                        RoundParser(events),
+                        TurnParser(events, turn_callback), ]
+        # one table for every worker, earlier workers win a route
+        handlers = {}
+        for worker in reversed(self.workers):
+            handlers.update(worker.handlers)
+        self.routes = build_routes(handlers)
         return self
 
+    def handle_line(self, line):
+        """Dispatches the line straight to the worker that handles it"""
+        if not line:
+            return False
+        return dispatch(self.routes, line)
+
 
 class TheAiGameActionDelegate(object):
     def bet(self, amount):
@@ -0,0 +1,61 @@
+from __future__ import division
+
+from clock import Deadline
+
+
+class TurnBudget(object):
+    """How long a decision gets. Simulation runs to the deadline, and on to
+    close_call_deadline if the equity is still too close to call. weight
+    scales how many trials a decision is worth"""
+    def __init__(self, ms, close_call_ms, weight):
+        self.ms = ms
+        self.close_call_ms = close_call_ms
+        self.weight = weight
+        self.deadline = Deadline.from_ms(ms)
+        self.close_call_deadline = Deadline.from_ms(close_call_ms)
+
+
+class TimeBank(object):
+    """Mix-in for the Brain, deciding how much of the time bank a decision
+    spends. Every move adds time_per_move to the bank, so that's what we can
+    spend on average: later streets & pots with more of our stack in them
+    get more of it, close calls can dig into the bank, but never past
+    RESERVE_MS"""
+    # time kept back from every decision, for deciding & answering
+    DEADLINE_MARGIN_MS = 50
+    # bank that's left alone in case the engine or the machine is slow
+    RESERVE_MS = 1000
+    # by number of table cards
+    STREET_WEIGHTS = {0: 0.5, 3: 1, 4: 1.25, 5: 1.5}
+    MIN_WEIGHT = 0.25
+    # how much longer than its share a close call can go on
+    CLOSE_CALL_FACTOR = 3
+
+    def turn_weight(self):
+        """How much of a move's time this decision is worth, ~0.25 for
+        blinds preflop up to ~3 for most of our stack on the river"""
+        street = self.STREET_WEIGHTS.get(len(self.data.table_cards), 1)
+        stack = self.data.stacks.get(self.data.me, 0)
+        at_stake = self.data.pot + min(self.data.to_call, stack)
+        committed = at_stake / (at_stake + stack) if at_stake + stack else 0
+        return max(street * (0.5 + 1.5 * committed), self.MIN_WEIGHT)
+
+    def allocate_time(self, total_time_left_ms):
+        """Splits up the time bank for a decision, returns a TurnBudget"""
+        per_move = min(total_time_left_ms, self.data.time_per_move)
+        # this move's own time is always ours to spend, the bank only down
+        # to the reserve
+        available = max(total_time_left_ms - self.RESERVE_MS, per_move) \
+            - self.DEADLINE_MARGIN_MS
+        available = max(available, 0)
+
+        weight = self.turn_weight()
+        ms = per_move * weight
+        close_call_ms = ms * self.CLOSE_CALL_FACTOR
+        # anything over the bank's limit after the next refill is lost anyway
+        if self.data.time_bank:
+            overflow = total_time_left_ms + self.data.time_per_move \
+                - self.data.time_bank
+            close_call_ms = max(close_call_ms, overflow)
+        ms = min(ms, available)
+        return TurnBudget(ms, max(min(close_call_ms, available), ms), weight)
@@ -1,14 +1,14 @@
-import time
+from clock import monotonic
 
 
 class Timer(object):
-    """Simple timer using a with block"""
+    """Simple timer using a with block, times wall clock seconds"""
     def __init__(self):
         pass
 
     def __enter__(self):
-        self.start = time.clock()
+        self.start = monotonic()
         return self
 
     def __exit__(self, *args):
-        self.secs = time.clock() - self.start
+        self.secs = monotonic() - self.start
@@ -1,15 +1,24 @@
-import time
+import errno
+import os
+import select
+
+import logger
 
 
 class IOPokerBot(object):
     """Generic Poker Bot, can read & write lines.
     Subclasses should mix-in parser & action delegates
     """
+    READ_SIZE = 4096
+    # messages below this level aren't even formatted
+    LOG_LEVEL = logger.DEBUG
+
     def __init__(self, io_input, io_output, log_output):
-        self.no_logging = False
         self.io_input = io_input
         self.action_out = io_output
         self.log_out = log_output
+        self.logger = self.make_logger()
+        self.brain = None
         self.add_brain()
 
     def add_brain(self):
@@ -17,30 +26,97 @@ class IOPokerBot(object):
         pass
 
     def run(self):
-        """ Main run loop """
+        """ Main run loop, until the input runs out """
+        try:
+            for line in self.read_lines():
+                self.__parse_line(line)
+        finally:
+            self.close()
+            self.flush_log()
+
+    def close(self):
+        """Lets the brain clean up once the match is over"""
+        close = getattr(self.brain, 'close', None)
+        if close:
+            close()
+
+    def __parse_line(self, rawline):
+        try:
+            self.brain.parse_line(rawline.strip())
+        except Exception as e:
+            self.logger.error("main loop exception of type '{}' msg='{}', "
+                              "args='{}'", type(e).__name__, e.message, e.args)
+            if self.brain:
+                self.brain.bot.check()
+
+    def read_lines(self):
+        """Yields lines as soon as they arrive. Blocks until there's input
+        rather than polling"""
+        try:
+            fd = self.io_input.fileno()
+        except (AttributeError, IOError, ValueError):
+            # not a real file, nothing to wait on
+            for line in iter(self.io_input.readline, ''):
+                yield line
+            return
+
+        pending = ''
         while True:
             try:
-                rawline = self.io_input.readline()
-                if len(rawline) == 0:
-                    time.sleep(0.001) # sleep for 1ms
+                readable, _, _ = select.select([fd], [], [])
+            except select.error as e:
+                if e.args[0] == errno.EINTR:
+                    # a signal woke us up, go back to waiting
                     continue
-                line = rawline.strip()
-                self.brain.parse_line(line)
-            except Exception as e:
-                self.log("main loop exception of type '{}' msg='{}', args='{}'"
-                         .format(type(e).__name__, e.message, e.args))
-                if self.brain:
-                    self.brain.bot.check()
+                raise
+            if not readable:
+                continue
+            # os.read so no lines hide in a file buffer select can't see
+            chunk = os.read(fd, self.READ_SIZE)
+            if not chunk:
+                break
+            lines = (pending + chunk).split('\n')
+            pending = lines.pop()
+            for line in lines:
+                yield line
+        if pending:
+            yield pending
 
     def say(self, line):
         """Writes a line where the game controller can see it"""
         self.write_line(line, self.action_out)
-        self.log("SAID :: {l}".format(l=line))
+        self.log("SAID :: {l}", l=line)
+
+    def make_logger(self):
+        """Logs to log_out from a background thread"""
+        write_lines = self.write_log_lines if self.log_out else None
+        return logger.BotLogger(write_lines, self.LOG_LEVEL)
+
+    def log(self, msg, *args, **kwargs):
+        """Logs at INFO, msg gets formatted with the args if it's written"""
+        self.logger.info(msg, *args, **kwargs)
+
+    def debug(self, msg, *args, **kwargs):
+        self.logger.debug(msg, *args, **kwargs)
+
+    def warning(self, msg, *args, **kwargs):
+        self.logger.warning(msg, *args, **kwargs)
+
+    @property
+    def no_logging(self):
+        return not self.logger.enabled(logger.ERROR)
 
-    def log(self, line):
-        """Writes a line somewhere we can log it"""
-        if not self.no_logging:
-            self.write_line(line, self.log_out)
+    @no_logging.setter
+    def no_logging(self, value):
+        self.logger.level = logger.OFF if value else self.LOG_LEVEL
+
+    def flush_log(self):
+        """Waits for the logger to catch up"""
+        self.logger.flush()
+
+    def write_log_lines(self, lines):
+        self.log_out.write(''.join(line + '\n' for line in lines))
+        self.log_out.flush()
 
     def write_line(self, line, dest):
         if line and dest:
@@ -55,15 +131,72 @@ class BufferPokerBot(IOPokerBot):
         if line and dest is not None:
             dest.append(line)
 
+    def make_logger(self):
+        """Logs straight into the log_out list"""
+        write_lines = self.log_out.extend if self.log_out is not None else None
+        return logger.BotLogger(write_lines, self.LOG_LEVEL, background=False)
+
     def run(self):
         for line in self.io_input:
             self.brain.parse_line(line)
 
 
+class GameEvents(object):
+    """What parsers find in the lines, as typed values. Listeners override
+    the events they care about, the rest are ignored"""
+    def on_seat(self, bot):
+        """A bot is at the table"""
+
+    def on_your_bot(self, bot):
+        pass
+
+    def on_time_bank(self, ms):
+        """The most time the bank can hold"""
+
+    def on_time_per_move(self, ms):
+        """Time added to the bank every move"""
+
+    def on_round(self, number):
+        pass
+
+    def on_small_blind(self, amount):
+        pass
+
+    def on_big_blind(self, amount):
+        pass
+
+    def on_button(self, bot):
+        pass
+
+    def on_stack(self, bot, amount):
+        pass
+
+    def on_bet(self, bot, amount):
+        """A bot put amount more chips in: a post, call or raise"""
+
+    def on_fold(self, bot):
+        pass
+
+    def on_hand(self, bot, cards):
+        pass
+
+    def on_table(self, cards):
+        pass
+
+    def on_pot(self, amount):
+        pass
+
+    def on_amount_to_call(self, amount):
+        pass
+
+    def on_round_over(self, winner, amount):
+        pass
+
+
 class Parser(object):
-    """Parsers handle lines and store data into self.data"""
-    def __init__(self, data):
-        self._data = data
+    """Parsers handle lines and send what's in them to a GameEvents"""
+    def __init__(self, events):
+        self._events = events
 
     def handle_line(self, line):
         pass
@@ -4,7 +4,8 @@ from Cython.Build import cythonize
 import os
 
 pokeher_cythons = ["cards.pyx", "handscore.pyx",
-                   "hand_simulator.pyx", "cython_random.pyx"
+                   "hand_simulator.pyx", "cython_random.pyx",
+                   "hand_indexer.pyx", "clock.pyx"
                    ]
 sources = map(lambda filename: os.path.join('pokeher', filename), pokeher_cythons)
 
@@ -0,0 +1,240 @@
+import json
+import os
+import sys
+import timeit
+
+import utility
+utility.fix_paths()
+
+import pokeher.cards as c
+import pokeher.cython_random as random
+import pokeher.logger as logger
+from pokeher.brain import Brain
+from pokeher.game import GameData
+from pokeher.hand_simulator import HandSimulator
+from pokeher.handscore import HandBuilder
+from pokeher.theaigame import TheAiGameParserDelegate, TheAiGameActionDelegate
+from pokeher.wiring import BufferPokerBot
+
+
+SEED = 1234
+HEADER = [
+    "Settings your_bot bot_0",
+    "Settings timebank 10000",
+    "Settings time_per_move 500",
+    "Match round 1",
+    "Match small_blind 10",
+    "Match big_blind 20",
+    "Match on_button bot_1",
+    "bot_0 stack 2000",
+    "bot_1 stack 2000",
+    "bot_1 post 10",
+    "bot_0 post 20",
+    "bot_0 hand [Td,Ac]",
+]
+# canned games, each ends on the line that asks us to act
+TRANSCRIPTS = {
+    "preflop": HEADER + [
+        "bot_1 raise 60",
+        "Match max_win_pot 120",
+        "Match amount_to_call 60",
+        "Action bot_0 5000",
+    ],
+    "flop": HEADER + [
+        "bot_1 call 10",
+        "Match max_win_pot 40",
+        "Match amount_to_call 0",
+        "bot_0 raise 28",
+        "bot_1 call 28",
+        "Match table [9d,6d,5h]",
+        "Match max_win_pot 96",
+        "Match amount_to_call 0",
+        "Action bot_0 5000",
+    ],
+    "turn": HEADER + [
+        "bot_1 call 10",
+        "Match table [9d,6d,5h]",
+        "bot_1 raise 40",
+        "Match table [9d,6d,5h,Ah]",
+        "Match max_win_pot 120",
+        "Match amount_to_call 40",
+        "Action bot_0 5000",
+    ],
+    "river": HEADER + [
+        "bot_1 call 10",
+        "Match table [9d,6d,5h,Ah,2c]",
+        "bot_1 raise 80",
+        "Match max_win_pot 200",
+        "Match amount_to_call 80",
+        "Action bot_0 5000",
+    ],
+}
+
+
+class BenchmarkBrain(Brain):
+    """Simulates in this process without pondering, so turns are repeatable"""
+    SIM_PROCESSES = 1
+    PONDER = False
+
+
+class BenchmarkBot(BufferPokerBot, TheAiGameParserDelegate,
+                   TheAiGameActionDelegate):
+    """Quiet bot for timing turns"""
+    LOG_LEVEL = logger.OFF
+
+    def add_brain(self):
+        self.brain = BenchmarkBrain(self)
+
+
+class Benchmark(object):
+    """Times the hot paths of the bot. Every case gets reseeded, so runs on
+    the same machine deal the same cards
+    """
+    def __init__(self, runs=200):
+        self.runs = runs
+        self.results = {}
+
+    def time_case(self, name, setup, op, prepare=None):
+        """Calls op(state) self.runs times, op returns how many hands (or
+        lines) it handled. Records hands/sec and per call latency.
+        prepare(state) runs untimed before each call"""
+        random.seed(SEED)
+        state = setup()
+        latencies = []
+        units = 0
+        for _ in range(self.runs):
+            if prepare:
+                prepare(state)
+            start = timeit.default_timer()
+            units += op(state)
+            latencies.append(timeit.default_timer() - start)
+
+        latencies.sort()
+        total = sum(latencies)
+        self.results[name] = {
+            'per_sec': units / total if total else 0,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'runs': self.runs,
+        }
+        print >> sys.stderr, ' {n}: {r}'.format(n=name, r=self.results[name])
+
+    def run(self):
+        self.bench_score_hand()
+        self.bench_find_hand()
+        for street, table_size in [("preflop", 0), ("flop", 3),
+                                   ("turn", 4), ("river", 5)]:
+            self.bench_simulate(street, table_size)
+        self.bench_handle_line()
+        for street in sorted(TRANSCRIPTS):
+            self.bench_do_turn(street)
+        return self.results
+
+    def bench_score_hand(self, batch=1000):
+        def op(hands):
+            for _ in range(batch):
+                HandBuilder(hands.pop()).score_hand()
+            return batch
+        self.time_case("score_hand", lambda: random_hands(batch * self.runs, 5),
+                       op)
+
+    def bench_find_hand(self, batch=100):
+        def op(hands):
+            for _ in range(batch):
+                HandBuilder(hands.pop()).find_hand()
+            return batch
+        self.time_case("find_hand", lambda: random_hands(batch * self.runs, 7),
+                       op)
+
+    def bench_simulate(self, street, table_size, iterations=1000):
+        def setup():
+            dealt = random_hands(1, 2 + table_size)[0]
+            return HandSimulator(c.Hand(dealt[0], dealt[1]), dealt[2:])
+
+        def op(simulator):
+            simulator.simulate(iterations)
+            return iterations
+        self.time_case("simulate_" + street, setup, op)
+
+    def bench_handle_line(self):
+        lines = [line for street in sorted(TRANSCRIPTS)
+                 for line in TRANSCRIPTS[street] if not line.startswith("Action")]
+
+        def setup():
+            return TheAiGameParserDelegate().set_up_parser(GameData(), None)
+
+        def op(parser):
+            for line in lines:
+                parser.handle_line(line)
+            return len(lines)
+        self.time_case("handle_line", setup, op)
+
+    def bench_do_turn(self, street):
+        """Times the decision at the end of a canned game"""
+        lines = TRANSCRIPTS[street]
+
+        def prepare(bot):
+            bot.brain.data.reset()
+            for line in lines[:-1]:
+                bot.brain.parse_line(line)
+
+        def op(bot):
+            bot.brain.parse_line(lines[-1])
+            return 1
+        self.time_case("do_turn_" + street, lambda: BenchmarkBot([], [], None),
+                       op, prepare)
+
+
+def percentile(ordered, pct):
+    if not ordered:
+        return 0
+    index = int(round((len(ordered) - 1) * pct / 100.0))
+    return ordered[index]
+
+
+def random_hands(count, size):
+    deck = c.full_deck()
+    return [random.sample(deck, size) for _ in range(count)]
+
+
+def compare(results, baseline, tolerance=0.10):
+    """Returns {case: hands/sec vs the baseline} & the cases that got slower
+    by more than tolerance"""
+    ratios = {}
+    slower = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get('per_sec'):
+            continue
+        ratios[name] = result['per_sec'] / base['per_sec']
+        if ratios[name] < 1 - tolerance:
+            slower.append(name)
+    return ratios, sorted(slower)
+
+
+def main(args):
+    """benchmark.py [save] [baseline json]
+    Prints the results as json and compares them to the baseline, 'save'
+    makes these results the new baseline"""
+    save = args[:1] == ["save"]
+    if save:
+        args = args[1:]
+    baseline_file = args[0] if args else \
+        utility.get_data_file('benchmark_baseline.json')
+
+    results = Benchmark().run()
+    output = {'results': results}
+    if save:
+        with open(baseline_file, 'w') as outf:
+            json.dump(results, outf, indent=2, sort_keys=True)
+    elif os.path.exists(baseline_file):
+        with open(baseline_file) as inf:
+            ratios, slower = compare(results, json.load(inf))
+        output['vs_baseline'] = ratios
+        output['slower'] = slower
+
+    print json.dumps(output, indent=2, sort_keys=True)
+    return 1 if output.get('slower') else 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -1,34 +1,79 @@
 import itertools
-import cPickle as pickle
+import multiprocessing
+import os
+import sys
+import time
 
 import utility
 utility.fix_paths()
 
-from pokeher.cards import Card
-from pokeher.handscore import HandBuilder
+import pokeher.cards as c
+from pokeher.best_hands import BestHandTable, distinct_strengths, rank_chunk
+
+strengths = None
+
+
+def init_worker(distinct):
+    global strengths
+    strengths = distinct
+
+
+def chunk_ranks(args):
+    """Ranks for one chunk of combinations"""
+    start, count, num_cards = args
+    return rank_chunk(start, count, num_cards, strengths)
 
 
 class BestHandCalculator(object):
+    """Writes the best hand rank of every 5, 6 or 7 card combination, in colex
+    order. Chunks get scored on a process pool & streamed to the file in
+    order, so memory stays at a few chunks whatever the table size
+    (C(52, 7) = 133784560 ranks, ~270MB on disk)
+    """
+    def __init__(self, num_cards=7, processes=None, chunk_size=1 << 22):
+        self.num_cards = num_cards
+        self.processes = processes or multiprocessing.cpu_count()
+        self.chunk_size = chunk_size
+
+    def answer_file(self):
+        return os.path.join('data', BestHandTable.data_file(self.num_cards))
+
+    def jobs(self):
+        total = c.deck_combinations(self.num_cards)
+        return [(start, min(self.chunk_size, total - start), self.num_cards)
+                for start in range(0, total, self.chunk_size)]
 
     def run(self):
-        self.calculate_best_mapping(6)  # This pickle file is ~750MB
-        self.calculate_best_mapping(7)  # This does not complete on my macbook
+        distinct = distinct_strengths()
+        jobs = self.jobs()
+        pool = None
+        if self.processes > 1:
+            pool = multiprocessing.Pool(self.processes, init_worker, (distinct,))
+            results = pool.imap(chunk_ranks, jobs)
+        else:
+            init_worker(distinct)
+            results = itertools.imap(chunk_ranks, jobs)
 
-    def calculate_best_mapping(self, num_cards):
-        """Iterates through a full suite
-        """
-        cards = Card.full_deck()
-        mapping = {}
+        t1 = time.time()
+        partial = self.answer_file() + '.partial'
+        try:
+            with open(partial, 'wb') as outf:
+                BestHandTable.write(outf, self.num_cards, distinct,
+                                    self.progress(results, len(jobs), t1))
+            os.rename(partial, self.answer_file())
+        finally:
+            if pool:
+                pool.terminate()
+                pool.join()
 
-        for hand in itertools.combinations(cards, num_cards):
-            (best_hand, score) = HandBuilder(hand).find_hand()
-            mapping[hand] = best_hand
+    def progress(self, results, num_chunks, start_time):
+        for done, ranks in enumerate(results, 1):
+            yield ranks
+            print ' {d}/{n} chunks in {t} seconds'.format(
+                d=done, n=num_chunks, t=time.time() - start_time)
 
-        outfile = 'best_hand_{num}.pickle'.format(num=num_cards)
-        outf = open(outfile, 'wb')
-        pickle.dump(mapping, outf)
-        outf.close()
 
 if __name__ == '__main__':
-    job = BestHandCalculator()
-    job.run()
+    num_cards = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    BestHandCalculator(num_cards, processes).run()
@@ -0,0 +1,82 @@
+import sys
+import itertools
+import os
+
+import numpy as np
+
+import utility
+utility.fix_paths()
+
+import pokeher.cards as c
+from pokeher.clock import monotonic
+from pokeher.hand_simulator import HandSimulator
+from pokeher.equity_cache import FlopEquityCache
+from pokeher.fear import OpponentPreflopFear, OpponentHandRangeFear
+from pokeher.preflop_equity import PreflopEquity
+from pokeher.utility import MathUtils
+
+
+class FlopEquityCalculator(object):
+    """Fills the flop equity cache the brain checks before simulating.
+    Only one (hand, flop) per suit-isomorphic class gets computed
+    """
+    def __init__(self, buckets, tries=0):
+        self.buckets = buckets
+        self.tries = tries
+        self.preflop_equity = PreflopEquity().data
+
+    def situation(self, index):
+        """Returns a (hand, flop) with the flop index"""
+        hole, flop = FlopEquityCache.INDEXER.unindex(1, index)
+        return c.Hand(*[c.from_index(card) for card in hole]), \
+            [c.from_index(card) for card in flop]
+
+    def run(self):
+        self.keys = range(FlopEquityCache.INDEXER.size(1))
+        print 'Found {} canonical flops'.format(len(self.keys))
+
+        self.equities = np.empty((len(self.buckets), len(self.keys)),
+                                 dtype=np.float32)
+        t1 = monotonic()
+        for count, key in enumerate(self.keys):
+            hand, flop = self.situation(key)
+            simulator = HandSimulator(hand, flop, self.preflop_equity)
+            for b, (hand_filter, tier) in enumerate(self.buckets):
+                min_hand = OpponentHandRangeFear.tier_handscore(flop, tier)
+                if self.tries:
+                    equity = simulator.simulate(self.tries, hand_filter, min_hand)
+                else:
+                    equity = simulator.exact_equity(hand_filter, min_hand)
+                self.equities[b, count] = equity
+
+            if count % 1000 == 0:
+                print ' Finished flop {c} ({p:.2f}%) in {t} seconds' \
+                    .format(c=count, p=MathUtils.percentage(count, len(self.keys)),
+                            t=monotonic() - t1)
+
+    def save_answer(self):
+        outfile = os.path.join('data', 'flop_equity.cache')
+        with open(outfile, 'wb') as outf:
+            FlopEquityCache.write(outf, self.keys, self.buckets, self.equities)
+
+
+def all_buckets():
+    """Every preflop hand filter & postflop bet tier the brain can be in"""
+    filters = sorted(set(OpponentPreflopFear.RAISE_FEARS.values()))
+    return list(itertools.product(filters, FlopEquityCache.TIERS))
+
+
+def calculate(tries=0, buckets=None):
+    """tries=0 counts every runout & opponent hand exactly"""
+    if buckets is None:
+        buckets = [(-1, "CHECK")]
+    job = FlopEquityCalculator(buckets, tries)
+    job.run()
+    job.save_answer()
+
+if __name__ == '__main__':
+    tries = int(sys.argv[1]) if len(sys.argv) > 1 else 0
+    if len(sys.argv) > 2 and sys.argv[2] == "all":
+        calculate(tries, all_buckets())
+    else:
+        calculate(tries)
@@ -1,6 +1,7 @@
 import cPickle as pickle
-import sys
 import itertools
+import multiprocessing
+import sys
 import os
 import time
 
@@ -9,62 +10,103 @@ utility.fix_paths()
 
 import pokeher.cards as c
 from pokeher.hand_simulator import HandSimulator
-from pokeher.utility import MathUtils
+from pokeher.preflop_equity import PreflopEquity, canonical_hands
+from pokeher.simulator_pool import new_seed, seed_worker
+
+
+def hand_wins(args):
+    """Returns (Hand.simple(), % pots won, seconds) for one hand. Counts
+    every runout & opponent hand when tries is 0"""
+    high, low, tries = args
+    t1 = time.time()
+    hand = c.Hand(c.from_index(high), c.from_index(low))
+    simulator = HandSimulator(hand)
+    if tries:
+        percent_pots_won = simulator.simulate(tries)
+    else:
+        percent_pots_won = simulator.exact_equity(max_to_come=5)
+    return hand.simple(), percent_pots_won, time.time() - t1
 
 
 class PreflopCalculator(object):
     """Estimates the average value, in % of pots won, for a 2 card hole hand.
-    Currently only useful for heads up texas hold'em
+    Currently only useful for heads up texas hold'em. Runs the hands on a
+    process pool and checkpoints after each one, so a killed run picks up
+    where it left off
     """
-    VERBOSE = False
+    def __init__(self, tries, processes=None):
+        self.tries = tries
+        self.processes = processes or multiprocessing.cpu_count()
+        self.wins = {}
+
+    def answer_file(self):
+        label = self.tries if self.tries else 'exact'
+        return os.path.join('data', 'preflop_wins_{i}.table'.format(i=label))
 
-    def run(self, tries):
+    def checkpoint_file(self):
+        return os.path.splitext(self.answer_file())[0] + '.partial'
+
+    def run(self):
         """Calculates the win % for each preflop hand, returns the mapping"""
-        cards = c.full_deck()
-        self.wins = {}
-        self.tries = tries
+        self.load_checkpoint()
+        hands = [hand for hand in canonical_hands()
+                 if hand.simple() not in self.wins]
+        print 'Starting with {d} hands done, {t} to go'.format(
+            d=len(self.wins), t=len(hands))
+
+        jobs = [(hand.high.index(), hand.low.index(), self.tries)
+                for hand in hands]
+        pool = None
+        if self.processes > 1:
+            pool = multiprocessing.Pool(self.processes, seed_worker,
+                                        (new_seed(), multiprocessing.Value('i', 0)))
+            results = pool.imap_unordered(hand_wins, jobs)
+        else:
+            results = itertools.imap(hand_wins, jobs)
+
+        try:
+            for hand_string, percent_pots_won, secs in results:
+                self.wins[hand_string] = percent_pots_won
+                self.save_checkpoint()
+                print ' {s} won {percent}% in {t} seconds ({d}/169 done)' \
+                    .format(s=hand_string, percent=percent_pots_won, t=secs,
+                            d=len(self.wins))
+        finally:
+            if pool:
+                pool.terminate()
+                pool.join()
+        return self.wins
+
+    def load_checkpoint(self):
+        try:
+            with open(self.checkpoint_file(), 'rb') as inf:
+                self.wins = pickle.load(inf)
+        except IOError:
+            self.wins = {}
 
-        for count, two_cards in enumerate(itertools.combinations(cards, 2)):
-            t1 = time.clock()
-            hand = c.Hand(two_cards[0], two_cards[1])
-            hand_string = hand.simple()
-            if self.wins.get(hand_string) is not None:
-                print "Skipping {}. Already computed its simple representation ({})" \
-                  .format(hand, hand_string)
-                continue
-            simulator = HandSimulator(hand)
-            percent_pots_won = simulator.simulate(tries)
-
-            self.wins[hand_string] = percent_pots_won
-
-            print ' {hand} ({s}) won {percent}% in {tries} tries in {t} seconds' \
-                .format(hand=hand, s=hand_string,
-                        tries=tries,
-                        percent=percent_pots_won,
-                        t=(time.clock() - t1))
-
-            # 52 choose 2 == 1326
-            # We go through everything even though we only calculate 169 hands
-            percent_done = MathUtils.percentage(count, 1326)
-            print ' Finished hand {c} ({p:.2f}%)' \
-                .format(c=count, p=percent_done)
-            print '-'*10
+    def save_checkpoint(self):
+        """Writes the hands done so far, swapped in whole so a kill
+        mid-write can't corrupt it"""
+        checkpoint = self.checkpoint_file()
+        with open(checkpoint + '.tmp', 'wb') as outf:
+            pickle.dump(self.wins, outf)
+        os.rename(checkpoint + '.tmp', checkpoint)
 
     def save_answer(self):
-        """Saves the calculated mapping to a pickle file"""
-        outfile = os.path.join('data', 'preflop_wins_{i}.pickle'
-                               .format(i=self.tries))
-        outf = open(outfile, 'wb')
-        pickle.dump(self.wins, outf)
-        outf.close()
+        """Saves the calculated mapping as a preflop equity table"""
+        with open(self.answer_file(), 'wb') as outf:
+            PreflopEquity.write(outf, self.wins)
+        os.remove(self.checkpoint_file())
 
 
-def calculate(tries=50000):
-    job = PreflopCalculator()
-    job.run(tries)
+def calculate(tries=50000, processes=None):
+    """tries=0 counts every runout & opponent hand exactly (takes hours)"""
+    job = PreflopCalculator(tries, processes)
+    job.run()
     job.save_answer()
 
 if __name__ == '__main__':
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
     if len(sys.argv) > 1:
         argument = sys.argv[1]
         if argument == "profile":
@@ -72,10 +114,12 @@ if __name__ == '__main__':
             from subprocess import call
             cprof_file = os.path.join('data', 'hands_profile')
             calltree_file = os.path.join('data', 'hands_profile.out')
-            cProfile.run('calculate(10)', cprof_file)
+            cProfile.run('calculate(10, processes=1)', cprof_file)
             call(['pyprof2calltree', '-i', cprof_file, '-o', calltree_file])
             call(['kcachegrind', calltree_file])
+        elif argument == "exact":
+            calculate(0, processes)
         else:
-            calculate(int(argument))
+            calculate(int(argument), processes)
     else:
-        calculate()
+        calculate(processes=processes)
@@ -0,0 +1,92 @@
+import itertools
+import multiprocessing
+import sys
+import os
+import time
+
+import numpy as np
+
+import utility
+utility.fix_paths()
+
+import pokeher.cards as c
+from pokeher.hand_simulator import HandSimulator, OpponentRange
+from pokeher.preflop_equity import PreflopMatchups, canonical_hands
+from pokeher.simulator_pool import new_seed, seed_worker
+
+
+def suit_variants():
+    """{Hand.simple(): [(card index, card index)]} for every two card combo"""
+    variants = {}
+    for card1, card2 in itertools.combinations(c.full_deck(), 2):
+        variants.setdefault(c.Hand(card1, card2).simple(), []) \
+            .append((card1.index(), card2.index()))
+    return variants
+
+
+def matchup_row(args):
+    """Returns (row, [% equity of hand row against every hand]) for the hands
+    from row onwards. Plays every suit variant of the other hand that doesn't
+    share a card with ours, which averages out to the whole matchup"""
+    row, tries = args
+    hands = canonical_hands()
+    hand = hands[row]
+    dead = set([hand.high.index(), hand.low.index()])
+    simulator = HandSimulator(hand)
+    variants = suit_variants()
+
+    equities = []
+    for other in hands[row:]:
+        opponents = OpponentRange()
+        for card1, card2 in variants[other.simple()]:
+            if card1 not in dead and card2 not in dead:
+                opponents.add(card1, card2)
+        opponents.build()
+        equities.append(simulator.simulate(tries, opponents=opponents))
+    return row, equities
+
+
+class MatchupCalculator(object):
+    """Fills the 169x169 preflop matchup matrix. Only the upper triangle gets
+    simulated, a hand's equity against another is 100 minus the reverse
+    """
+    def __init__(self, tries, processes=None):
+        self.tries = tries
+        self.processes = processes or multiprocessing.cpu_count()
+
+    def run(self):
+        size = len(PreflopMatchups.HANDS)
+        self.equities = np.zeros((size, size), dtype=np.float32)
+        jobs = [(row, self.tries) for row in range(size)]
+        pool = multiprocessing.Pool(self.processes, seed_worker,
+                                    (new_seed(), multiprocessing.Value('i', 0)))
+        t1 = time.time()
+        try:
+            for count, (row, equities) in enumerate(
+                    pool.imap_unordered(matchup_row, jobs), 1):
+                self.equities[row, row:] = equities
+                self.equities[row:, row] = [100 - e for e in equities]
+                print ' Finished {h} ({c}/{s}) in {t} seconds' \
+                    .format(h=PreflopMatchups.HANDS[row], c=count, s=size,
+                            t=time.time() - t1)
+        finally:
+            pool.terminate()
+            pool.join()
+        # same hands split evenly
+        np.fill_diagonal(self.equities, 50)
+
+    def save_answer(self):
+        outfile = os.path.join('data', 'preflop_matchups.matrix')
+        with open(outfile, 'wb') as outf:
+            PreflopMatchups.write(outf, self.equities)
+
+
+def calculate(tries=20000, processes=None):
+    job = MatchupCalculator(tries, processes)
+    job.run()
+    job.save_answer()
+
+if __name__ == '__main__':
+    tries = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    processes = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    calculate(tries, processes)
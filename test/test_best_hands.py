@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import pokeher.cards as cards
+import pokeher.cython_random as random
+from pokeher.best_hands import BestHandTable, distinct_strengths, rank_chunk
+from pokeher.handscore import hand_strength
+
+
+class BestHandTableTest(unittest.TestCase):
+    """Builds the 5 card table in a few chunks & looks hands up in it"""
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.table_file = os.path.join(self.tmp_dir, 'best_hands_5.table')
+        self.strengths = distinct_strengths()
+        total = cards.deck_combinations(5)
+        step = 1000000
+        chunks = (rank_chunk(start, min(step, total - start), 5, self.strengths)
+                  for start in range(0, total, step))
+        with open(self.table_file, 'wb') as out:
+            BestHandTable.write(out, 5, self.strengths, chunks)
+        self.table = BestHandTable(5, self.table_file, log_func=lambda x: None)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_distinct_strengths(self):
+        self.assertEqual(len(self.strengths), 7462)
+        self.assertTrue(np.all(np.diff(self.strengths) > 0))
+
+    def test_lookup(self):
+        self.assertTrue(self.table.loaded())
+        deck = cards.full_deck()
+        random.seed(1234)
+        for _ in range(500):
+            hand = random.sample(deck, 5)
+            self.assertEqual(self.table.hand_strength(hand), hand_strength(hand))
+
+    def test_rank(self):
+        """Ranks order the same way as strengths"""
+        royal = cards.colex_index([8, 9, 10, 11, 12])
+        self.assertEqual(self.table.rank(royal), 7461)
+        # 2 3 4 5 7 of two suits, the worst hand there is
+        self.assertEqual(self.table.rank(cards.colex_index([0, 1, 2, 3, 18])), 0)
+
+    def test_short_file(self):
+        """A table for the wrong number of cards doesn't load"""
+        table = BestHandTable(6, self.table_file, log_func=lambda x: None)
+        self.assertFalse(table.loaded())
+
+    def test_missing_file(self):
+        logs = []
+        table = BestHandTable(7, os.path.join(self.tmp_dir, 'nope'),
+                              log_func=logs.append)
+        self.assertFalse(table.loaded())
+        self.assertTrue(logs)
@@ -5,16 +5,21 @@ from pokeher.wiring import BufferPokerBot
 from pokeher.theaigame import TheAiGameParserDelegate, TheAiGameActionDelegate
 from pokeher.brain import Brain
 from pokeher.cards import Card, Hand
+from pokeher.hand_context import HandContext
 from pokeher.timer import Timer
 import pokeher.handscore
+import pokeher.logger as logger
 import pokeher.constants as C
 
+class SingleProcessBrain(Brain):
+    """No simulator worker processes, unless a test is about them"""
+    SIM_PROCESSES = 1
+
 class BrainTestBot(BufferPokerBot, TheAiGameParserDelegate, TheAiGameActionDelegate):
-    def add_brain(self):
-        self.brain = Brain(self)
+    LOG_LEVEL = logger.OFF
 
-    def log(self, msg):
-        pass
+    def add_brain(self):
+        self.brain = SingleProcessBrain(self)
 
 class BrainTest(unittest.TestCase):
     def setUp(self):
@@ -23,12 +28,17 @@ class BrainTest(unittest.TestCase):
         self.fake_log = []
         self.data = MockData()
 
+    def bot(self):
+        bot = BrainTestBot(self.fake_in, self.fake_out, self.fake_log)
+        self.addCleanup(bot.brain.close)
+        return bot
+
     def test_got_output(self):
         """Tests that the bot does something when it hits the turn marker"""
         self.fake_in = ['Settings your_bot bot_0',
                         'bot_0 hand [Ac,As]',
                         'Action bot_0 5000']
-        bot = BrainTestBot(self.fake_in, self.fake_out, self.fake_log)
+        bot = self.bot()
         bot.run()
 
         self.assertEqual(bot.brain.data.me, 'bot_0')
@@ -37,13 +47,13 @@ class BrainTest(unittest.TestCase):
 
     def test_preflop_equity_loaded(self):
         """Tests that the preflop equity data loaded correctly"""
-        bot = BrainTestBot(self.fake_in, self.fake_out, self.fake_log)
+        bot = self.bot()
         self.assertTrue(bot.brain.preflop_equity)
         self.assertEqual(len(bot.brain.preflop_equity.keys()), 169)
 
     def test_preflop_sanity(self):
         """Pull some stuff from the preflop equity and spot check it"""
-        bot = BrainTestBot(self.fake_in, self.fake_out, self.fake_log)
+        bot = self.bot()
         bad_hand = Hand(Card(2, C.CLUBS), Card(3, C.DIAMONDS))
         sample_key = bad_hand.simple()
 
@@ -60,7 +70,8 @@ class TestBrainBets(unittest.TestCase):
     """Checks the predefined bets"""
     def setUp(self):
         bot = MockBot()
-        self.brain = Brain(bot)
+        self.brain = SingleProcessBrain(bot)
+        self.addCleanup(self.brain.close)
         self.brain.r_test = lambda x: False
         d = MockData()
         d.big_blind = 20
@@ -112,7 +123,8 @@ class BettingFunctionalTests(BrainTest):
 
     def brain(self):
         bot = MockBot()
-        brain = Brain(bot)
+        brain = SingleProcessBrain(bot)
+        self.addCleanup(brain.close)
         def r_test(one=None, two=None, three=None):
             return False
         brain.r_test = r_test
@@ -185,11 +197,49 @@ class BettingFunctionalTests(BrainTest):
             self.assertTrue(bot.raise_amount > 0)
         self.assertTrue(t.secs < 0.250)
 
+    def test_simulator_pool(self):
+        """Simulates on worker processes when there's more than one core"""
+        self.data.table_cards = [Card(C.ACE, C.SPADES),
+                                 Card(2, C.DIAMONDS),
+                                 Card(7, C.SPADES)]
+        SingleProcessBrain.SIM_PROCESSES = 2
+        try:
+            bot, brain = self.brain()
+        finally:
+            SingleProcessBrain.SIM_PROCESSES = 1
+        self.assertTrue(brain.sim_pool)
+        brain.data = self.data
+        brain.iterations = 1000
+        brain.do_turn('bot_0', 500)
+        self.assertTrue(bot.raise_amount > 0)
+        brain.close()
+        self.assertFalse(brain.sim_pool)
+
+    def test_multiway(self):
+        """Simulates against every live opponent, even preflop"""
+        bot, brain = self.brain()
+        self.data.opponents = ['bot_%d' % i for i in range(1, 9)]
+        self.data.hand = Hand(Card(7, C.CLUBS), Card(2, C.DIAMONDS))
+        self.data.to_call = 200
+        self.data.pot = 400
+        brain.data = self.data
+        brain.do_turn('bot_0', 500)
+        # 72 offsuit against eight players is a fold
+        self.assertEqual(bot.bet_amount, 0)
+        self.assertEqual(bot.raise_amount, 0)
+
+    def test_equity_thresholds(self):
+        """Early stopping watches pick_action's cutoffs & the pot odds"""
+        bot, brain = self.brain()
+        self.assertEqual(brain.equity_thresholds(0, 0), [40, 55, 65, 70, 90])
+        self.assertEqual(brain.equity_thresholds(20, 40)[-2:], [40, 50])
+
 class MockBot(object):
     """For testing the brain by itself"""
     def __init__(self):
         self.bet_amount = 0
         self.raise_amount = 0
+        self.logger = logger.BotLogger(None)
 
     def set_up_parser(self, a, b):
         return None
@@ -204,8 +254,10 @@ class MockBot(object):
         self.bet_amount = 0
         self.raise_amount = 0
 
-    def log(self, msg):
-        print msg
+    def log(self, msg, *args, **kwargs):
+        print msg.format(*args, **kwargs) if args or kwargs else msg
+
+    debug = warning = log
 
 class MockData(object):
     def __init__(self):
@@ -216,10 +268,20 @@ class MockData(object):
         self.hand = Hand(Card(C.ACE, C.DIAMONDS), Card(C.ACE, C.HEARTS))
         self.table_cards = []
         self.time_per_move = 500
+        self.time_bank = None
         self.me = 'bot_0'
+        self.opponents = ['bot_1']
         self.bets = {}
         self.preflop_fear = -1
         self.hand_fear = pokeher.handscore.HandScore()
+        self.context = HandContext()
+
+    def live_opponents(self):
+        return self.opponents
+
+    def hand_context(self):
+        self.context.update(self.hand, self.table_cards)
+        return self.context
 
 
 if __name__ == '__main__':
@@ -1,3 +1,4 @@
+import itertools
 import unittest
 from pokeher.cards import *
 import pokeher.cards as cards
@@ -46,6 +47,85 @@ class CardTest(unittest.TestCase):
         self.assertTrue(aceH == aceH)
         self.assertFalse(aceH == aceS)
 
+class CardIndexTest(unittest.TestCase):
+    """Tests the integer card encoding"""
+    def test_round_trip(self):
+        deck = cards.full_deck()
+        for i, card in enumerate(deck):
+            self.assertEqual(card.index(), i)
+            self.assertEqual(cards.from_index(i), card)
+        self.assertEqual(cards.from_indexes(cards.to_indexes(deck)), deck)
+
+    def test_masks(self):
+        hand = [Card(C.ACE, C.SPADES), Card(2, C.CLUBS), Card(9, C.HEARTS)]
+        mask = cards.cards_to_mask(hand)
+        self.assertEqual(mask, (1 << 51) | 1 | (1 << 33))
+        self.assertEqual(cards.mask_to_cards(mask), sorted(hand, key=Card.index))
+        self.assertEqual(cards.cards_to_mask(cards.full_deck()),
+                         cards.FULL_DECK_MASK)
+
+    def test_aigames(self):
+        indexes = cards.aigames_to_indexes(['Ah', '9d', 'Tc'])
+        self.assertEqual(cards.from_indexes(indexes),
+                         [Card(C.ACE, C.HEARTS), Card(9, C.DIAMONDS),
+                          Card(10, C.CLUBS)])
+        self.assertEqual(cards.indexes_to_aigames(indexes), '[Ah,9d,Tc]')
+        self.assertEqual(cards.aigames_to_indexes(['Ah', 'Xx']), None)
+
+class CanonicalTest(unittest.TestCase):
+    """Tests the suit isomorphism canonical forms"""
+    def test_suit_relabeling(self):
+        hand = [Card(C.ACE, C.SPADES), Card(C.KING, C.HEARTS)]
+        table = [Card(2, C.SPADES), Card(7, C.CLUBS), Card(9, C.SPADES)]
+        swap = {C.SPADES: C.DIAMONDS, C.HEARTS: C.CLUBS, C.CLUBS: C.HEARTS}
+        relabel = lambda cs: [Card(c.value, swap[c.suit]) for c in cs]
+        self.assertEqual(cards.canonical_key(hand, table),
+                         cards.canonical_key(relabel(hand), relabel(table)))
+        self.assertEqual(cards.canonical_key(hand, table),
+                         cards.canonical_key(hand[::-1], table[::-1]))
+
+    def test_different_situations(self):
+        hand = [Card(C.ACE, C.SPADES), Card(C.KING, C.HEARTS)]
+        table = [Card(2, C.SPADES), Card(7, C.CLUBS), Card(9, C.SPADES)]
+        flush_draw = [Card(2, C.SPADES), Card(7, C.SPADES), Card(9, C.CLUBS)]
+        self.assertNotEqual(cards.canonical_key(hand, table),
+                            cards.canonical_key(hand, flush_draw))
+        # hole cards and table cards don't mix
+        self.assertNotEqual(cards.canonical_key(hand, table),
+                            cards.canonical_key(table[:2], hand + table[2:]))
+
+    def test_preflop_classes(self):
+        """There are 169 different starting hands"""
+        keys = set(cards.canonical_key(hole)
+                   for hole in itertools.combinations(cards.full_deck(), 2))
+        self.assertEqual(len(keys), 169)
+
+class ColexTest(unittest.TestCase):
+    """Tests the combination numbering"""
+    def test_dense(self):
+        """Every 3 card combination gets its own number, in colex order"""
+        numbers = [cards.colex_index(combo) for combo in
+                   sorted(itertools.combinations(range(52), 3),
+                          key=lambda combo: combo[::-1])]
+        self.assertEqual(numbers, range(cards.deck_combinations(3)))
+
+    def test_round_trip(self):
+        for number in [0, 1, 77, 1234567, cards.deck_combinations(7) - 1]:
+            indexes = cards.colex_indexes(number, 7)
+            self.assertEqual(cards.colex_index(indexes), number)
+            self.assertEqual(list(indexes), sorted(indexes))
+        self.assertEqual(cards.colex_index([6, 0, 3]), cards.colex_index([0, 3, 6]))
+
+    def test_out_of_range(self):
+        self.assertEqual(cards.deck_combinations(7), 133784560)
+        self.assertRaises(ValueError, cards.colex_indexes,
+                          cards.deck_combinations(5), 5)
+        self.assertRaises(ValueError, cards.colex_indexes, 0, 8)
+        self.assertRaises(ValueError, cards.colex_index, range(8))
+        self.assertRaises(ValueError, cards.colex_index, [0, 52])
+        self.assertRaises(ValueError, cards.colex_index, [-1, 3])
+        self.assertRaises(ValueError, cards.colex_index, [3, 3])
+
 class HandTest(unittest.TestCase):
     aceH = Card(C.ACE, C.HEARTS)
     aceS = Card(C.ACE, C.SPADES)
@@ -0,0 +1,28 @@
+import pickle
+import time
+import unittest
+
+from pokeher.clock import monotonic, Deadline
+
+
+class ClockTest(unittest.TestCase):
+    def test_monotonic(self):
+        start = monotonic()
+        time.sleep(0.01)
+        self.assertGreaterEqual(monotonic() - start, 0.01)
+
+    def test_deadline(self):
+        deadline = Deadline.from_ms(1000)
+        self.assertFalse(deadline.passed())
+        self.assertTrue(0.9 < deadline.secs_left() <= 1)
+        self.assertTrue(900 < deadline.ms_left() <= 1000)
+
+        passed = Deadline.at(monotonic() - 1)
+        self.assertTrue(passed.passed())
+        self.assertEqual(passed.secs_left(), 0)
+
+    def test_pickle(self):
+        """Deadlines sent to worker processes keep the same end time"""
+        deadline = Deadline(1)
+        copy = pickle.loads(pickle.dumps(deadline))
+        self.assertEqual(copy.end, deadline.end)
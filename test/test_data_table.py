@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pokeher.data_table import DataTable, StreamedSection
+
+
+class DataTableTest(unittest.TestCase):
+    """Round trips a table with a few sections"""
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.table_file = os.path.join(self.tmp_dir, 'test.table')
+        self.logs = []
+        with open(self.table_file, 'wb') as out:
+            DataTable.write(out, b'test', 3, [
+                ('odd', np.arange(5, dtype=np.uint8)),
+                ('grid', np.arange(12, dtype=np.float32).reshape((3, 4))),
+                ('scalar', np.int64(7)),
+            ])
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def table(self, kind=b'test', version=3, data_file=None):
+        return DataTable(data_file or self.table_file, kind, version,
+                         self.logs.append)
+
+    def test_round_trip(self):
+        table = self.table()
+        self.assertTrue(table.load())
+        self.assertEqual(table.get('odd').tolist(), [0, 1, 2, 3, 4])
+        grid = table.get('grid')
+        self.assertEqual(grid.shape, (3, 4))
+        self.assertEqual(grid.dtype, np.float32)
+        self.assertEqual(grid[2, 1], 9)
+        self.assertEqual(table.get('scalar'), 7)
+        self.assertEqual(table.get('nope'), None)
+
+    def test_aligned(self):
+        """Sections start on aligned offsets whatever came before them"""
+        grid = self.table().get('grid')
+        self.assertEqual(grid.__array_interface__['data'][0] % DataTable.ALIGN,
+                         0)
+
+    def test_read_only(self):
+        grid = self.table().get('grid')
+        with self.assertRaises(ValueError):
+            grid[0, 0] = 1
+
+    def test_lazy(self):
+        """Nothing gets read until the first load"""
+        table = self.table()
+        os.remove(self.table_file)
+        self.assertFalse(table.load())
+        self.assertEqual(table.get('grid'), None)
+        self.assertEqual(len(self.logs), 1)
+
+    def test_wrong_table(self):
+        self.assertFalse(self.table(kind=b'other').load())
+        self.assertFalse(self.table(version=2).load())
+
+        junk_file = os.path.join(self.tmp_dir, 'junk')
+        with open(junk_file, 'wb') as out:
+            out.write(b'not a table at all, nope' * 4)
+        self.assertFalse(self.table(data_file=junk_file).load())
+        self.assertEqual(len(self.logs), 3)
+
+    def test_streamed(self):
+        """Big sections can be written a chunk at a time"""
+        chunks = (np.arange(start, start + 10) for start in range(0, 100, 10))
+        with open(self.table_file, 'wb') as out:
+            DataTable.write(out, b'test', 3, [
+                ('big', StreamedSection('<i8', (10, 10), chunks))])
+        self.assertEqual(self.table().get('big')[4, 2], 42)
+
+    def test_streamed_short(self):
+        chunks = [np.arange(5)]
+        with open(self.table_file, 'wb') as out:
+            with self.assertRaises(ValueError):
+                DataTable.write(out, b'test', 3, [
+                    ('big', StreamedSection('<i8', (10,), chunks))])
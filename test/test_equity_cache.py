@@ -0,0 +1,55 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from pokeher.cards import Card, Hand
+from pokeher.equity_cache import FlopEquityCache
+import pokeher.constants as C
+
+
+class FlopEquityCacheTest(unittest.TestCase):
+    """Round trips a small cache file"""
+    hand = Hand(Card(C.ACE, C.SPADES), Card(C.KING, C.SPADES))
+    flop = [Card(2, C.SPADES), Card(7, C.SPADES), Card(9, C.CLUBS)]
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.cache_file = os.path.join(self.tmp_dir, 'flop.cache')
+
+        other_flop = [Card(3, C.HEARTS), Card(8, C.DIAMONDS), Card(9, C.CLUBS)]
+        keys = [FlopEquityCache.INDEXER.index_cards(
+                    [self.hand.high, self.hand.low], flop)
+                for flop in [self.flop, other_flop]]
+        buckets = [(-1, "CHECK"), (50, "RAISE")]
+        equities = [[70.5, 55], [float('nan'), 40]]
+        with open(self.cache_file, 'wb') as out:
+            FlopEquityCache.write(out, keys, buckets, equities)
+        self.cache = FlopEquityCache(self.cache_file, log_func=lambda x: None)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_lookup(self):
+        self.assertAlmostEqual(self.cache.lookup(self.hand, self.flop), 70.5)
+        self.assertEqual(self.cache.lookup(self.hand, self.flop, 50, "RAISE"),
+                         None)
+        self.assertEqual(self.cache.lookup(self.hand, self.flop, 45, "RAISE"),
+                         None)
+        self.assertEqual(self.cache.lookup(self.hand, self.flop[:2]), None)
+
+    def test_suit_isomorphic(self):
+        """Relabeling the suits finds the same entry"""
+        hand = Hand(Card(C.ACE, C.HEARTS), Card(C.KING, C.HEARTS))
+        flop = [Card(9, C.DIAMONDS), Card(2, C.HEARTS), Card(7, C.HEARTS)]
+        self.assertAlmostEqual(self.cache.lookup(hand, flop), 70.5)
+
+        offsuit = Hand(Card(C.ACE, C.HEARTS), Card(C.KING, C.SPADES))
+        self.assertEqual(self.cache.lookup(offsuit, flop), None)
+
+    def test_missing_file(self):
+        logs = []
+        cache = FlopEquityCache(os.path.join(self.tmp_dir, 'nope'),
+                                log_func=logs.append)
+        self.assertEqual(cache.lookup(self.hand, self.flop), None)
+        self.assertTrue(logs)
@@ -0,0 +1,90 @@
+from __future__ import division
+
+import itertools
+import unittest
+
+import pokeher.constants as C
+import pokeher.cython_random as random
+from pokeher.cards import Card, Hand
+from pokeher.equity_estimator import EquityEstimator
+from pokeher.hand_simulator import HandSimulator, OpponentRange
+
+
+class EquityEstimatorTest(unittest.TestCase):
+    def test_running_mean(self):
+        estimator = EquityEstimator()
+        estimator.add(50, 100)
+        estimator.add(80, 300)
+        estimator.add(0, 0)
+        self.assertEqual(estimator.trials, 400)
+        self.assertAlmostEqual(estimator.mean, 72.5)
+        low, high = estimator.interval()
+        self.assertTrue(low < 72.5 < high)
+
+    def test_clear_of_thresholds(self):
+        """Stops once the interval doesn't straddle a threshold"""
+        estimator = EquityEstimator([40, 55, 65])
+        for equity in [80, 82]:
+            self.assertFalse(estimator.is_decided())
+            estimator.add(equity, 100)
+        self.assertTrue(estimator.is_decided())
+
+    def test_close_call(self):
+        """Keeps going when the equity is right on top of a threshold"""
+        estimator = EquityEstimator([40, 55, 65])
+        for equity in [54, 56, 55, 54.5, 55.5]:
+            estimator.add(equity, 1000)
+        self.assertFalse(estimator.is_decided())
+
+    def test_min_trials(self):
+        """However far from a threshold, a few trials don't decide anything"""
+        estimator = EquityEstimator([50])
+        estimator.add(100, 100)
+        self.assertFalse(estimator.is_decided())
+        estimator.add(100, 100)
+        self.assertTrue(estimator.is_decided())
+
+    def test_extremes(self):
+        """The interval doesn't collapse when every trial went one way"""
+        estimator = EquityEstimator([97])
+        estimator.add(100, 300)
+        low, high = estimator.interval()
+        self.assertTrue(95 < low < 97)
+        self.assertAlmostEqual(high, 100)
+        self.assertFalse(estimator.is_decided())
+
+    def test_chunks_agreeing(self):
+        """Chunks that happen to agree don't narrow the interval"""
+        estimator = EquityEstimator([51])
+        for _ in range(10):
+            estimator.add(50, 1000)
+        low, high = estimator.interval()
+        self.assertTrue(low < 49 and 51 < high)
+        self.assertFalse(estimator.is_decided())
+
+    def test_distance(self):
+        estimator = EquityEstimator([40, 55, 65])
+        estimator.add(58, 1000)
+        self.assertAlmostEqual(estimator.distance(), 3)
+        self.assertEqual(EquityEstimator().distance(), float('inf'))
+
+    def test_lopsided(self):
+        """AA against a range of mostly 72o is decided in a few hundred
+        trials"""
+        hand = Hand(Card(C.ACE, C.SPADES), Card(C.ACE, C.HEARTS))
+        simulator = HandSimulator(hand, rng=random.Random(5))
+        opponents = OpponentRange()
+        for card1, card2 in itertools.product(
+                [Card(7, suit) for suit in range(4)],
+                [Card(2, suit) for suit in range(4)]):
+            if card1.suit != card2.suit:
+                opponents.add(card1.index(), card2.index(), 10)
+        opponents.add(Card(C.KING, C.SPADES).index(),
+                      Card(C.KING, C.CLUBS).index())
+        opponents.build()
+
+        estimator = EquityEstimator([40, 55, 65, 70])
+        while not estimator.is_decided():
+            estimator.add(simulator.simulate(100, opponents=opponents), 100)
+        self.assertLess(estimator.trials, 1000)
+        self.assertGreater(estimator.mean, 70)
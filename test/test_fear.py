@@ -2,6 +2,7 @@ import unittest
 
 import pokeher.handscore as handscore
 import pokeher.constants as C
+from pokeher.cards import Card
 from pokeher.fear import OpponentHandRangeFear
 from test_brain import MockData
 
@@ -23,3 +24,20 @@ class HandRangeFearTest(unittest.TestCase):
         score = handscore.HandScore(1)
         score.kicker = tuple([C.QUEEN] * 5)
         self.assertEqual(fear.minimum_handscore(), score)
+
+    def test_find_tier(self):
+        """Recovers the bet tier from a hand fear"""
+        table = [Card(C.ACE, C.SPADES), Card(2, C.DIAMONDS), Card(7, C.SPADES)]
+        for tier in OpponentHandRangeFear.RAISE_FEARS:
+            score = OpponentHandRangeFear.tier_handscore(table, tier)
+            found = OpponentHandRangeFear.find_tier(table, score)
+            self.assertEqual(OpponentHandRangeFear.tier_handscore(table, found),
+                             score)
+        self.assertEqual(OpponentHandRangeFear.find_tier(table, handscore.HandScore()),
+                         "CHECK")
+        self.assertEqual(OpponentHandRangeFear.find_tier(table, handscore.HandScore(7)),
+                         None)
+        # the ace is already bigger than the min-raise queen kicker
+        min_raise = OpponentHandRangeFear.tier_handscore(table, "MIN_RAISE")
+        self.assertEqual(OpponentHandRangeFear.find_tier(table, min_raise),
+                         "CHECK")
@@ -8,16 +8,14 @@ class MatchTest(unittest.TestCase):
 
     def test_load_opponents_me(self):
         """Tests finding our bot's name and our opponents names"""
-        sharedData = {}
-        match = GameData(sharedData)
-        parser = SettingsParser(sharedData)
+        match = GameData()
+        parser = SettingsParser(match)
         lines = ['bot_0 seat 0',
                  'bot_1 seat 1',
                  'bot_4 seat 3',
                  'Settings your_bot bot_0']
         for line in lines:
             self.assertTrue(parser.handle_line(line))
-        match.update()
 
         self.assertTrue(match, "match instantiated")
         self.assertEqual(match.me, "bot_0")
@@ -28,42 +26,37 @@ class MatchTest(unittest.TestCase):
 
     def test_round(self):
         """Tests getting the current round"""
-        sharedData = {}
-        match = GameData(sharedData)
-        parser = RoundParser(sharedData)
+        match = GameData()
+        parser = RoundParser(match)
         self.assertEqual(match.round, 0)
         self.assertTrue(parser.handle_line('Match round 8'))
-        match.update()
         self.assertEqual(match.round, 8)
 
         self.assertTrue(parser.handle_line('Match round 8392'))
-        match.update()
         self.assertEqual(match.round, 8392)
         self.assertTrue(parser.handle_line('Match round lkfashfas'))
         self.assertEqual(match.round, 8392) # shouldn't change or explode
 
     def test_bad_match_values(self):
         """Checks for bad round"""
-        sharedData = {'round' : 'ROUND'}
-        match = GameData(sharedData)
-        match.update()
-        self.assertNotEqual(match.round, 'ROUND')
+        match = GameData()
+        parser = TheAiGameParserDelegate().set_up_parser(match, None)
+        self.assertTrue(parser.handle_line('Match round ROUND'))
+        self.assertEqual(match.round, 0)
 
 class RoundTest(unittest.TestCase):
     """Tests for round by round stuff - cards and bots and blinds etc"""
 
     def test_blinds_button(self):
         """Test getting the blind and button"""
-        sharedData = {}
-        the_round = GameData(sharedData)
-        parser = RoundParser(sharedData)
+        the_round = GameData()
+        parser = RoundParser(the_round)
         lines = ['Match small_blind 10',
                  'Match big_blind 20',
                  'Match on_button bot_0']
 
         for line in lines:
             self.assertTrue(parser.handle_line(line))
-        the_round.update()
 
         self.assertEqual(the_round.small_blind, 10)
         self.assertEqual(the_round.big_blind, 20)
@@ -71,15 +64,14 @@ class RoundTest(unittest.TestCase):
 
     def test_bad_round_values(self):
         """Makes sure the round doesn't explode when we pass it bad data"""
-        sharedData = {'small_blind' : 'SMALL',
-                      'big_blind' : 'BIG',
-                      'pot' : 'POT',
-                      'amount_to_call' : 'SIDEPOTS'}
-        the_round = Round()
-        the_round.sharedData = sharedData
-        the_round.reset_round()
-
-        the_round.update_round()
+        the_round = GameData()
+        parser = TheAiGameParserDelegate().set_up_parser(the_round, None)
+        for line in ['Match small_blind SMALL',
+                     'Match big_blind BIG',
+                     'Match max_win_pot POT',
+                     'Match amount_to_call SIDEPOTS']:
+            self.assertTrue(parser.handle_line(line))
+
         self.assertNotEqual(the_round.small_blind, 'SMALL')
         self.assertNotEqual(the_round.big_blind, 'BIG')
         self.assertNotEqual(the_round.pot, 'POT')
@@ -87,11 +79,10 @@ class RoundTest(unittest.TestCase):
 
     def test_cards(self):
         """Tests finding the cards"""
-        sharedData = {}
-        data = GameData(sharedData)
+        data = GameData()
         data.me = 'bot_0'
         callback = None
-        parser = TurnParser(sharedData, callback)
+        parser = TurnParser(data, callback)
         lines = ['bot_0 hand [6c,Jc]',
                  'Match max_win_pot 20',
                  'Match table [Tc,8d,9c]',
@@ -99,7 +90,6 @@ class RoundTest(unittest.TestCase):
 
         for line in lines:
             self.assertTrue(parser.handle_line(line))
-        data.update()
 
         self.assertEqual(data.hand,
                          Hand(Card(6, C.CLUBS), Card(C.JACK, C.CLUBS)))
@@ -108,20 +98,17 @@ class RoundTest(unittest.TestCase):
         self.assertEqual(data.to_call, 10)
 
         parser.handle_line('Match amount_to_call 0')
-        data.update()
         self.assertEqual(data.to_call, 0)
 
         parser.handle_line('bot_0 wins 90')
-        data.update()
         self.assertFalse(data.hand)
         self.assertEqual(data.pot, 0)
 
     def test_bets(self):
-        sharedData = {}
-        data = GameData(sharedData)
+        data = GameData()
         data.me = 'bot_0'
         callback = None
-        parser = TurnParser(sharedData, callback)
+        parser = TurnParser(data, callback)
         lines = [
             "Match on_button bot_0",
             "Match small_blind 10",
@@ -138,7 +125,6 @@ class RoundTest(unittest.TestCase):
 
         for line in lines:
             self.assertTrue(parser.handle_line(line))
-            data.update()
 
         # Did we pick up the blinds correctly?
         print "{}".format(data.bets)
@@ -152,25 +138,22 @@ class RoundTest(unittest.TestCase):
 
         for line in more_bets:
             self.assertTrue(parser.handle_line(line))
-        data.update()
 
         # and more bets
         self.assertEqual(data.bets["bot_0"], 50)
         self.assertEqual(data.bets["bot_1"], 60)
 
         self.assertTrue(parser.handle_line("Match amount_to_call 0"))
-        data.update()
 
         self.assertEqual(data.bets["bot_0"], 0)
         self.assertEqual(data.bets["bot_1"], 0)
 
     def test_stacks(self):
         """Tests that we pull bot stack sizes out of the data blob"""
-        sharedData = {}
-        data = GameData(sharedData)
+        data = GameData()
         data.me = 'bot_0'
         callback = None
-        parser = TurnParser(sharedData, callback)
+        parser = TurnParser(data, callback)
         lines = [
             "bot_0 stack 3920",
             "bot_1 stack 1000",
@@ -180,10 +163,63 @@ class RoundTest(unittest.TestCase):
 
         for line in lines:
             self.assertTrue(parser.handle_line(line))
-            data.update()
 
         self.assertEqual(data.stacks["bot_0"], 3920)
         self.assertEqual(data.stacks["bot_1"], 1000)
 
+        # the last known stacks stay around between hands
+        self.assertTrue(parser.handle_line("bot_1 wins 30"))
+        self.assertEqual(data.stacks["bot_1"], 1000)
+
+    def test_live_opponents(self):
+        """Tests that folded bots drop out until the next hand"""
+        data = GameData()
+        parser = TheAiGameParserDelegate().set_up_parser(data, None)
+        lines = [
+            "bot_0 seat 0",
+            "bot_1 seat 1",
+            "bot_2 seat 2",
+            "Settings your_bot bot_0",
+            "bot_1 stack 1000",
+            "bot_2 stack 1000",
+            "bot_1 fold 0",
+        ]
+
+        for line in lines:
+            self.assertTrue(parser.handle_line(line))
+
+        self.assertEqual(data.opponents, ['bot_1', 'bot_2'])
+        self.assertEqual(data.live_opponents(), ['bot_2'])
+
+        self.assertTrue(parser.handle_line("bot_2 wins 40"))
+        self.assertEqual(data.live_opponents(), ['bot_1', 'bot_2'])
+
+    def test_hand_context(self):
+        """The evaluation context follows the cards & resets each hand"""
+        data = GameData()
+        parser = TheAiGameParserDelegate().set_up_parser(data, None)
+        lines = [
+            "Settings your_bot bot_0",
+            "bot_0 hand [Ah,Kh]",
+            "Match table [2h,7h,9c]",
+        ]
+        for line in lines:
+            self.assertTrue(parser.handle_line(line))
+
+        context = data.context
+        self.assertEqual(context.hand, data.hand)
+        self.assertEqual(context.table_cards, data.table_cards)
+        simulator = data.hand_context().simulator({})
+        self.assertTrue(data.hand_context().simulator({}) is simulator)
+
+        self.assertTrue(parser.handle_line("Match table [2h,7h,9c,Qh]"))
+        self.assertTrue(data.context is context)
+        self.assertEqual(len(context.table_cards), 4)
+        self.assertFalse(context.simulator({}) is simulator)
+
+        self.assertTrue(parser.handle_line("bot_0 wins 40"))
+        self.assertFalse(data.context is context)
+        self.assertEqual(data.context.table_cards, [])
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+import pokeher.cards as cards
+import pokeher.constants as C
+from pokeher.cards import Card, Hand
+from pokeher.fear import OpponentHandRangeFear
+from pokeher.hand_context import HandContext
+from pokeher.handscore import HandBuilder, HandScore
+
+
+class HandContextTest(unittest.TestCase):
+    hand = Hand(Card(C.ACE, C.SPADES), Card(C.KING, C.SPADES))
+    table = [Card(2, C.SPADES), Card(2, C.CLUBS), Card(9, C.SPADES),
+             Card(C.QUEEN, C.SPADES), Card(9, C.HEARTS)]
+
+    def setUp(self):
+        self.context = HandContext()
+
+    def test_incremental(self):
+        """The dead card mask only takes in the new cards"""
+        self.context.update(self.hand, self.table[:3])
+        dead = [self.hand.high, self.hand.low] + self.table[:3]
+        self.assertEqual(self.context.dead_mask, cards.cards_to_mask(dead))
+
+        self.context.update(self.hand, self.table[:4])
+        dead = [self.hand.high, self.hand.low] + self.table[:4]
+        self.assertEqual(self.context.dead_mask, cards.cards_to_mask(dead))
+        self.assertEqual(self.context.deck_mask() & self.context.dead_mask, 0)
+        self.assertEqual(len(cards.mask_to_cards(self.context.deck_mask())), 46)
+
+    def test_street_cache(self):
+        """Work done for a street is kept until the next card"""
+        self.context.update(self.hand, self.table[:3])
+        score = self.context.table_score()
+        self.assertEqual(score, OpponentHandRangeFear.find_table_score(self.table[:3]))
+        simulator = self.context.simulator({})
+        self.context.update(self.hand, list(self.table[:3]))
+        self.assertTrue(self.context.table_score() is score)
+        self.assertTrue(self.context.simulator({}) is simulator)
+
+        self.context.update(self.hand, self.table)
+        self.assertEqual(self.context.table_score().type, 2)  # two pair
+        self.assertFalse(self.context.simulator({}) is simulator)
+        self.assertEqual(self.context.best_hand(),
+                         HandBuilder([self.hand.high, self.hand.low]
+                                     + self.table).find_hand())
+
+    def test_preflop(self):
+        self.context.update(self.hand, [])
+        best, score = self.context.best_hand()
+        self.assertEqual(best, [self.hand.high, self.hand.low])
+        self.assertEqual(score, HandScore())
+
+    def test_new_hand(self):
+        """A different hand or table starts over"""
+        self.context.update(self.hand, self.table[:3])
+        other = Hand(Card(3, C.HEARTS), Card(4, C.HEARTS))
+        self.context.update(other, self.table[:3])
+        self.assertEqual(self.context.dead_mask,
+                         cards.cards_to_mask([other.high, other.low]
+                                             + self.table[:3]))
+
+        self.context.update(other, self.table[2:5])
+        self.assertEqual(self.context.dead_mask,
+                         cards.cards_to_mask([other.high, other.low]
+                                             + self.table[2:5]))
+        self.context.update(None, [])
+        self.assertEqual(self.context.dead_mask, 0)
@@ -0,0 +1,72 @@
+import itertools
+import unittest
+
+import pokeher.constants as C
+import pokeher.cython_random as random
+from pokeher.cards import Card
+from pokeher.hand_indexer import HandIndexer
+
+
+class HandIndexerTest(unittest.TestCase):
+    """Tests the suit isomorphic hand indexes"""
+    indexer = HandIndexer()
+
+    def test_sizes(self):
+        """Canonical situations for preflop, flop, turn & river"""
+        self.assertEqual([self.indexer.size(r) for r in range(4)],
+                         [169, 1286792, 55190538, 2428287420])
+
+    def test_preflop_dense(self):
+        indexes = set(self.indexer.index(hole)
+                      for hole in itertools.combinations(range(52), 2))
+        self.assertEqual(indexes, set(range(169)))
+
+    def test_small_game_dense(self):
+        """Every situation of a one card, two card game lands in range"""
+        indexer = HandIndexer((1, 2))
+        indexes = set()
+        for card in range(52):
+            rest = [other for other in range(52) if other != card]
+            for table in itertools.combinations(rest, 2):
+                indexes.add(indexer.index((card,) + table))
+        self.assertEqual(indexes, set(range(indexer.size(1))))
+
+    def test_suit_relabeling(self):
+        random.seed(1234)
+        swap = [2, 0, 3, 1]
+        for _ in range(500):
+            dealt = random.sample(range(52), 7)
+            relabeled = [swap[card // 13] * 13 + card % 13 for card in dealt]
+            # order within a round doesn't matter either
+            relabeled = relabeled[1::-1] + relabeled[4:1:-1] + relabeled[5:]
+            self.assertEqual(self.indexer.index(dealt),
+                             self.indexer.index(relabeled))
+
+    def test_round_trip(self):
+        random.seed(1234)
+        for round in range(4):
+            size = self.indexer.size(round)
+            for index in [0, size - 1] + \
+                    [random.randint(0, 1 << 30) % size for _ in range(300)]:
+                dealt = self.indexer.unindex(round, index)
+                self.assertEqual(len(dealt), round + 1)
+                flat = [card for cards in dealt for card in cards]
+                self.assertEqual(self.indexer.index(flat), index)
+
+    def test_cards(self):
+        hand = [Card(C.ACE, C.SPADES), Card(C.KING, C.SPADES)]
+        flop = [Card(2, C.SPADES), Card(7, C.HEARTS), Card(9, C.CLUBS)]
+        relabeled = [Card(C.ACE, C.HEARTS), Card(C.KING, C.HEARTS)]
+        other_flop = [Card(2, C.HEARTS), Card(7, C.CLUBS), Card(9, C.DIAMONDS)]
+        self.assertEqual(self.indexer.index_cards(hand, flop),
+                         self.indexer.index_cards(relabeled, other_flop))
+        self.assertNotEqual(self.indexer.index_cards(hand, flop),
+                            self.indexer.index_cards(hand, other_flop))
+
+    def test_bad_situations(self):
+        self.assertRaises(ValueError, self.indexer.index, [0, 1, 2])
+        self.assertRaises(ValueError, self.indexer.index, [0, 0])
+        self.assertRaises(ValueError, self.indexer.index, [0, 52])
+        self.assertRaises(ValueError, self.indexer.unindex, 0, 169)
+        self.assertRaises(ValueError, self.indexer.unindex, 4, 0)
+        self.assertRaises(ValueError, HandIndexer, (2, 3, 1, 1, 1))
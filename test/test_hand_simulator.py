@@ -1,9 +1,14 @@
+from __future__ import division
+
+import itertools
 import unittest
-from pokeher.hand_simulator import HandSimulator
-from pokeher.handscore import HandScore
+from pokeher.hand_simulator import HandSimulator, OpponentRange
+from pokeher.handscore import HandScore, HandBuilder
 import pokeher.constants as C
+import pokeher.cython_random as random
 from pokeher.cards import Card, Hand
 import pokeher.preflop_equity
+from pokeher.clock import Deadline
 
 
 class HandSimulatorTest(unittest.TestCase):
@@ -36,6 +41,46 @@ class HandSimulatorTest(unittest.TestCase):
         win_percentage = simulator.simulate(5)
         self.assertEqual(win_percentage, 100)
 
+    def test_seeded(self):
+        """Simulations with the same seed come out the same"""
+        hand = Hand(Card(C.KING, C.CLUBS), Card(7, C.HEARTS))
+        table_cards = [Card(C.ACE, C.HEARTS), Card(C.KING, C.SPADES),
+                       Card(3, C.HEARTS)]
+        runs = [HandSimulator(hand, table_cards, rng=random.Random(11))
+                .simulate(500) for _ in range(2)]
+        self.assertEqual(runs[0], runs[1])
+
+    def test_exact_equity(self):
+        """Counts every runout on the turn & river"""
+        ace = Card(C.ACE, C.HEARTS)
+        king = Card(C.KING, C.SPADES)
+        three = Card(3, C.HEARTS)
+        two = Card(2, C.SPADES)
+        seven = Card(7, C.HEARTS)
+        hand = Hand(Card(C.KING, C.CLUBS), seven)
+
+        table = [ace, king, three, two, Card(9, C.CLUBS)]
+        river = HandSimulator(hand, table)
+        _, ours = HandBuilder([hand.high, hand.low] + table).find_hand()
+        wins = 0
+        for opponent in itertools.combinations(river.deck, 2):
+            _, theirs = HandBuilder(list(opponent) + table).find_hand()
+            wins += 1 if ours > theirs else 0.5 if ours == theirs else 0
+        self.assertAlmostEqual(river.exact_equity(), 100 * wins / 990)
+        # nobody can have quads here, so min_hand falls away
+        self.assertEqual(river.exact_equity(min_hand=HandScore(C.QUADS)),
+                         river.exact_equity())
+
+        turn = HandSimulator(hand, [ace, king, three, two])
+        equity = turn.exact_equity()
+        self.assertEqual(equity, turn.exact_equity())
+        self.assertAlmostEqual(equity, turn.simulate(20000), delta=2)
+        self.assertLess(turn.exact_equity(min_hand=HandScore(C.TRIPS)), 5)
+
+        flop = HandSimulator(hand, [ace, king, three])
+        self.assertAlmostEqual(flop.exact_equity(), flop.simulate(20000), delta=2)
+        self.assertRaises(ValueError, HandSimulator(hand).exact_equity)
+
     def test_hand_filter(self):
         equity = pokeher.preflop_equity.PreflopEquity()
         hand = Hand(Card(10, C.SPADES), Card(3, C.SPADES))
@@ -54,6 +99,78 @@ class HandSimulatorTest(unittest.TestCase):
         self.assertTrue(simulator.passes_filter(king, three, 30))
         self.assertFalse(simulator.passes_filter(three, two, 40))
 
+    def test_opponent_range(self):
+        """The range holds hands that pass the filter, weighted by their
+        preflop equity"""
+        equity = pokeher.preflop_equity.PreflopEquity()
+        hand = Hand(Card(10, C.SPADES), Card(3, C.SPADES))
+        simulator = HandSimulator(hand, [], preflop_equity=equity.data)
+
+        everything = simulator.opponent_range()
+        self.assertEqual(len(everything), 1225)
+        self.assertEqual(everything.total_weight, 1225)
+        tight = simulator.opponent_range(60)
+        self.assertTrue(0 < len(tight) < 1225)
+        for card1, card2, weight in tight.combos():
+            self.assertTrue(simulator.passes_filter(card1, card2, 60))
+            self.assertGreater(weight, 60)
+        weights = dict((frozenset([str(c1), str(c2)]), w)
+                       for c1, c2, w in tight.combos())
+        aces = frozenset([str(Card(C.ACE, C.CLUBS)),
+                          str(Card(C.ACE, C.DIAMONDS))])
+        ace_king = frozenset([str(Card(C.KING, C.CLUBS)),
+                              str(Card(C.ACE, C.DIAMONDS))])
+        self.assertGreater(weights[aces], weights[ace_king])
+        self.assertTrue(simulator.opponent_range(60) is tight)
+
+        # a filter nothing passes plays everything instead of nothing
+        self.assertEqual(len(simulator.opponent_range(95)), 1225)
+
+    def test_impossible_min_hand(self):
+        """Nobody can have quads here, so min_hand is dropped rather than
+        folding every hand"""
+        hand = Hand(Card(C.KING, C.CLUBS), Card(7, C.HEARTS))
+        table = [Card(C.ACE, C.HEARTS), Card(C.KING, C.SPADES),
+                 Card(3, C.HEARTS), Card(2, C.SPADES), Card(9, C.CLUBS)]
+        simulator = HandSimulator(hand, table)
+        self.assertGreater(simulator.simulate(200, min_hand=HandScore(C.QUADS)),
+                           50)
+        self.assertEqual(simulator.last_tries, 200)
+
+    def test_range_sampling(self):
+        """Draws follow the weights"""
+        opponents = OpponentRange()
+        opponents.add(0, 1, 1)
+        opponents.add(2, 3, 3)
+        opponents.add(4, 5, 0)
+        opponents.build()
+        self.assertEqual(len(opponents), 2)
+        self.assertEqual(opponents.total_weight, 4)
+
+        rng = random.Random(3)
+        draws = [opponents.draw(rng) for _ in range(4000)]
+        heavy = sum(1 for card1, _ in draws if card1.index() == 2)
+        self.assertAlmostEqual(heavy / len(draws), 0.75, delta=0.03)
+        self.assertRaises(ValueError, OpponentRange().draw)
+
+    def test_multiway(self):
+        """More opponents, less equity, and split pots are shared"""
+        hand = Hand(Card(C.ACE, C.SPADES), Card(C.ACE, C.HEARTS))
+        simulator = HandSimulator(hand, rng=random.Random(4))
+        heads_up = simulator.simulate(5000)
+        three_way = simulator.simulate(5000, num_opponents=2)
+        full_ring = simulator.simulate(5000, num_opponents=9)
+        self.assertTrue(heads_up > three_way > full_ring > 20)
+
+        # the board plays: everybody splits the pot
+        table = [Card(C.ACE, C.CLUBS), Card(C.KING, C.CLUBS),
+                 Card(C.QUEEN, C.CLUBS), Card(C.JACK, C.CLUBS),
+                 Card(10, C.CLUBS)]
+        simulator = HandSimulator(Hand(Card(2, C.HEARTS), Card(3, C.HEARTS)),
+                                  table)
+        self.assertAlmostEqual(simulator.simulate(100, num_opponents=3), 25)
+        self.assertRaises(ValueError, simulator.simulate, 10, -1, HandScore(), 23)
+
     def test_min_hand(self):
         """Verifies that the minimum score filter works"""
         ace = Card(C.ACE, C.HEARTS)
@@ -63,7 +180,7 @@ class HandSimulatorTest(unittest.TestCase):
         seven = Card(7, C.HEARTS)
 
         cards = [ace, king, three, two]
-        hand = Hand(king, seven)
+        hand = Hand(Card(C.KING, C.CLUBS), seven)
         simulator = HandSimulator(hand, cards)
 
         # KK should win pretty often
@@ -72,3 +189,15 @@ class HandSimulatorTest(unittest.TestCase):
         min_hand = HandScore(C.TRIPS)
         # but not against other trips
         self.assertLess(simulator.simulate(100, min_hand=min_hand), 5)
+
+    def test_deadline(self):
+        """The simulation stops early once the deadline has passed"""
+        hand = Hand(Card(C.ACE, C.SPADES), Card(C.ACE, C.HEARTS))
+        simulator = HandSimulator(hand)
+        simulator.simulate(100, deadline=Deadline(5))
+        self.assertEqual(simulator.last_tries, 100)
+
+        equity = simulator.simulate(100000, deadline=Deadline(0))
+        self.assertLess(simulator.last_tries, 100000)
+        self.assertGreater(simulator.last_tries, 0)
+        self.assertGreater(equity, 50)
@@ -1,4 +1,9 @@
 import unittest
+import itertools
+import random
+
+import numpy as np
+
 from pokeher.cards import *
 import pokeher.constants as C
 from pokeher.handscore import *
@@ -206,6 +211,62 @@ class HandFinderTest(unittest.TestCase):
             self.assertTrue(card in best_hand, "card missing from the answer")
 
 
+class HandStrengthTest(unittest.TestCase):
+    """Checks the rank-table evaluator against the HandBuilder scores"""
+    def brute_force(self, hand):
+        scores = [HandBuilder(list(five)).score_hand()
+                  for five in itertools.combinations(hand, 5)]
+        return max(scores)
+
+    def test_matches_hand_builder(self):
+        deck = full_deck()
+        for size in [5, 6, 7]:
+            for _ in range(300):
+                hand = random.sample(deck, size)
+                best = self.brute_force(hand)
+                strength = hand_strength(hand)
+                self.assertEqual(strength, best.strength())
+                self.assertEqual(HandScore.from_strength(strength), best)
+
+    def test_combo_strengths(self):
+        """Scores runs of combinations by colex number"""
+        for size, start in [(5, 0), (6, 5000), (7, 133784000)]:
+            strengths = np.empty(500, dtype=np.int32)
+            combo_strengths(start, size, strengths)
+            for i in range(500):
+                hand = from_indexes(colex_indexes(start + i, size))
+                self.assertEqual(strengths[i], hand_strength(hand))
+        self.assertRaises(ValueError, combo_strengths, 133784100, 7, strengths)
+        self.assertRaises(ValueError, combo_strengths, 0, 4, strengths)
+
+    def test_ordering(self):
+        """Stronger hands get bigger numbers"""
+        two_pair = [Card(2, C.DIAMONDS), Card(2, C.SPADES), Card(5, C.HEARTS),
+                    Card(5, C.SPADES), Card(C.ACE, C.HEARTS)]
+        wheel = [Card(C.ACE, C.SPADES), Card(2, C.SPADES), Card(3, C.CLUBS),
+                 Card(4, C.SPADES), Card(5, C.SPADES)]
+        six_high = wheel[1:] + [Card(6, C.HEARTS)]
+        self.assertTrue(hand_strength(two_pair) < hand_strength(wheel))
+        self.assertTrue(hand_strength(wheel) < hand_strength(six_high))
+        self.assertEqual(HandScore.from_strength(hand_strength(wheel)).kicker,
+                         (5, 4, 3, 2, 14))
+
+    def test_too_few_cards(self):
+        self.assertEqual(hand_strength([Card(2, C.DIAMONDS)]), C.NO_SCORE)
+        self.assertEqual(HandScore.from_strength(C.NO_SCORE), HandScore())
+
+    def test_partial_score_strength(self):
+        """Short kickers still order the same way as the HandScores"""
+        pair = HandScore(C.PAIR)
+        pair.kicker = (C.QUEEN, C.QUEEN, 2)
+        fear = HandScore(C.PAIR)
+        fear.kicker = tuple([None] * 5)
+        full = HandScore(C.PAIR)
+        full.kicker = (C.QUEEN, C.QUEEN, 2, 2, 2)
+        self.assertTrue(fear.strength() < pair.strength() <= full.strength())
+        self.assertEqual(HandScore().strength(), C.NO_SCORE)
+
+
 class TableCardHandTests(unittest.TestCase):
     def test_pair(self):
         pair_twos = [
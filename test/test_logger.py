@@ -0,0 +1,61 @@
+import threading
+import unittest
+
+import pokeher.logger as logger
+from pokeher.logger import BotLogger
+
+
+class BotLoggerTest(unittest.TestCase):
+    def setUp(self):
+        self.written = []
+
+    def test_levels(self):
+        log = BotLogger(self.written.extend, logger.INFO, background=False)
+        log.debug("not written {}", 1)
+        log.info("info {n}", n=2)
+        log.warning("warning")
+        log.error("{} {}", "error", 4)
+        self.assertEqual(self.written, ["info 2", "warning", "error 4"])
+        self.assertFalse(log.enabled(logger.DEBUG))
+        self.assertTrue(log.enabled(logger.ERROR))
+
+    def test_no_args_not_formatted(self):
+        log = BotLogger(self.written.extend, background=False)
+        log.info("{braces} stay")
+        self.assertEqual(self.written, ["{braces} stay"])
+
+    def test_nowhere_to_write(self):
+        log = BotLogger(None)
+        self.assertFalse(log.enabled(logger.ERROR))
+        log.error("dropped {}", 1)
+        log.flush()
+
+    def test_background(self):
+        log = BotLogger(self.written.extend)
+        for i in range(100):
+            log.info("line {}", i)
+        log.flush()
+        self.assertEqual(self.written, ["line {}".format(i) for i in range(100)])
+
+    def test_bounded(self):
+        """When the writer falls behind, lines past MAX_PENDING are dropped"""
+        release = threading.Event()
+
+        def slow_write(lines):
+            release.wait()
+            self.written.extend(lines)
+
+        log = BotLogger(slow_write)
+        log.MAX_PENDING = 5
+        log.info("first")
+        # wait for the writer to be stuck on the first line
+        while log.pending:
+            pass
+        for i in range(10):
+            log.info("line {}", i)
+        self.assertEqual(len(log.pending), 5)
+        release.set()
+        log.flush()
+        self.assertEqual(self.written, ["first"] +
+                         ["line {}".format(i) for i in range(5)] +
+                         ["dropped 5 log lines"])
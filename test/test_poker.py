@@ -112,7 +112,7 @@ class ShowdownTest(unittest.TestCase):
     def test_split_pot(self):
         bot_hands = {
             'qj1': [cards.Card(C.QUEEN, C.HEARTS), cards.Card(C.JACK, C.SPADES)],
-            'qj2': [cards.Card(C.QUEEN, C.CLUBS), cards.Card(C.JACK, C.HEARTS)],
+            'qj2': [cards.Card(C.QUEEN, C.DIAMONDS), cards.Card(C.JACK, C.HEARTS)],
         }
         table = [cards.Card(4, 1), cards.Card(C.KING, 2), cards.Card(3, 2),
                  cards.Card(C.QUEEN, 0), cards.Card(9, 0)]
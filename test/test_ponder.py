@@ -0,0 +1,161 @@
+import time
+import unittest
+
+import pokeher.constants as C
+from pokeher.cards import Card, Hand
+from pokeher.handscore import HandScore
+from pokeher.ponder import Ponderer, Situation
+from test_brain import BrainTestBot, MockBot, MockData, SingleProcessBrain
+
+
+def wait_for(condition, timeout=5):
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class PondererTest(unittest.TestCase):
+    hand = Hand(Card(C.ACE, C.SPADES), Card(C.ACE, C.HEARTS))
+    flop = [Card(2, C.CLUBS), Card(7, C.DIAMONDS), Card(C.KING, C.SPADES)]
+
+    def setUp(self):
+        self.ponderer = Ponderer({})
+
+    def tearDown(self):
+        self.ponderer.stop()
+
+    def situation(self, hand_filter=-1, tries=3000):
+        return Situation(self.hand, self.flop, hand_filter, HandScore(),
+                         tries=tries)
+
+    def planned_tries(self, situation):
+        with self.ponderer.condition:
+            return sum(tries for _, tries in
+                       self.ponderer.results.get(situation.key, []))
+
+    def test_plan_and_take(self):
+        situation = self.situation()
+        self.ponderer.plan([situation])
+        self.assertTrue(wait_for(lambda: self.planned_tries(situation) >= 3000))
+
+        chunks = self.ponderer.take(self.hand, self.flop, -1, HandScore())
+        self.assertEqual(sum(tries for _, tries in chunks), 3000)
+        for equity, _ in chunks:
+            self.assertTrue(70 < equity <= 100)
+        # taken situations are done with
+        self.assertEqual(self.ponderer.take(self.hand, self.flop, -1,
+                                            HandScore()), [])
+
+    def test_replan(self):
+        """Results for situations that aren't planned anymore get dropped"""
+        first, second = self.situation(), self.situation(hand_filter=50)
+        self.ponderer.plan([first, second])
+        self.assertTrue(wait_for(lambda: self.planned_tries(second) >= 3000))
+        self.ponderer.plan([second])
+        self.assertEqual(self.planned_tries(first), 0)
+        self.assertEqual(self.planned_tries(second), 3000)
+
+    def test_stop(self):
+        """Stopping drops the plan, planning again starts a new thread"""
+        situation = self.situation(tries=10 ** 9)
+        self.ponderer.plan([situation])
+        self.assertTrue(wait_for(lambda: self.planned_tries(situation)))
+        thread = self.ponderer.thread
+        self.ponderer.stop()
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.planned_tries(situation), 0)
+
+        self.ponderer.plan([situation])
+        self.assertTrue(wait_for(lambda: self.planned_tries(situation)))
+
+    def test_paused(self):
+        situation = self.situation(tries=10 ** 9)
+        with self.ponderer.paused():
+            self.ponderer.plan([situation])
+            time.sleep(0.05)
+            # at most the chunk that was already going
+            self.assertTrue(self.planned_tries(situation) <= Ponderer.CHUNK_SIZE)
+        self.assertTrue(wait_for(lambda: self.planned_tries(situation) > 5000))
+
+
+class BrainPonderTest(unittest.TestCase):
+    def brain(self, data):
+        brain = SingleProcessBrain(MockBot())
+        self.addCleanup(brain.close)
+        brain.data = data
+        brain.log = lambda msg: None
+        return brain
+
+    def test_likely_situations(self):
+        """Heads up on the flop with no cache, one situation per fear"""
+        data = MockData()
+        data.table_cards = [Card(2, C.CLUBS), Card(7, C.DIAMONDS),
+                            Card(C.KING, C.SPADES)]
+        brain = self.brain(data)
+        situations = brain.likely_situations()
+        self.assertEqual(len(situations), len(brain.likely_fears()))
+        hand_filter, hand_fear = brain.likely_fears()[0]
+        self.assertEqual(situations[0].hand_filter, hand_filter)
+        self.assertEqual(situations[0].min_hand, hand_fear)
+
+        # heads up preflop only simulates without the matchups table, and
+        # then only after a raise
+        data.table_cards = []
+        brain.preflop_matchups.loaded = lambda: True
+        self.assertEqual(brain.likely_situations(), [])
+        brain.preflop_matchups.loaded = lambda: False
+        self.assertEqual([s.hand_filter for s in brain.likely_situations()],
+                         [hand_filter for hand_filter, _
+                          in brain.likely_fears() if hand_filter != -1])
+
+        # heads up on the turn never simulates
+        data.table_cards = [Card(2, C.CLUBS), Card(7, C.DIAMONDS),
+                            Card(C.KING, C.SPADES), Card(9, C.HEARTS)]
+        self.assertEqual(brain.likely_situations(), [])
+
+    def test_multiway_next_cards(self):
+        data = MockData()
+        data.opponents = ['bot_1', 'bot_2']
+        data.table_cards = [Card(2, C.CLUBS), Card(7, C.DIAMONDS),
+                            Card(C.KING, C.SPADES), Card(9, C.HEARTS)]
+        brain = self.brain(data)
+        situations = brain.likely_situations()
+        next_cards = [s for s in situations if len(s.table_cards) == 5]
+        self.assertEqual(len(next_cards), 46)
+        self.assertEqual(len(situations) - 46, len(brain.likely_fears()))
+
+    def test_ponders_between_lines(self):
+        """The flop gets simulated before we're asked to act"""
+        lines = ['Settings your_bot bot_0',
+                 'bot_0 hand [Ac,As]',
+                 'Match table [2d,7h,Kc]']
+        bot = BrainTestBot(lines, [], [])
+        bot.run()
+        brain = bot.brain
+        self.assertTrue(brain.planned)
+        hand_filter, hand_fear = brain.likely_fears()[0]
+        key = Situation(brain.data.hand, brain.data.table_cards, hand_filter,
+                        hand_fear).key
+        try:
+            # take() gives up on the situation, so wait before asking
+            self.assertTrue(wait_for(lambda: key in brain.ponderer.results))
+            self.assertTrue(brain.ponderer.take(
+                brain.data.hand, brain.data.table_cards, hand_filter,
+                hand_fear))
+        finally:
+            brain.close()
+
+    def test_stops_after_the_hand(self):
+        """Nothing gets simulated in between hands"""
+        lines = ['Settings your_bot bot_0',
+                 'bot_0 hand [Ac,As]',
+                 'Match table [2d,7h,Kc]',
+                 'bot_0 wins 40']
+        bot = BrainTestBot(lines, [], [])
+        self.addCleanup(bot.brain.close)
+        bot.run()
+        self.assertFalse(bot.brain.ponderer.thread)
+        self.assertFalse(bot.brain.planned)
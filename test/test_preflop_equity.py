@@ -0,0 +1,100 @@
+import cPickle as pickle
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from pokeher.cards import Card, Hand
+from pokeher.preflop_equity import (PreflopEquity, PreflopMatchups,
+                                    canonical_hands)
+import pokeher.constants as C
+
+
+class CanonicalHandsTest(unittest.TestCase):
+    def test_canonical_hands(self):
+        """Every preflop hand shows up once"""
+        simple = [hand.simple() for hand in canonical_hands()]
+        self.assertEqual(len(simple), 169)
+        self.assertEqual(len(set(simple)), 169)
+        self.assertEqual(sum(PreflopMatchups.COMBOS), 1326)
+
+
+class PreflopEquityTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_table(self):
+        wins = dict((simple, i / 2.0)
+                    for i, simple in enumerate(PreflopMatchups.HANDS))
+        with open(os.path.join(self.tmp_dir, 'wins.table'), 'wb') as out:
+            PreflopEquity.write(out, wins)
+        equity = PreflopEquity(os.path.join(self.tmp_dir, 'wins.table'),
+                               log_func=lambda x: None)
+        self.assertEqual(equity.data, wins)
+
+    def test_pickle_fallback(self):
+        wins = {"1414u": 85.2, "32u": 31.1}
+        with open(os.path.join(self.tmp_dir, 'wins.pickle'), 'wb') as out:
+            pickle.dump(wins, out)
+        equity = PreflopEquity(os.path.join(self.tmp_dir, 'wins.table'),
+                               log_func=lambda x: None)
+        self.assertEqual(equity.data, wins)
+
+
+class PreflopMatchupsTest(unittest.TestCase):
+    """Round trips a made up matrix"""
+    aces = Hand(Card(C.ACE, C.SPADES), Card(C.ACE, C.HEARTS))
+    kings = Hand(Card(C.KING, C.CLUBS), Card(C.KING, C.DIAMONDS))
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.matrix_file = os.path.join(self.tmp_dir, 'matchups.matrix')
+        size = len(PreflopMatchups.HANDS)
+        equities = np.tile(np.arange(size, dtype=np.float32), (size, 1))
+        with open(self.matrix_file, 'wb') as out:
+            PreflopMatchups.write(out, equities)
+        self.matchups = PreflopMatchups(self.matrix_file, log_func=lambda x: None)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_matchup(self):
+        self.assertTrue(self.matchups.loaded())
+        kings_index = PreflopMatchups.INDEX[self.kings.simple()]
+        self.assertEqual(self.matchups.matchup(self.aces, self.kings),
+                         kings_index)
+
+    def test_range_equity(self):
+        """A weighted average over the combos in the range"""
+        weights = np.zeros(169)
+        self.assertEqual(self.matchups.range_equity(self.aces, weights), 0)
+
+        kings_index = PreflopMatchups.INDEX[self.kings.simple()]
+        weights[kings_index] = 1
+        self.assertAlmostEqual(self.matchups.range_equity(self.aces, weights),
+                               kings_index)
+
+        # 6 combos of kings vs 4 of ace-king suited
+        aks = PreflopMatchups.INDEX["1413s"]
+        weights[aks] = 1
+        self.assertAlmostEqual(self.matchups.range_equity(self.aces, weights),
+                               (6 * kings_index + 4 * aks) / 10.0)
+
+    def test_filter_weights(self):
+        preflop_equity = {"1414u": 85, "1413s": 67, "32u": 31}
+        weights = PreflopMatchups.filter_weights(preflop_equity, 60)
+        self.assertEqual(weights.sum(), 2)
+        self.assertEqual(PreflopMatchups.filter_weights(preflop_equity, -1).sum(),
+                         169)
+
+    def test_missing_file(self):
+        logs = []
+        matchups = PreflopMatchups(os.path.join(self.tmp_dir, 'nope'),
+                                   log_func=logs.append)
+        self.assertFalse(matchups.loaded())
+        self.assertTrue(logs)
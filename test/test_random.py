@@ -49,3 +49,46 @@ class RandomTest(unittest.TestCase):
 
             for p, count in counts.iteritems():
                 self.assertEqual(count, 1, "saw duplicates from sample")
+
+    def test_randint_bounds(self):
+        """Both ends are included, like Python's random.randint"""
+        saw = set(random.randint(3, 5) for _ in range(300))
+        self.assertEqual(saw, set([3, 4, 5]))
+        self.assertEqual(random.randint(7, 7), 7)
+        self.assertRaises(ValueError, random.randint, 5, 4)
+
+
+class RandomStreamTest(unittest.TestCase):
+    """Tests seeding & splitting up the random streams"""
+    def draws(self, rng, count=20):
+        return [rng.randint(0, 10 ** 6) for _ in range(count)]
+
+    def test_seeded(self):
+        self.assertEqual(self.draws(random.Random(42)),
+                         self.draws(random.Random(42)))
+        self.assertNotEqual(self.draws(random.Random(42)),
+                            self.draws(random.Random(43)))
+
+        rng = random.Random(1)
+        first = self.draws(rng)
+        rng.seed(1)
+        self.assertEqual(self.draws(rng), first)
+
+    def test_module_seed(self):
+        random.seed(99)
+        first = random.sample(range(50), 10)
+        random.seed(99)
+        self.assertEqual(random.sample(range(50), 10), first)
+
+    def test_jump(self):
+        """Jumped streams don't line up with the stream they came from"""
+        rng, jumped = random.Random(5), random.Random(5)
+        jumped.jump()
+        first = self.draws(rng, 100)
+        self.assertNotEqual(first, self.draws(jumped, 100))
+
+    def test_uniform_spread(self):
+        rng = random.Random(7)
+        draws = [rng.uniform(0, 1) for _ in range(10000)]
+        self.assertTrue(all(0 <= d <= 1 for d in draws))
+        self.assertAlmostEqual(sum(draws) / len(draws), 0.5, delta=0.02)
@@ -0,0 +1,61 @@
+import unittest
+
+from pokeher.clock import Deadline, monotonic
+from pokeher.simulator_pool import SimulatorPool
+from pokeher.handscore import HandScore
+from pokeher.cards import Card, Hand
+import pokeher.constants as C
+from pokeher.timer import Timer
+
+
+class SimulatorPoolTest(unittest.TestCase):
+    """Runs simulations in worker processes"""
+    def setUp(self):
+        self.pool = SimulatorPool({}, processes=2)
+
+    def tearDown(self):
+        self.pool.close()
+
+    def test_royal_flush(self):
+        hand = Hand(Card(C.ACE, C.SPADES), Card(C.KING, C.SPADES))
+        table_cards = [Card(C.QUEEN, C.SPADES), Card(C.JACK, C.SPADES),
+                       Card(10, C.SPADES)]
+        equity, tries = self.pool.simulate(hand, table_cards, 2000, -1,
+                                           HandScore(), Deadline(5),
+                                           step_size=100)
+        self.assertEqual(equity, 100)
+        self.assertEqual(tries, 2000)
+
+        equity, _ = self.pool.simulate(hand, table_cards, 200, -1, HandScore(),
+                                       Deadline(5), step_size=100,
+                                       num_opponents=3)
+        self.assertEqual(equity, 100)
+
+    def test_min_hand(self):
+        hand = Hand(Card(C.KING, C.CLUBS), Card(7, C.HEARTS))
+        table_cards = [Card(C.ACE, C.HEARTS), Card(C.KING, C.SPADES),
+                       Card(3, C.HEARTS)]
+        equity, _ = self.pool.simulate(hand, table_cards, 1000, -1,
+                                       HandScore(), Deadline(1))
+        self.assertGreater(equity, 50)
+        equity, _ = self.pool.simulate(hand, table_cards, 1000, -1,
+                                       HandScore(C.TRIPS), Deadline(1))
+        self.assertLess(equity, 20)
+
+    def test_deadline(self):
+        """Stops early when out of time"""
+        hand = Hand(Card(10, C.SPADES), Card(3, C.SPADES))
+        equity, tries = self.pool.simulate(hand, [], 10 ** 9, -1, HandScore(),
+                                           Deadline(0.05), step_size=100)
+        self.assertTrue(0 < tries < 10 ** 9)
+        self.assertTrue(0 < equity < 100)
+
+    def test_late_results(self):
+        """Past the deadline, late workers share one grace period rather
+        than getting one each"""
+        hand = Hand(Card(10, C.SPADES), Card(3, C.SPADES))
+        passed = Deadline.at(monotonic() - 1)
+        with Timer() as t:
+            self.pool.simulate_chunks(hand, [], 10 ** 9, -1, HandScore(),
+                                      passed)
+        self.assertLess(t.secs, SimulatorPool.RESULT_GRACE_SECS)
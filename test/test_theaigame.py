@@ -1,6 +1,7 @@
 import unittest
 from pokeher.theaigame import *
 import pokeher.cards as cards
+from pokeher.wiring import GameEvents
 
 
 class CardBuilderTest(unittest.TestCase):
@@ -65,9 +66,56 @@ class CardBuilderTest(unittest.TestCase):
         self.assertNotEqual(c, b.from_2char(c2.aigames_str()))
 
 
+    def test_parse_card_list(self):
+        """Anything that isn't a bracketed list of real cards is None"""
+        self.assertEqual(parse_card_list('[Ah]'), [Card(C.ACE, C.HEARTS)])
+        for token in ['[30]', '[Ah,]', 'Ah,Kd', '[Ah,Kd', '[]', '', None]:
+            self.assertEqual(parse_card_list(token), None, token)
+
+
+class DispatchTest(unittest.TestCase):
+    def test_route_precedence(self):
+        """(token, key) beats (token, None), which beats (None, key)"""
+        routes = build_routes({
+            ('Match', 'round'): lambda *words: 'round',
+            ('Match', None): lambda *words: 'match',
+            (None, 'round'): lambda *words: 'bot',
+        })
+        self.assertEqual(dispatch(routes, 'Match round 1'), 'round')
+        self.assertEqual(dispatch(routes, 'Match table [Ah,Kd,2c]'), 'match')
+        self.assertEqual(dispatch(routes, 'bot_0 round 1'), 'bot')
+        self.assertFalse(dispatch(routes, 'bot_0 table 1'))
+        self.assertFalse(dispatch(routes, '   '))
+
+    def test_delegate_order(self):
+        """Posting blinds only marks the bot as seated, like before"""
+        events = RecordingEvents()
+        parser = TheAiGameParserDelegate().set_up_parser(events, None)
+        self.assertTrue(parser.handle_line('bot_0 post 10'))
+        self.assertTrue(parser.handle_line('bot_1 stack 990'))
+        self.assertTrue(parser.handle_line('Match round 4'))
+        self.assertEqual(events.events, [('on_seat', 'bot_0'),
+                                         ('on_seat', 'bot_1'),
+                                         ('on_stack', 'bot_1', 990),
+                                         ('on_round', 4)])
+        # no turn callback, nobody handles the action
+        self.assertFalse(parser.handle_line('Action bot_0 500'))
+
+
+class RecordingEvents(GameEvents):
+    """Remembers every event, in order"""
+    def __init__(self):
+        self.events = []
+
+    def __getattribute__(self, name):
+        if name.startswith('on_'):
+            return lambda *args: self.events.append((name,) + args)
+        return object.__getattribute__(self, name)
+
+
 class SettingsParserTest(unittest.TestCase):
     def test_parse_settings(self):
-        """Tests that the beginning settings are passed to the data model"""
+        """Tests that the beginning settings are sent on as events"""
         lines = ['Settings gameType NLHE', # unused, TODO remove
                  'Settings gameMode tournament', # unused, TODO remove
                  'Settings time_bank 5000',
@@ -77,15 +125,18 @@ class SettingsParserTest(unittest.TestCase):
                  'bot_0 seat 0',
                  'bot_1 seat 1']
 
-        data = {}
-        parser = SettingsParser(data)
+        events = RecordingEvents()
+        parser = SettingsParser(events)
 
         for line in lines:
             handled = parser.handle_line(line)
             self.assertTrue(handled, "didn't handle '{}'".format(line))
 
-        self.assertEqual(data['your_bot'], 'bot_0')
-        self.assertEqual(data['time_per_move'], '500')
+        self.assertEqual(events.events, [('on_time_bank', 5000),
+                                         ('on_time_per_move', 500),
+                                         ('on_your_bot', 'bot_0'),
+                                         ('on_seat', 'bot_0'),
+                                         ('on_seat', 'bot_1')])
 
 
 class RoundParserTest(unittest.TestCase):
@@ -94,17 +145,20 @@ class RoundParserTest(unittest.TestCase):
         lines = ['Match round 1',
                  'Match small_blind 10',
                  'Match big_blind 20',
-                 'Match on_button bot_0']
+                 'Match on_button bot_0',
+                 'Match big_blind BIG']
 
-        data = {}
-        parser = RoundParser(data)
+        events = RecordingEvents()
+        parser = RoundParser(events)
 
         for line in lines:
             self.assertTrue(parser.handle_line(line))
 
-        self.assertEqual(str(10), data['small_blind'])
-        self.assertEqual(str(20), data['big_blind'])
-        self.assertEqual('bot_0', data['on_button'])
+        # values that aren't numbers get dropped
+        self.assertEqual(events.events, [('on_round', 1),
+                                         ('on_small_blind', 10),
+                                         ('on_big_blind', 20),
+                                         ('on_button', 'bot_0')])
 
 
 class TurnParserTest(unittest.TestCase):
@@ -116,38 +170,49 @@ class TurnParserTest(unittest.TestCase):
                  'bot_0 hand [6c,Jc]',
                  'Action bot_0 5000',
                  'Match table [Tc,8d,9c]',
+                 'bot_1 raise 40',
                  'bot_1 fold 0',
                  'bot_0 wins 30',
                  'bot_1 check',
                  'bot_1 fold',
                  'Match sidepots [30]']
 
-        data = {}
+        events = RecordingEvents()
         self.goTime = 0
 
         def goCallback(bot, time):
             self.goTime = time
 
-        parser = TurnParser(data, goCallback)
+        parser = TurnParser(events, goCallback)
 
         for line in lines:
             self.assertTrue(parser.handle_line(line), 'didnt handle: "{}"'
                             .format(line))
 
-        self.assertEqual(data[('stack', 'bot_0')], '1000')
-        self.assertEqual(data[('stack', 'bot_1')], '392')
-        self.assertEqual(data['table'], [Card(10, C.CLUBS),
-                                         Card(8, C.DIAMONDS),
-                                         Card(9, C.CLUBS)])
-        self.assertEqual(data['pot'], str(20))
-        self.assertEqual(data[('hand', 'bot_0')], [Card(6, C.CLUBS),
-                                                   Card(C.JACK, C.CLUBS)])
         self.assertEqual(self.goTime, 5000)
-        self.assertEqual(data[('wins', 'bot_0')], str(30))
-        self.assertEqual(data['sidepots'], '[30]')
-
-        self.assertTrue(parser.handle_line("Match sidepots [99]"))
-        self.assertEqual(data['sidepots'], '[99]')
+        self.assertEqual(events.events, [
+            ('on_seat', 'bot_0'), ('on_stack', 'bot_0', 1000),
+            ('on_seat', 'bot_1'), ('on_stack', 'bot_1', 392),
+            ('on_pot', 20),
+            ('on_seat', 'bot_0'),
+            ('on_hand', 'bot_0', [Card(6, C.CLUBS), Card(C.JACK, C.CLUBS)]),
+            ('on_table', [Card(10, C.CLUBS), Card(8, C.DIAMONDS),
+                          Card(9, C.CLUBS)]),
+            ('on_seat', 'bot_1'), ('on_bet', 'bot_1', 40),
+            ('on_fold', 'bot_1'),
+            ('on_seat', 'bot_0'), ('on_round_over', 'bot_0', 30),
+            ('on_seat', 'bot_1'),
+            ('on_fold', 'bot_1'),
+        ])
+
+    def test_bad_values(self):
+        """Lines with values we can't read still count as handled"""
+        events = RecordingEvents()
+        parser = TurnParser(events, None)
+        for line in ['bot_0 hand [6c,Jx]', 'Match table 9c',
+                     'Match amount_to_call SIDEPOTS']:
+            self.assertTrue(parser.handle_line(line))
+        self.assertEqual(events.events, [('on_seat', 'bot_0')])
 
 
 class MockTalker(object):
@@ -1,9 +1,9 @@
 import unittest
+import pokeher.logger as logger
 from pokeher.theaigame_bot import TheAiGameBot
 
 class QuietBot(TheAiGameBot):
-    def log(self, msg):
-        pass
+    LOG_LEVEL = logger.OFF
 
 class TheAiGameBotTest(unittest.TestCase):
     """Test that the bot class is instantiated properly and has all the methods
@@ -0,0 +1,72 @@
+from __future__ import division
+
+import unittest
+
+import pokeher.constants as C
+from pokeher.cards import Card
+from pokeher.time_bank import TimeBank
+from test_brain import MockData
+
+
+class Allocator(TimeBank):
+    def __init__(self):
+        self.data = MockData()
+
+
+class TimeBankTest(unittest.TestCase):
+    def setUp(self):
+        self.allocator = Allocator()
+        self.data = self.allocator.data
+        self.flop = [Card(C.ACE, C.SPADES), Card(2, C.DIAMONDS),
+                     Card(7, C.SPADES)]
+
+    def test_weights(self):
+        """Blinds preflop are worth little, a big river pot a lot"""
+        blinds = self.allocator.turn_weight()
+        self.data.table_cards = self.flop
+        flop = self.allocator.turn_weight()
+        self.data.table_cards = self.flop + [Card(3, C.CLUBS), Card(4, C.CLUBS)]
+        self.data.pot = 2000
+        self.data.to_call = 1000
+        river = self.allocator.turn_weight()
+        self.assertTrue(TimeBank.MIN_WEIGHT <= blinds < flop < 1 < river)
+        self.assertAlmostEqual(river, 1.5 * (0.5 + 1.5 * 3 / 4))
+
+    def test_no_stack(self):
+        self.data.stacks = {}
+        self.data.pot = 0
+        self.assertEqual(self.allocator.turn_weight(), TimeBank.MIN_WEIGHT)
+
+    def test_spends_the_bank(self):
+        """A big decision can spend more than time_per_move"""
+        self.data.table_cards = self.flop
+        self.data.pot = 2000
+        self.data.to_call = 1000
+        budget = self.allocator.allocate_time(5000)
+        self.assertGreater(budget.ms, 500)
+        self.assertGreater(budget.close_call_ms, budget.ms)
+        self.assertFalse(budget.deadline.passed())
+
+    def test_reserve(self):
+        """The bank only gets spent down to the reserve, but a move's own
+        time is always there"""
+        self.data.table_cards = self.flop
+        self.data.pot = 2000
+        self.data.to_call = 1000
+        budget = self.allocator.allocate_time(1200)
+        self.assertEqual(budget.close_call_ms, 500 - TimeBank.DEADLINE_MARGIN_MS)
+
+        budget = self.allocator.allocate_time(200)
+        self.assertEqual(budget.ms, 200 - TimeBank.DEADLINE_MARGIN_MS)
+        self.assertEqual(budget.close_call_ms, budget.ms)
+
+        budget = self.allocator.allocate_time(10)
+        self.assertEqual(budget.ms, 0)
+        self.assertTrue(budget.close_call_deadline.passed())
+
+    def test_full_bank(self):
+        """Close calls can use whatever the next refill would overflow"""
+        self.data.time_bank = 4000
+        budget = self.allocator.allocate_time(5000)
+        self.assertLess(budget.ms, 250)
+        self.assertEqual(budget.close_call_ms, 1500)
@@ -0,0 +1,110 @@
+import errno
+import os
+import select
+import threading
+import unittest
+from StringIO import StringIO
+
+from pokeher.wiring import IOPokerBot
+
+
+class RecordingBrain(object):
+    def __init__(self, bot):
+        self.bot = bot
+        self.lines = []
+        self.closed = False
+
+    def parse_line(self, line):
+        self.lines.append(line)
+
+    def close(self):
+        self.closed = True
+
+
+class PipeBot(IOPokerBot):
+    def add_brain(self):
+        self.brain = RecordingBrain(self)
+
+
+class FlushCounter(StringIO):
+    flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+
+
+class IOPokerBotTest(unittest.TestCase):
+    def setUp(self):
+        self.read_fd, self.write_fd = os.pipe()
+        self.input = os.fdopen(self.read_fd, 'r')
+        self.log = FlushCounter()
+        self.bot = PipeBot(self.input, None, self.log)
+
+    def tearDown(self):
+        self.input.close()
+
+    def run_bot(self):
+        thread = threading.Thread(target=self.bot.run)
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def test_reads_until_eof(self):
+        """Partial lines wait for the rest, the loop ends on EOF"""
+        thread = self.run_bot()
+        os.write(self.write_fd, 'Settings your_bot bot_0\nMatch ')
+        os.write(self.write_fd, 'round 1\r\nlast line')
+        os.close(self.write_fd)
+        thread.join(1)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(self.bot.brain.lines, ['Settings your_bot bot_0',
+                                                'Match round 1', 'last line'])
+        # the match is over
+        self.assertTrue(self.bot.brain.closed)
+
+    def test_interrupted_wait(self):
+        """A signal interrupting select doesn't end the match"""
+        real_select = select.select
+        interrupts = []
+
+        def interrupted(*args):
+            if not interrupts:
+                interrupts.append(args)
+                raise select.error(errno.EINTR, 'Interrupted system call')
+            return real_select(*args)
+        select.select = interrupted
+        self.addCleanup(setattr, select, 'select', real_select)
+
+        os.write(self.write_fd, 'Match round 1\n')
+        os.close(self.write_fd)
+        self.bot.run()
+        self.assertTrue(interrupts)
+        self.assertEqual(self.bot.brain.lines, ['Match round 1'])
+
+    def test_log_flushed(self):
+        """Logging is written in the background, run() waits for it"""
+        self.bot.log("hello {}", "world")
+        self.bot.debug("debug")
+        os.close(self.write_fd)
+        self.bot.run()
+        self.assertEqual(self.log.getvalue(), "hello world\ndebug\n")
+        self.assertTrue(self.log.flushes >= 1)
+
+    def test_no_logging(self):
+        """Nothing gets formatted or written"""
+        class Unformattable(object):
+            def __format__(self, spec):
+                raise AssertionError("formatted a disabled message")
+
+        self.bot.no_logging = True
+        self.bot.log("{}", Unformattable())
+        self.bot.flush_log()
+        self.assertEqual(self.log.getvalue(), "")
+        self.bot.no_logging = False
+        self.assertFalse(self.bot.no_logging)
+
+    def test_file_like_input(self):
+        """Input without a file descriptor gets read line by line"""
+        bot = PipeBot(StringIO('a\nb\n'), None, None)
+        bot.run()
+        self.assertEqual(bot.brain.lines, ['a', 'b'])